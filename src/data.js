@@ -203,6 +203,72 @@ const CREATURES = {
     }
 };
 
+/**
+ * Encounter tables for every habitat: the creatures that can still appear
+ * there, in CREATURES order, with cumulative probabilities. Each creature
+ * gets the chance it had when every creature was rolled in turn (its rate
+ * times the chance no earlier one hit), so a single roll is equivalent
+ * @param {Set} discovered - Creature IDs already found (never encountered again)
+ * @param {Set} abilities - Player abilities, for requiresAbility
+ * @param {number} rateMultiplier - Scales every encounterRate (the golden net doubles them)
+ * @returns {Object} terrain -> { creatureIds, cumulative }; habitats with no
+ *     possible encounter are left out
+ */
+function buildEncounterTables(creatures, discovered, abilities, rateMultiplier = 1) {
+    const tables = {};
+
+    for (const [creatureId, creature] of Object.entries(creatures)) {
+        if (discovered.has(creatureId)) continue;
+        if (creature.requiresAbility && !abilities.has(creature.requiresAbility)) continue;
+
+        for (const terrain of creature.habitats) {
+            const table = tables[terrain] || (tables[terrain] = { creatureIds: [], chances: [], miss: 1 });
+            const rate = Math.min(1, creature.encounterRate * rateMultiplier);
+            table.creatureIds.push(creatureId);
+            table.chances.push(table.miss * rate);
+            table.miss *= 1 - rate;
+        }
+    }
+
+    for (const [terrain, table] of Object.entries(tables)) {
+        const cumulative = new Float64Array(table.chances.length);
+        let total = 0;
+        table.chances.forEach((chance, i) => {
+            total += chance;
+            cumulative[i] = total;
+        });
+        tables[terrain] = { creatureIds: table.creatureIds, cumulative };
+    }
+    return tables;
+}
+
+/**
+ * The creature a roll in [0, 1) encounters from a table, or null for none
+ */
+function rollEncounter(table, roll) {
+    const cumulative = table.cumulative;
+    for (let i = 0; i < cumulative.length; i++) {
+        if (roll < cumulative[i]) return table.creatureIds[i];
+    }
+    return null;
+}
+
+/**
+ * Deterministic stand-in for Math.random (mulberry32): the same seed gives
+ * the same sequence, so encounter runs can be replayed
+ * @returns {function(): number} Returns floats in [0, 1)
+ */
+function createSeededRandom(seed) {
+    let state = seed >>> 0;
+    return () => {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
 // Quest Step Handler Registry - Pluggable handlers for different step types
 const QUEST_STEP_HANDLERS = {
     'visit_location': {
@@ -214,36 +280,24 @@ const QUEST_STEP_HANDLERS = {
             game.state = GameState.EXPLORING;
         },
 
-        // Called each frame while step is active
-        onUpdate: (game, step) => {
-            // Check if player is within radius of objective
-            const dx = game.player.x - step.location.x;
-            const dy = game.player.y - step.location.y;
-            const distance = Math.sqrt(dx * dx + dy * dy);
-
-            if (distance <= step.radius) {
-                // Player reached objective!
-                return {
-                    completed: true,
-                    message: step.onArrive.message,
-                    choices: [
-                        {
-                            text: "Continue Quest",
-                            action: () => game.advanceQuestStep()
-                        },
-                        {
-                            text: "Abandon Quest",
-                            action: () => {
-                                game.activeQuest = null;
-                                game.questObjective = null;
-                                game.showDialog("Quest abandoned.");
-                            }
-                        }
-                    ]
-                };
-            }
-            return { completed: false };
-        },
+        // Called when the player enters the step's zone; the dialogue to show
+        onArrive: (game, step) => ({
+            message: step.onArrive.message,
+            choices: [
+                {
+                    text: "Continue Quest",
+                    action: () => game.advanceQuestStep()
+                },
+                {
+                    text: "Abandon Quest",
+                    action: () => {
+                        game.activeQuest = null;
+                        game.questObjective = null;
+                        game.showDialog("Quest abandoned.");
+                    }
+                }
+            ]
+        }),
 
         // Called when rendering (for markers, etc.)
         onRender: (game, step) => {
@@ -271,7 +325,24 @@ const QUEST_STEP_HANDLERS = {
             game.ctx.arc(x, y, step.radius * tileSize, 0, Math.PI * 2);
             game.ctx.stroke();
             game.ctx.restore();
-        }
+        },
+
+        // Area onRender draws in, so only it is repainted while the marker pulses
+        renderBounds: (game, step) => {
+            const tileSize = game.map.tileSize;
+            const reach = Math.max(step.radius, 1) * tileSize + 4;  // circle or marker text, plus line width
+            return {
+                x: (step.location.x + 0.5) * tileSize - reach,
+                y: (step.location.y + 0.5) * tileSize - reach,
+                w: reach * 2,
+                h: reach * 2
+            };
+        },
+
+        // Tiles within radius of the location, registered as the objective's
+        // trigger zone while the step is active; entering it runs onArrive
+        // (see QuestSystem.syncObjectiveZone)
+        zone: (game, step) => ({ x: step.location.x, y: step.location.y, radius: step.radius })
     },
 
     'problem': {
@@ -280,14 +351,10 @@ const QUEST_STEP_HANDLERS = {
             const stepNum = game.activeQuest.currentStep + 1;
             const totalSteps = quest.steps.length;
             // Use NPC name, not quest name
+            // Answers are handled by the dialogue choices (see submitQuestAnswer)
             game.showQuestProblem(step, game.activeQuest.npcName, stepNum, totalSteps);
         },
 
-        onUpdate: (game, step) => {
-            // Problems are handled by UI callbacks, not update loop
-            return { completed: false };
-        },
-
         onRender: (game, step) => {
             // No rendering needed for problems
         }
@@ -299,59 +366,45 @@ const QUEST_STEP_HANDLERS = {
             game.state = GameState.EXPLORING;
         },
 
-        onUpdate: (game, step) => {
-            // Check if player reached location
-            const dx = game.player.x - step.location.x;
-            const dy = game.player.y - step.location.y;
-            const distance = Math.sqrt(dx * dx + dy * dy);
-
-            if (distance <= step.radius) {
-                // Player arrived - show message and problem
-                const problem = step.onArrive.problem;
-                const choices = problem.answers.map(answer => ({
-                    text: String(answer),
-                    action: () => {
-                        if (answer === problem.correct) {
-                            // Correct! Advance to next step
-                            game.activeQuest.currentStep++;
-
-                            // Check if quest is complete
-                            if (game.activeQuest.currentStep >= game.activeQuest.quest.steps.length) {
-                                // Quest complete - show success message then complete
-                                game.questObjective = null;
-                                game.dialogue.queue({
-                                    text: "Correct! The records have been updated.",
-                                    trigger: 'quest_step_completed'  // This will complete the quest
-                                });
-                            } else {
-                                // More steps remaining - initialize next step
-                                const nextStep = game.activeQuest.quest.steps[game.activeQuest.currentStep];
-                                const handler = QUEST_STEP_HANDLERS[nextStep.type];
-
-                                // Show success message first
-                                game.dialogue.queue({
-                                    text: "Correct! The records have been updated."
-                                });
-
-                                // Initialize next step after dialogue closes
-                                if (handler && handler.onStart) {
-                                    handler.onStart(game, nextStep);
-                                }
-                            }
+        // Called when the player enters the step's zone: show the message and
+        // problem; the step stays active until the right answer is chosen
+        onArrive: (game, step) => {
+            const problem = step.onArrive.problem;
+            const choices = problem.answers.map(answer => ({
+                text: String(answer),
+                action: () => {
+                    if (answer === problem.correct) {
+                        // Correct! Advance to next step
+                        game.activeQuest.currentStep++;
+
+                        // Check if quest is complete
+                        if (game.activeQuest.currentStep >= game.activeQuest.quest.steps.length) {
+                            // Quest complete - show success message then complete
+                            game.questObjective = null;
+                            game.dialogue.queue({
+                                text: "Correct! The records have been updated.",
+                                trigger: 'quest_step_completed'  // This will complete the quest
+                            });
                         } else {
-                            // Wrong answer - don't advance step, player can try again
-                            game.showDialog("That's not quite right. Let me review the records again.");
+                            // More steps remaining - show success message first
+                            game.dialogue.queue({
+                                text: "Correct! The records have been updated."
+                            });
+
+                            // Then start the next step (and register its zone)
+                            game.advanceQuestStep();
                         }
+                    } else {
+                        // Wrong answer - don't advance step, player can try again
+                        game.showDialog("That's not quite right. Let me review the records again.");
                     }
-                }));
+                }
+            }));
 
-                return {
-                    completed: true,
-                    message: step.onArrive.message + "\n\n" + problem.question,
-                    choices: choices
-                };
-            }
-            return { completed: false };
+            return {
+                message: step.onArrive.message + "\n\n" + problem.question,
+                choices: choices
+            };
         },
 
         onRender: (game, step) => {
@@ -378,7 +431,11 @@ const QUEST_STEP_HANDLERS = {
             game.ctx.arc(x, y, step.radius * tileSize, 0, Math.PI * 2);
             game.ctx.stroke();
             game.ctx.restore();
-        }
+        },
+
+        renderBounds: (game, step) => QUEST_STEP_HANDLERS.visit_location.renderBounds(game, step),
+
+        zone: (game, step) => QUEST_STEP_HANDLERS.visit_location.zone(game, step)
     },
 
     'talk_to': {
@@ -388,10 +445,7 @@ const QUEST_STEP_HANDLERS = {
             game.state = GameState.EXPLORING;
         },
 
-        onUpdate: (game, step) => {
-            // Checked by interact() method when player talks to NPC
-            return { completed: false };
-        },
+        // Completion is checked by interact() when the player talks to the NPC
 
         onRender: (game, step) => {
             // Render indicator above target NPC
@@ -417,28 +471,23 @@ const QUEST_STEP_HANDLERS = {
             game.state = GameState.EXPLORING;
         },
 
-        onUpdate: (game, step) => {
-            // Check if player has the required item
-            if (game.inventory.has(step.itemId)) {
-                return {
-                    completed: true,
-                    message: step.onComplete.message,
-                    choices: [
-                        {
-                            text: "Continue",
-                            action: () => {
-                                // Remove item if consumable
-                                if (step.consumeItem) {
-                                    game.inventory.delete(step.itemId);
-                                }
-                                game.advanceQuestStep();
-                            }
+        // Called when the player has step.itemId, on starting the step or
+        // when the item is added later (see QuestSystem.itemAdded)
+        onItem: (game, step) => ({
+            message: step.onComplete.message,
+            choices: [
+                {
+                    text: "Continue",
+                    action: () => {
+                        // Remove item if consumable
+                        if (step.consumeItem) {
+                            game.inventory.delete(step.itemId);
                         }
-                    ]
-                };
-            }
-            return { completed: false };
-        },
+                        game.advanceQuestStep();
+                    }
+                }
+            ]
+        }),
 
         onRender: (game, step) => {
             // No special rendering for fetch quests
@@ -544,8 +593,10 @@ const QUESTS = {
 };
 
 // NPC dialogues - framework-based system
-// Each NPC has dialogue entries with conditions, text, and optional choices
-const NPCS = {
+// Each NPC has dialogue entries with the plot phase(s) they belong to, an
+// optional `when` condition checked within that phase, text, and optional
+// choices. The first entry listed for a phase whose `when` holds is shown
+const NPCS = compileDialogues({
     marlowe: {
         id: 'marlowe',
         name: 'Marlowe',
@@ -553,7 +604,7 @@ const NPCS = {
         type: 'dialogue_npc',
         dialogues: [
             {
-                condition: (game) => game.plotPhase === 'wake_up',
+                phase: 'wake_up',
                 text: [
                     { speaker: "Marlowe", text: "Morning. Sleep well?" },
                     { speaker: "Marlowe", text: "I heard something on the rocks last night. Sounded small... maybe hurt." },
@@ -568,13 +619,13 @@ const NPCS = {
                 }
             },
             {
-                condition: (game) => game.plotPhase === 'find_creature',
+                phase: 'find_creature',
                 text: "Find anything yet? Head west to the beach. Check near the rocks. Something's out there, I'm certain.",
                 repeatText: "Still searching? Check the beach, near the rocks.",
                 choices: null  // Just dismisses
             },
             {
-                condition: (game) => game.plotPhase === 'creature_found',
+                phase: 'creature_found',
                 text: (game) => {
                     // Get the creature's name from party
                     const starter = game.party.find(c => c.isStarter);
@@ -599,17 +650,17 @@ const NPCS = {
                 }
             },
             {
-                condition: (game) => game.plotPhase === 'meet_villager',
+                phase: 'meet_villager',
                 text: "The village is south and west. Look for Callum near the western clearing.",
                 repeatText: "Find Callum. He'll have work for you.",
                 choices: null
             },
             {
                 // HIGH PRIORITY: Check if all Callum's quests are complete
-                condition: (game) => {
+                phase: ['boat_quest', 'working'],
+                when: (game) => {
                     const callumsQuests = ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'];
-                    const allComplete = callumsQuests.every(q => game.completedQuests && game.completedQuests.has(q));
-                    return (game.plotPhase === 'boat_quest' || game.plotPhase === 'working') && allComplete;
+                    return callumsQuests.every(q => game.completedQuests && game.completedQuests.has(q));
                 },
                 text: [
                     { speaker: "Marlowe", text: "You finished Callum's work? I heard. He doesn't praise easily, so that means something." },
@@ -624,15 +675,16 @@ const NPCS = {
             },
             {
                 // Priority 1: If coins < 20, show "money's tight" message
-                condition: (game) => (game.plotPhase === 'boat_quest' || game.plotPhase === 'working') && (game.coins || 0) < 20,
+                phase: ['boat_quest', 'working'],
+                when: (game) => (game.coins || 0) < 20,
                 text: "How's the work going? Money's tight, I know. One job at a time.",
                 repeatText: "Keep working. The coin will come.",
                 choices: null
             },
             {
                 // Priority 2: If coins >= 20 AND planks >= 4, show "good progress" message
-                condition: (game) => (game.plotPhase === 'boat_quest' || game.plotPhase === 'working')
-                    && (game.coins || 0) >= 20
+                phase: ['boat_quest', 'working'],
+                when: (game) => (game.coins || 0) >= 20
                     && game.boatQuest && game.boatQuest.planks.collected >= 4,
                 text: "I heard you've been gathering driftwood. Good. That boat won't fix itself.",
                 repeatText: "Good progress on those planks.",
@@ -641,25 +693,25 @@ const NPCS = {
             {
                 // Priority 3: Catch-all for boat_quest/working when neither above applies
                 // This matches when: coins >= 20 AND planks < 4
-                condition: (game) => {
-                    const inWorkingPhase = game.plotPhase === 'boat_quest' || game.plotPhase === 'working';
+                phase: ['boat_quest', 'working'],
+                when: (game) => {
                     const coins = game.coins || 0;
                     const hasEnoughCoins = coins >= 20;
                     const notEnoughPlanks = !game.boatQuest || game.boatQuest.planks.collected < 4;
-                    return inWorkingPhase && hasEnoughCoins && notEnoughPlanks;
+                    return hasEnoughCoins && notEnoughPlanks;
                 },
                 text: "How's the work going? Callum's rough, but he's fair. Do good work and he'll pay honest.",
                 repeatText: "Keep at it. You're doing well.",
                 choices: null
             },
             {
-                condition: (game) => game.plotPhase === 'boat_ready',
+                phase: 'boat_ready',
                 text: "Storm's coming. I'd estimate three days, maybe four. Can you feel the pressure in the air? My ears tell me what my eyes can't.",
                 repeatText: "The storm's getting closer.",
                 choices: null
             },
             {
-                condition: (game) => game.plotPhase === 'departure',
+                phase: 'departure',
                 text: "Time to set sail. The storm approaches, but we're ready.",
                 repeatText: "Time to leave this island behind.",
                 choices: null
@@ -680,7 +732,7 @@ const NPCS = {
         type: 'dialogue_npc',
         dialogues: [
             {
-                condition: (game) => game.plotPhase === 'meet_villager',
+                phase: 'meet_villager',
                 text: [
                     { speaker: "Callum", text: "Marlowe sent you? Hm. You're smaller than I expected." },
                     { speaker: "You", text: "He said you might have work." },
@@ -698,18 +750,19 @@ const NPCS = {
                 }
             },
             {
-                condition: (game) => game.plotPhase === 'boat_quest' && !game.hasInspectedBoat,
+                phase: 'boat_quest',
+                when: (game) => !game.hasInspectedBoat,
                 text: "Go take a look at the boat first. It's on the western shore. You'll see what we're working with.",
                 repeatText: "Check the boat on the western shore.",
                 choices: null
             },
             {
-                condition: (game) => {
+                phase: ['boat_quest', 'working'],
+                when: (game) => {
                     // Only shown if player hasn't completed any of CALLUM's quests yet
                     const callumsQuests = ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'];
                     const completedCallumsQuests = callumsQuests.filter(q => game.completedQuests && game.completedQuests.has(q));
-                    return (game.plotPhase === 'boat_quest' || game.plotPhase === 'working')
-                        && game.hasInspectedBoat
+                    return game.hasInspectedBoat
                         && completedCallumsQuests.length === 0;
                 },
                 text: "You want work? I've got fish that need counting.",
@@ -727,12 +780,12 @@ const NPCS = {
                 ]
             },
             {
-                condition: (game) => {
+                phase: ['boat_quest', 'working'],
+                when: (game) => {
                     // Shown when player has completed ALL of Callum's quests
                     const callumsQuests = ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'];
                     const completedCallumsQuests = callumsQuests.filter(q => game.completedQuests && game.completedQuests.has(q));
-                    return (game.plotPhase === 'boat_quest' || game.plotPhase === 'working')
-                        && game.hasInspectedBoat
+                    return game.hasInspectedBoat
                         && completedCallumsQuests.length === callumsQuests.length;
                 },
                 text: "You've finished all my work. Not bad. Talk to Marlowe—he'll have the next steps for you.",
@@ -740,12 +793,12 @@ const NPCS = {
                 choices: null
             },
             {
-                condition: (game) => {
+                phase: ['boat_quest', 'working'],
+                when: (game) => {
                     // Shown if player HAS completed SOME (but not all) of Callum's quests
                     const callumsQuests = ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'];
                     const completedCallumsQuests = callumsQuests.filter(q => game.completedQuests && game.completedQuests.has(q));
-                    return (game.plotPhase === 'boat_quest' || game.plotPhase === 'working')
-                        && game.hasInspectedBoat
+                    return game.hasInspectedBoat
                         && completedCallumsQuests.length > 0
                         && completedCallumsQuests.length < callumsQuests.length;
                 },
@@ -765,14 +818,14 @@ const NPCS = {
             },
             {
                 // FIX: Add boat_ready phase dialogue (prevents dead end)
-                condition: (game) => game.plotPhase === 'boat_ready',
+                phase: 'boat_ready',
                 text: "The boat's ready. When the storm comes, you'll be ready too.",
                 repeatText: "We're all set. Just waiting on the storm now.",
                 choices: null
             },
             {
                 // FIX: Add departure phase dialogue (prevents dead end)
-                condition: (game) => game.plotPhase === 'departure',
+                phase: 'departure',
                 text: "Safe travels. May the winds be kind.",
                 repeatText: "Time to go. Good luck out there.",
                 choices: null
@@ -802,7 +855,55 @@ const NPCS = {
         jobDescription: 'Count the fish correctly for 3 coins!',
         payment: 3
     }
-};
+});
+
+/**
+ * Group every dialogue NPC's dialogues by plot phase (npc.dialoguesByPhase),
+ * keeping their listed order, and give each dialogue a full
+ * condition(game) that checks its phase and `when` together.
+ * Throws if an entry can never be shown: it has no phase, or an earlier
+ * entry for the same phase has no `when` and always matches first
+ * @returns {Object} npcs
+ */
+function compileDialogues(npcs) {
+    for (const [npcId, npc] of Object.entries(npcs)) {
+        if (npc.type !== 'dialogue_npc' || !npc.dialogues) continue;
+
+        const byPhase = new Map();
+        npc.dialogues.forEach((dialogue, index) => {
+            const phases = [].concat(dialogue.phase || []);
+            if (phases.length === 0) {
+                throw new Error(`${npcId} dialogue ${index} has no phase`);
+            }
+
+            for (const phase of phases) {
+                const group = byPhase.get(phase) || [];
+                const shadowedBy = group.find(earlier => !earlier.when);
+                if (shadowedBy) {
+                    throw new Error(`${npcId} dialogue ${index} can never show in phase '${phase}': ` +
+                        `dialogue ${npc.dialogues.indexOf(shadowedBy)} always matches first`);
+                }
+                group.push(dialogue);
+                byPhase.set(phase, group);
+            }
+
+            const when = dialogue.when;
+            dialogue.condition = (game) => phases.includes(game.plotPhase) && (!when || !!when(game));
+        });
+        npc.dialoguesByPhase = byPhase;
+    }
+    return npcs;
+}
+
+/**
+ * The dialogue an NPC shows in the current game state, or null. Only the
+ * `when` conditions of the current phase's dialogues are evaluated
+ */
+function findDialogue(npc, game) {
+    const group = npc.dialoguesByPhase && npc.dialoguesByPhase.get(game.plotPhase);
+    if (!group) return null;
+    return group.find(dialogue => !dialogue.when || dialogue.when(game)) || null;
+}
 
 // Shop items
 const SHOP_ITEMS = [
@@ -172,7 +172,7 @@ class DialogueQueueSystem {
 
         // Framework-based dialogue system
         if (npc.type === 'dialogue_npc' && npc.dialogues) {
-            const dialogue = npc.dialogues.find(d => d.condition(this.game));
+            const dialogue = findDialogue(npc, this.game);
 
             if (dialogue) {
                 // Track NPC interactions per phase
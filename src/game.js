@@ -28,6 +28,9 @@ const PlotPhase = {
     DEPARTURE: 'departure'
 };
 
+// Game loop cadence when nothing is animating (ms between frames)
+const IDLE_FRAME_MS = 100;
+
 class LighthouseGame {
     constructor() {
         this.canvas = document.getElementById('gameCanvas');
@@ -56,6 +59,8 @@ class LighthouseGame {
         this.party = [];  // Creatures traveling with player
         this.inventory = new Set(['map']);  // Start with a map to navigate
         this.playerAbilities = new Set();  // surf, torch, etc.
+        this.encounterTables = null;  // Per-terrain odds, see getEncounterTables
+        this.encounterTablesFor = null;  // State the tables were built for
         this.completedQuests = new Set();  // Track completed quests by ID: 'fishing_crates', 'fishing_records'
         this.activeQuest = null;  // {questId, quest, currentStep, type}
         this.questObjective = null;  // Current objective text to display
@@ -70,6 +75,11 @@ class LighthouseGame {
         this.speedRunMode = urlParams.has('speedrun') || urlParams.has('debug');
         this.showDebugInfo = this.speedRunMode;
 
+        // Encounter rolls; ?seed=N replays the same encounter sequence
+        this.random = urlParams.has('seed')
+            ? createSeededRandom(Number(urlParams.get('seed')))
+            : Math.random;
+
         // Boat quest tracking
         this.boatQuest = {
             planks: { required: 8, collected: 0 },
@@ -101,7 +111,12 @@ class LighthouseGame {
         this.moveRepeatRate = this.speedRunMode ? 30 : 100;  // Repeat rate when holding
 
         // Map
-        this.map = MAP_DATA;
+        this.map = new WorldMap(MAP_DATA);
+
+        // Areas that react when the player steps in (see registerTriggerZones)
+        this.triggers = new TriggerZones(this.map.width, this.map.height);
+        this.triggersPhase = this.plotPhase;  // Phase the zones last reacted to
+        this.registerTriggerZones();
 
         // Initialize subsystems
         this.questSystem = new QuestSystem(this);
@@ -124,17 +139,32 @@ class LighthouseGame {
         // Animation
         this.lastFrameTime = 0;
 
+        // Frame scheduling: full rate while something moves, an idle cadence
+        // otherwise. Callbacks are bound once instead of per frame
+        this.frameCallback = (t) => this.gameLoop(t);
+        this.idleCallback = () => {
+            this.idleTimer = null;
+            requestAnimationFrame(this.frameCallback);
+        };
+        this.idleTimer = null;
+
         this.init();
     }
 
     async init() {
         // Load sprites
         await spriteLoader.load();
+        this.renderingSystem.setPixelRatio(spriteLoader.scale);
 
         // Setup input
         this.setupInput();
         this.setupDebugMenu();
 
+        // Any input ends the idle cadence so the response isn't delayed
+        for (const type of ['keydown', 'touchstart', 'pointerdown']) {
+            document.addEventListener(type, () => this.wake(), { capture: true, passive: true });
+        }
+
         // Set version display and log it
         const versionEl = document.getElementById('version-display');
         if (versionEl) {
@@ -319,8 +349,7 @@ class LighthouseGame {
         document.getElementById('teleportLumina').addEventListener('click', () => {
             const lumimaObj = this.map.objects.find(obj => obj.id === 'lumina');
             if (lumimaObj) {
-                this.player.x = lumimaObj.x - 2;
-                this.player.y = lumimaObj.y;
+                this.teleportPlayer(lumimaObj.x - 2, lumimaObj.y);
                 debugMenu.classList.add('hidden');
             }
         });
@@ -445,8 +474,7 @@ class LighthouseGame {
             // Teleport to Lumina for testing
             const lumimaObj = this.map.objects.find(obj => obj.id === 'lumina');
             if (lumimaObj) {
-                this.player.x = lumimaObj.x - 2;
-                this.player.y = lumimaObj.y;
+                this.teleportPlayer(lumimaObj.x - 2, lumimaObj.y);
                 console.log(`Teleported to Lumina at (${lumimaObj.x}, ${lumimaObj.y})`);
             }
             return;
@@ -648,17 +676,40 @@ class LighthouseGame {
                 this.player.walkFrame = (this.player.walkFrame + 1) % 2;
                 this.moveTimer = 0;
 
+                // Scripted encounters, quest objectives and other trigger zones
+                this.triggers.moveTo(newX, newY, this);
+
                 // Check for creature encounters
                 this.checkCreatureEncounter();
-
-                // Check quest objectives
-                this.questSystem.checkQuestObjectives();
             }
         } else {
             this.player.moving = false;
         }
     }
 
+    /**
+     * Move the player without walking (debug teleports), keeping trigger
+     * zones in step with where they are
+     */
+    teleportPlayer(x, y) {
+        this.player.x = x;
+        this.player.y = y;
+        this.triggers.moveTo(x, y, this);
+    }
+
+    /**
+     * Let the plot and the zones under the player react to a plot phase
+     * change, e.g. the first encounter when find_creature starts while they
+     * stand in it. Waits until the player is exploring again (phases change
+     * as dialogue closes)
+     */
+    refreshTriggers() {
+        if (this.plotPhase === this.triggersPhase || this.state !== GameState.EXPLORING) return;
+        this.checkCreatureMilestones();
+        this.triggersPhase = this.plotPhase;
+        this.triggers.refresh(this.player.x, this.player.y, this);
+    }
+
     canMoveTo(x, y) {
         // Check bounds
         if (x < 0 || x >= this.map.width || y < 0 || y >= this.map.height) {
@@ -666,55 +717,20 @@ class LighthouseGame {
         }
 
         // Check terrain (water blocks)
-        const tileIndex = y * this.map.width + x;
-        const terrain = this.map.ground[tileIndex];
-        if (terrain === 'water') {
+        if (this.map.isWater(x, y)) {
             return false;
         }
 
-        // Check object collisions
-        for (const obj of this.map.objects) {
-            if (obj.type === 'lighthouse') {
-                // Lighthouse occupies 3x5 tiles
-                if (x >= obj.x && x < obj.x + obj.width &&
-                    y >= obj.y && y < obj.y + obj.height) {
-                    return false;
-                }
-            } else if (obj.type === 'tree') {
-                // Tree occupies 2x2 tiles
-                if (x >= obj.x && x < obj.x + 2 &&
-                    y >= obj.y && y < obj.y + 2) {
-                    return false;
-                }
-            } else if (obj.type === 'store') {
-                // Store occupies 2x2 tiles
-                if (x >= obj.x && x < obj.x + 2 &&
-                    y >= obj.y && y < obj.y + 2) {
-                    return false;
-                }
-            } else if (obj.type === 'boat') {
-                // Boat occupies 3x2 tiles
-                if (x >= obj.x && x < obj.x + 3 &&
-                    y >= obj.y && y < obj.y + 2) {
-                    return false;
-                }
-            } else if (obj.type === 'rock') {
-                // Rock occupies 1 tile
-                if (x === obj.x && y === obj.y) {
-                    return false;
-                }
-            } else if (obj.type === 'npc') {
-                // NPC occupies 1 tile
-                if (x === obj.x && y === obj.y) {
-                    return false;
-                }
-            } else if (obj.type === 'creature') {
-                // First creature (Lumina) - only blocks during find_creature phase
-                if (obj.id === 'lumina_first' && this.plotPhase === PlotPhase.FIND_CREATURE) {
-                    if (x === obj.x && y === obj.y) {
-                        return false;
-                    }
-                }
+        // Lighthouse, trees, store, boat, rocks and NPCs (see WorldMap)
+        if (this.map.isBlocked(x, y)) {
+            return false;
+        }
+
+        // First creature (Lumina) - only blocks during find_creature phase
+        for (const obj of this.map.objectsAt(x, y)) {
+            if (obj.type === 'creature' && obj.id === 'lumina_first' &&
+                this.plotPhase === PlotPhase.FIND_CREATURE) {
+                return false;
             }
         }
 
@@ -746,32 +762,26 @@ class LighthouseGame {
         const checkX = this.player.x + dx;
         const checkY = this.player.y + dy;
 
-        // Find NPC, creature, or building at interaction position
-        for (const obj of this.map.objects) {
-            if (obj.type === 'creature' && obj.x === checkX && obj.y === checkY) {
+        // Find NPC, creature, or building at interaction position. objectsAt
+        // covers each object's whole footprint, so the store's 2x2 and the
+        // boat's 3x2 match from any side
+        for (const obj of this.map.objectsAt(checkX, checkY)) {
+            if (obj.type === 'creature') {
                 // Trigger first creature encounter
                 if (obj.id === 'lumina_first' && this.plotPhase === PlotPhase.FIND_CREATURE) {
                     this.firstEncounterTriggered = true;
                     this.startFirstCreatureEncounter();
                 }
                 return;
-            } else if (obj.type === 'npc' && obj.x === checkX && obj.y === checkY) {
+            } else if (obj.type === 'npc') {
                 this.dialogue.showNPCDialog(obj.id);
                 return;
             } else if (obj.type === 'store') {
-                // Check if player is adjacent to store (2x2 building)
-                if (checkX >= obj.x && checkX < obj.x + 2 &&
-                    checkY >= obj.y && checkY < obj.y + 2) {
-                    this.openShop();
-                    return;
-                }
+                this.openShop();
+                return;
             } else if (obj.type === 'boat') {
-                // Check if player is adjacent to boat (3x2 object)
-                if (checkX >= obj.x && checkX < obj.x + 3 &&
-                    checkY >= obj.y && checkY < obj.y + 2) {
-                    this.showBoatDialogue();
-                    return;
-                }
+                this.showBoatDialogue();
+                return;
             }
         }
     }
@@ -779,6 +789,7 @@ class LighthouseGame {
     showBoatDialogue() {
         // Boat ready - departure time
         if (this.plotPhase === 'boat_ready') {
+            this.plotPhase = PlotPhase.DEPARTURE;
             this.showDialog("The boat is repaired and ready. Storm's coming—it's time to leave.");
             return;
         }
@@ -962,6 +973,7 @@ class LighthouseGame {
             if (this.coins >= price && !this.inventory.has(itemId)) {
                 this.coins -= price;
                 this.inventory.add(itemId);
+                this.questSystem.itemAdded(itemId);
                 this.updateUI();
                 this.showShop();  // Refresh shop UI
             }
@@ -1019,35 +1031,30 @@ class LighthouseGame {
     }
 
     getTerrainAt(x, y) {
-        // Get terrain type at coordinates
-        const tileIndex = y * this.map.width + x;
-        const groundTerrain = this.map.ground[tileIndex];
-
-        // Check if there's tall grass at this position (overrides ground)
-        const hasTallGrass = this.map.objects.some(obj =>
-            obj.type === 'tallgrass' && obj.x === x && obj.y === y
-        );
-
-        if (hasTallGrass) return 'tallgrass';
-        return groundTerrain;  // 'water', 'sand', 'grass', 'cave', etc.
+        // Tall grass overrides the ground underneath
+        if (this.map.hasTallGrass(x, y)) return 'tallgrass';
+        return this.map.terrainAt(x, y);  // 'water', 'sand', 'grass', 'cave', etc.
     }
 
-    checkCreatureEncounter() {
+    /**
+     * Register the map's fixed trigger zones. Quest objectives register
+     * their own while active (see QuestSystem.syncObjectiveZone)
+     */
+    registerTriggerZones() {
         // Scripted first encounter (Lumina on beach near rocks)
-        if (this.plotPhase === PlotPhase.FIND_CREATURE && !this.firstEncounterTriggered) {
-            const FIRST_ENCOUNTER_ZONE = { x: 7, y: 7, width: 2, height: 2 };  // Western beach, near rocks
-
-            if (this.player.x >= FIRST_ENCOUNTER_ZONE.x &&
-                this.player.x < FIRST_ENCOUNTER_ZONE.x + FIRST_ENCOUNTER_ZONE.width &&
-                this.player.y >= FIRST_ENCOUNTER_ZONE.y &&
-                this.player.y < FIRST_ENCOUNTER_ZONE.y + FIRST_ENCOUNTER_ZONE.height) {
-
-                this.firstEncounterTriggered = true;
-                this.startFirstCreatureEncounter();
-                return;
+        this.triggers.add({
+            id: 'first_encounter',
+            x: 7, y: 7, width: 2, height: 2,  // Western beach, near rocks
+            onEnter: game => {
+                if (game.plotPhase === PlotPhase.FIND_CREATURE && !game.firstEncounterTriggered) {
+                    game.firstEncounterTriggered = true;
+                    game.startFirstCreatureEncounter();
+                }
             }
-        }
+        });
+    }
 
+    checkCreatureEncounter() {
         // Random habitat-based encounters (disabled during scripted sequence)
         if (!this.creatureEncounter || !this.creatureEncounter.active) {
             this.checkRandomEncounter();
@@ -1062,29 +1069,36 @@ class LighthouseGame {
         }
 
         const terrain = this.getTerrainAt(this.player.x, this.player.y);
+        const table = this.getEncounterTables()[terrain];
+        if (!table) return;  // Nothing left to find here
 
-        // Check each creature for possible encounter
-        for (const [creatureId, creature] of Object.entries(CREATURES)) {
-            // Skip already discovered creatures
-            if (this.discoveredCreatures.has(creatureId)) continue;
-
-            // Skip if not in correct habitat
-            if (!creature.habitats.includes(terrain)) continue;
-
-            // Skip if requires ability player doesn't have
-            if (creature.requiresAbility && !this.playerAbilities.has(creature.requiresAbility)) {
-                continue;
-            }
+        // One roll picks at most one creature
+        const creatureId = rollEncounter(table, this.random());
+        if (creatureId) {
+            this.triggerCreatureEncounter(creatureId);
+        }
+    }
 
+    /**
+     * Encounter tables for the current discoveries, abilities and inventory,
+     * rebuilt only when those change. Discoveries and abilities are only ever
+     * added, so their sizes tell whether they changed
+     */
+    getEncounterTables() {
+        const hasNet = this.inventory.has('net');
+        const built = this.encounterTablesFor;
+        if (!built || built.discovered !== this.discoveredCreatures.size ||
+            built.abilities !== this.playerAbilities.size || built.hasNet !== hasNet) {
             // Golden net doubles encounter rate
-            const rate = this.inventory.has('net') ? creature.encounterRate * 2 : creature.encounterRate;
-
-            // Roll for encounter
-            if (Math.random() < rate) {
-                this.triggerCreatureEncounter(creatureId);
-                break;  // Only one encounter at a time
-            }
+            this.encounterTables = buildEncounterTables(
+                CREATURES, this.discoveredCreatures, this.playerAbilities, hasNet ? 2 : 1);
+            this.encounterTablesFor = {
+                discovered: this.discoveredCreatures.size,
+                abilities: this.playerAbilities.size,
+                hasNet
+            };
         }
+        return this.encounterTables;
     }
 
     triggerCreatureEncounter(creatureId) {
@@ -1124,15 +1138,7 @@ class LighthouseGame {
             this.plotPhase = PlotPhase.CREATURE_ENCOUNTER;
         }
 
-        // Progress to working phase after 3 creatures
-        if (this.plotPhase === PlotPhase.RETURN_TO_KEEPER && this.discoveredCreatures.size >= 3) {
-            this.plotPhase = PlotPhase.WORKING;
-        }
-
-        // Progress to boat ready after 6 creatures
-        if (this.plotPhase === PlotPhase.WORKING && this.discoveredCreatures.size >= 6) {
-            this.plotPhase = PlotPhase.BOAT_READY;
-        }
+        this.checkCreatureMilestones();
 
         // Show discovery as dialogue (D-pad controlled)
         this.dialogue.startDialogue(
@@ -1152,6 +1158,26 @@ class LighthouseGame {
         this.updateUI();
     }
 
+    /**
+     * Move the plot on once enough creatures are discovered. Runs on each
+     * discovery and when the phase changes (see refreshTriggers), so
+     * creatures found before the working phase still count
+     */
+    checkCreatureMilestones() {
+        const found = this.discoveredCreatures.size;
+
+        // Progress to working phase after 3 creatures
+        if (this.plotPhase === PlotPhase.RETURN_TO_KEEPER && found >= 3) {
+            this.plotPhase = PlotPhase.WORKING;
+        }
+
+        // Progress to boat ready after 5 creatures (every one found without
+        // surf or torch, which nothing grants yet)
+        if (this.plotPhase === PlotPhase.WORKING && found >= 5) {
+            this.plotPhase = PlotPhase.BOAT_READY;
+        }
+    }
+
     // First Creature Encounter - Narrative Sequence (Queue-Based)
     startFirstCreatureEncounter() {
         this.creatureEncounter = {
@@ -1276,6 +1302,19 @@ class LighthouseGame {
      * @param {number} size - Size of the sprite
      */
     drawHighResLumina(ctx, centerX, centerY, size) {
+        // Gradients and paths are rendered once per size and reused (the
+        // glow, the widest part, spans 60 units either side of center)
+        const extent = size * 0.6;
+        const bounds = { x: -extent, y: -extent, w: extent * 2, h: extent * 2 };
+        spriteLoader.bitmaps.draw(ctx, `lumina_highres:${size}`, bounds, 1, centerX, centerY,
+            layer => this.paintHighResLumina(layer, 0, 0, size));
+    }
+
+    /**
+     * Paint the high-resolution Lumina with gradients and paths (see
+     * drawHighResLumina)
+     */
+    paintHighResLumina(ctx, centerX, centerY, size) {
         ctx.save();
 
         // Enable smooth rendering
@@ -1484,16 +1523,46 @@ class LighthouseGame {
 
         // Update
         this.updateMovement(deltaTime);
+        this.refreshTriggers();
         spriteLoader.updateWaterAnimation(timestamp);
+        spriteLoader.updateCreatureAnimation(timestamp);
         this.dialogue.update(timestamp); // Typewriter animation
 
-        // Render
-        this.renderingSystem.render();
-        if (this.showDebugInfo) {
-            this.renderingSystem.renderDebugInfo();
+        // Render only what changed (debug info is drawn by the rendering system)
+        this.renderingSystem.renderFrame();
+
+        this.scheduleFrame();
+    }
+
+    /**
+     * Run the next frame on requestAnimationFrame while the player, dialogue
+     * text or a quest marker is moving; otherwise wait IDLE_FRAME_MS first.
+     * Water and creature animations step every 400-500ms, so the idle
+     * cadence still catches them
+     */
+    scheduleFrame() {
+        if (this.isAnimating()) {
+            requestAnimationFrame(this.frameCallback);
+        } else {
+            this.idleTimer = setTimeout(this.idleCallback, IDLE_FRAME_MS);
         }
+    }
+
+    isAnimating() {
+        return this.player.moving ||
+            this.keys['ArrowUp'] || this.keys['ArrowDown'] || this.keys['ArrowLeft'] || this.keys['ArrowRight'] ||
+            this.dialogue.state === 'ANIMATING' ||
+            this.renderingSystem.isAnimating();
+    }
 
-        requestAnimationFrame((t) => this.gameLoop(t));
+    /**
+     * Cut an idle wait short, e.g. on input
+     */
+    wake() {
+        if (this.idleTimer !== null) {
+            clearTimeout(this.idleTimer);
+            this.idleCallback();
+        }
     }
 
     // All rendering methods now in renderingSystem.js
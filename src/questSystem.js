@@ -3,6 +3,9 @@
  * Extracted from main game engine for modularity
  */
 
+// Trigger zone id for the active quest step's area (see syncObjectiveZone)
+const OBJECTIVE_ZONE = 'quest_objective';
+
 class QuestSystem {
     constructor(game) {
         this.game = game;
@@ -107,38 +110,83 @@ class QuestSystem {
         } else {
             console.error(`Unknown quest step type: ${step.type}`);
         }
-    }
 
-    checkQuestObjectives() {
-        if (!this.game.activeQuest) return;
+        this.syncObjectiveZone();
+        if (step.itemId && this.game.inventory.has(step.itemId)) {
+            this.itemAdded(step.itemId);  // Already carrying it
+        }
+    }
 
-        const quest = this.game.activeQuest.quest;
-        if (quest.type !== 'multi_step') return;
+    /**
+     * The active multi-step quest's current step, or null
+     */
+    activeStep() {
+        const active = this.game.activeQuest;
+        const quest = active && active.quest;
+        return quest && quest.type === 'multi_step' ? quest.steps[active.currentStep] || null : null;
+    }
 
-        const step = quest.steps[this.game.activeQuest.currentStep];
-        if (!step) return;
+    /**
+     * Register the active step's area (from its handler's zone()) as the
+     * objective trigger zone, replacing the previous step's. Entering it runs
+     * the handler's onArrive (see arriveAtObjective). Called as each step
+     * starts and when the quest ends
+     */
+    syncObjectiveZone() {
+        this.game.triggers.remove(OBJECTIVE_ZONE);
+
+        const step = this.activeStep();
+        const handler = step && QUEST_STEP_HANDLERS[step.type];
+        if (handler && handler.zone) {
+            this.game.triggers.add({
+                id: OBJECTIVE_ZONE,
+                ...handler.zone(this.game, step),
+                onEnter: () => this.arriveAtObjective(step, handler)
+            });
+        }
+    }
 
-        // Use handler registry for update logic
-        const handler = QUEST_STEP_HANDLERS[step.type];
-        if (handler && handler.onUpdate) {
-            const result = handler.onUpdate(this.game, step);
+    /**
+     * Objective zone onEnter: the player walked or teleported into the step's
+     * area. A zone whose step is no longer active (the quest was abandoned or
+     * moved on) just removes itself
+     */
+    arriveAtObjective(step, handler) {
+        if (this.activeStep() !== step) {
+            this.game.triggers.remove(OBJECTIVE_ZONE);
+            return;
+        }
+        this.completeObjective(step, handler.onArrive(this.game, step));
+    }
 
-            if (result.completed) {
-                // For visit_and_solve, don't auto-advance - choice action handles it after checking answer
-                // For other types (visit_location, fetch_item), advance immediately
-                const shouldAutoAdvance = step.type !== 'visit_and_solve';
+    /**
+     * An item was added to the inventory; completes a step waiting for it
+     * (the handler's onItem, as fetch_item has)
+     */
+    itemAdded(itemId) {
+        const step = this.activeStep();
+        const handler = step && QUEST_STEP_HANDLERS[step.type];
+        if (handler && handler.onItem && step.itemId === itemId) {
+            this.completeObjective(step, handler.onItem(this.game, step));
+        }
+    }
 
-                if (shouldAutoAdvance) {
-                    this.game.activeQuest.currentStep++;
-                }
+    /**
+     * Show the { message, choices } a handler returned for its completed
+     * objective and advance past the step
+     */
+    completeObjective(step, result) {
+        // For visit_and_solve, don't auto-advance - choice action handles it after checking answer
+        // For other types (visit_location, fetch_item), advance immediately
+        if (step.type !== 'visit_and_solve') {
+            this.game.activeQuest.currentStep++;
+        }
 
-                this.game.questObjective = null;
+        this.game.questObjective = null;
 
-                // Show completion message and choices
-                if (result.message) {
-                    this.game.startDialogue([result.message], result.choices);
-                }
-            }
+        // Show completion message and choices
+        if (result.message) {
+            this.game.startDialogue([result.message], result.choices);
         }
     }
 
@@ -225,6 +273,7 @@ class QuestSystem {
         document.getElementById('jobUI').classList.add('hidden');
         this.game.questObjective = null;
         this.game.activeQuest = null;
+        this.syncObjectiveZone();
 
         // Show success message (this properly manages state transition)
         this.game.showDialog(`Excellent work! You earned ${quest.reward} coins!`);
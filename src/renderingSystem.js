@@ -6,50 +6,316 @@
 class RenderingSystem {
     constructor(game) {
         this.game = game;
+        // Logical size in game pixels; the backing store may be larger (see setPixelRatio)
+        this.width = game.canvas.width;
+        this.height = game.canvas.height;
+        this.pixelRatio = 1;
+
+        // Viewport onto the map, following the player; only chunks, tiles
+        // and objects inside it are visited
+        this.camera = new Camera(this.width, this.height);
+        this.visibleObjects = [];   // reused by renderObjects
+        this.playerSprites = spriteLoader.characterHandles('player');
+
+        // Terrain never changes except for the water animation, so each
+        // visible chunk is drawn once per water frame into offscreen canvases
+        // and blitted each frame. Chunks that scroll out of view are dropped
+        this.terrainLayers = new Map();     // chunk -> { frames: [canvas], stamp }
+        this.terrainMap = null;             // map the layers were drawn from
+        this.terrainStamp = 0;              // render pass counter, for eviction
+
+        // Dirty-region tracking: renderFrame() only repaints what changed
+        this.dirtyRegions = [];     // {x, y, w, h} in world pixels
+        this.fullRepaint = true;
+        this.painted = null;        // what the last paint showed (see trackChanges)
+    }
+
+    /**
+     * Queue a region, in world pixels, to be repainted on the next frame
+     */
+    markDirty(x, y, w, h) {
+        this.dirtyRegions.push({ x, y, w, h });
+    }
+
+    markAllDirty() {
+        this.fullRepaint = true;
+    }
+
+    /**
+     * Drop the cached terrain layers; call after editing map.terrain/tiles in place
+     */
+    invalidateTerrain() {
+        this.terrainLayers.clear();
+    }
+
+    /**
+     * Back the canvas with ratio device pixels per game pixel, keeping its CSS
+     * size and drawing coordinates unchanged, so high-DPI sprite sheets blit 1:1
+     */
+    setPixelRatio(ratio) {
+        const canvas = this.game.canvas;
+        const ctx = this.game.ctx;
+
+        this.pixelRatio = ratio;
+        canvas.width = this.width * ratio;
+        canvas.height = this.height * ratio;
+        // No inline height: #gameCanvas's height: auto (assets/style.css) keeps
+        // the aspect ratio when max-width shrinks the canvas on narrow screens
+        canvas.style.width = `${this.width}px`;
+
+        // Resizing the canvas resets the context state
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.imageSmoothingEnabled = false;
+
+        this.invalidateTerrain();
+        this.markAllDirty();
+    }
+
+    /**
+     * Repaint whatever changed since the last frame, clipped to the dirty
+     * regions. Returns false when nothing needed painting
+     */
+    renderFrame() {
+        this.trackChanges();
+
+        if (this.fullRepaint) {
+            this.render();
+        } else if (this.dirtyRegions.length > 0) {
+            const ctx = this.game.ctx;
+            ctx.save();
+            ctx.beginPath();
+            for (const region of this.dirtyRegions) {
+                ctx.rect(region.x - this.camera.x, region.y - this.camera.y, region.w, region.h);
+            }
+            ctx.clip();
+            this.render();
+            ctx.restore();
+        } else {
+            return false;
+        }
+
+        this.fullRepaint = false;
+        this.dirtyRegions.length = 0;
+        return true;
+    }
+
+    /**
+     * Move the camera to the player, then compare the game against the last
+     * paint and queue the regions that differ: the player's old and new
+     * spots, water chunks, the idle creature and quest markers. Anything that
+     * affects the whole screen (camera, map objects, plot phase, quest banner,
+     * debug overlay) forces a full repaint
+     */
+    trackChanges() {
+        const game = this.game;
+        const map = game.map;
+        const player = game.player;
+        const quest = game.activeQuest;
+        const tileSize = map.tileSize;
+        const last = this.painted;
+
+        const cameraMoved = this.camera.follow(
+            (player.x + 0.5) * tileSize, (player.y + 0.5) * tileSize,
+            map.width * tileSize, map.height * tileSize);
+
+        const now = {
+            map,
+            mapVersion: map.version,
+            waterFrame: spriteLoader.getWaterFrame(),
+            plotPhase: game.plotPhase,
+            questObjective: game.questObjective,
+            quest: quest && quest.quest,
+            questStep: quest && quest.currentStep,
+            debugInfo: game.showDebugInfo,
+            creatureFrame: spriteLoader.getCreatureFrame(),
+            playerX: player.x,
+            playerY: player.y,
+            playerDirection: player.direction,
+            playerFrame: player.moving ? player.walkFrame : 0
+        };
+        this.painted = now;
+
+        if (!last || cameraMoved || now.map !== last.map || now.mapVersion !== last.mapVersion ||
+            now.plotPhase !== last.plotPhase || now.questObjective !== last.questObjective ||
+            now.quest !== last.quest || now.questStep !== last.questStep ||
+            now.debugInfo || now.debugInfo !== last.debugInfo) {
+            this.markAllDirty();
+            return;
+        }
+
+        if (now.playerX !== last.playerX || now.playerY !== last.playerY ||
+            now.playerDirection !== last.playerDirection || now.playerFrame !== last.playerFrame) {
+            this.markCharacter(last.playerX, last.playerY);
+            this.markCharacter(now.playerX, now.playerY);
+        }
+
+        if (now.waterFrame !== last.waterFrame) {
+            const view = this.camera.tileBounds(tileSize);
+            map.forEachChunkInRect(view.x0, view.y0, view.x1, view.y1, chunk => {
+                if (chunk.hasWater) {
+                    this.markDirty(chunk.x * tileSize, chunk.y * tileSize, chunk.w * tileSize, chunk.h * tileSize);
+                }
+            });
+        }
+
+        if (now.creatureFrame !== last.creatureFrame && game.plotPhase === PlotPhase.FIND_CREATURE) {
+            for (const obj of map.objects) {
+                if (obj.type === 'creature') {
+                    this.markDirty(obj.x * tileSize, obj.y * tileSize, tileSize, tileSize);
+                }
+            }
+        }
+
+        const markerBounds = this.questMarkerBounds();
+        if (markerBounds) {
+            this.markDirty(markerBounds.x, markerBounds.y, markerBounds.w, markerBounds.h);
+        }
+    }
+
+    /**
+     * Characters are 24x32 and drawn 16px above their tile (see drawCharacterHandle)
+     */
+    markCharacter(tileX, tileY) {
+        const tileSize = this.game.map.tileSize;
+        this.markDirty(tileX * tileSize, tileY * tileSize - 16, 24, 32);
+    }
+
+    /**
+     * Area the active quest step's marker animates in, from its handler's
+     * renderBounds(), or the whole screen for a marker without one
+     */
+    questMarkerBounds() {
+        const quest = this.game.activeQuest;
+        if (!quest || quest.quest.type !== 'multi_step') return null;
+
+        const step = quest.quest.steps[quest.currentStep];
+        const handler = step && QUEST_STEP_HANDLERS[step.type];
+        if (!handler || !handler.onRender) return null;
+
+        if (handler.renderBounds) {
+            return handler.renderBounds(this.game, step);
+        }
+        return { x: this.camera.x, y: this.camera.y, w: this.width, h: this.height };
+    }
+
+    /**
+     * Whether something on screen moves every frame, so the game loop
+     * should keep running at full rate rather than its idle cadence
+     */
+    isAnimating() {
+        return this.game.showDebugInfo || this.questMarkerBounds() !== null;
     }
 
     render() {
         const ctx = this.game.ctx;
-        const canvas = this.game.canvas;
 
         // Clear
         ctx.fillStyle = '#0a1628';
-        ctx.fillRect(0, 0, canvas.width, canvas.height);
+        ctx.fillRect(0, 0, this.width, this.height);
 
-        // Render layers
+        // Render world layers, scrolled by the camera
+        ctx.save();
+        ctx.translate(-this.camera.x, -this.camera.y);
         this.renderTerrain();
         this.renderObjects();
         this.game.questSystem.renderQuestMarkers(ctx);
         this.renderPlayer();
+        ctx.restore();
 
         // Render quest objective banner (yellow text at bottom)
-        this.game.questSystem.renderQuestObjective(ctx, canvas.height, canvas.width);
+        this.game.questSystem.renderQuestObjective(ctx, this.height, this.width);
+
+        if (this.game.showDebugInfo) {
+            this.renderDebugInfo();
+        }
     }
 
     renderTerrain() {
         const ctx = this.game.ctx;
         const map = this.game.map;
         const tileSize = map.tileSize;
+        const waterFrame = spriteLoader.getWaterFrame();
+        const view = this.camera.tileBounds(tileSize);
 
-        for (let y = 0; y < map.height; y++) {
-            for (let x = 0; x < map.width; x++) {
-                const index = y * map.width + x;
-                const terrain = map.ground[index];
-
-                let tileName;
-                if (terrain === 'water') {
-                    tileName = `water_${spriteLoader.getWaterFrame()}`;
-                } else if (terrain === 'grass') {
-                    tileName = spriteLoader.getTileVariant('grass', x, y, 4);
-                } else if (terrain === 'sand') {
-                    tileName = spriteLoader.getTileVariant('sand', x, y, 3);
-                }
+        this.terrainStamp++;
+        map.forEachChunkInRect(view.x0, view.y0, view.x1, view.y1, chunk => {
+            const x = chunk.x * tileSize;
+            const y = chunk.y * tileSize;
+            const layer = this.getTerrainLayer(map, chunk, waterFrame);
+
+            if (layer) {
+                ctx.drawImage(layer, x, y, chunk.w * tileSize, chunk.h * tileSize);
+            } else {
+                this.drawTerrain(ctx, map, chunk, waterFrame, 0, 0);
+            }
+        });
+
+        // Drop layers for chunks that scrolled out of view
+        for (const [chunk, entry] of this.terrainLayers) {
+            if (entry.stamp !== this.terrainStamp) this.terrainLayers.delete(chunk);
+        }
+    }
+
+    /**
+     * Offscreen canvas holding one chunk's terrain for one water frame (chunks
+     * without water share a single layer), drawn at the canvas pixel ratio
+     * on first use. Null until sprites load, since drawing before then would
+     * cache an empty layer
+     */
+    getTerrainLayer(map, chunk, waterFrame) {
+        if (!spriteLoader.loaded) return null;
+
+        if (this.terrainMap !== map) {
+            this.invalidateTerrain();
+            this.terrainMap = map;
+        }
+
+        let entry = this.terrainLayers.get(chunk);
+        if (!entry) {
+            entry = { frames: [], stamp: 0 };
+            this.terrainLayers.set(chunk, entry);
+        }
+        entry.stamp = this.terrainStamp;
+
+        const frame = chunk.hasWater ? waterFrame : 0;
+        let layer = entry.frames[frame];
+        if (!layer) {
+            const ratio = this.pixelRatio;
+            const tileSize = map.tileSize;
+            layer = document.createElement('canvas');
+            layer.width = chunk.w * tileSize * ratio;
+            layer.height = chunk.h * tileSize * ratio;
+
+            const layerCtx = layer.getContext('2d');
+            layerCtx.setTransform(ratio, 0, 0, ratio, 0, 0);
+            layerCtx.imageSmoothingEnabled = false;
+            this.drawTerrain(layerCtx, map, chunk, frame, chunk.x * tileSize, chunk.y * tileSize);
+
+            entry.frames[frame] = layer;
+        }
+        return layer;
+    }
+
+    /**
+     * Draw a chunk's tiles, offset by (originX, originY) world pixels
+     */
+    drawTerrain(ctx, map, chunk, waterFrame, originX, originY) {
+        const tileSize = map.tileSize;
+        const terrain = map.terrain;
+        const tiles = map.tiles;
+
+        for (let y = chunk.y; y < chunk.y + chunk.h; y++) {
+            let index = y * map.width + chunk.x;
+            for (let x = chunk.x; x < chunk.x + chunk.w; x++, index++) {
+                // Water tiles resolve to water_0; the frames follow it in TILE_NAMES
+                const tile = terrain[index] === TERRAIN.WATER ? tiles[index] + waterFrame : tiles[index];
 
-                spriteLoader.drawTile(
+                spriteLoader.drawHandle(
                     ctx,
-                    tileName,
-                    x * tileSize,
-                    y * tileSize,
+                    tile,
+                    x * tileSize - originX,
+                    y * tileSize - originY,
+                    tileSize,
                     tileSize
                 );
             }
@@ -60,8 +326,9 @@ class RenderingSystem {
         const ctx = this.game.ctx;
         const map = this.game.map;
         const tileSize = map.tileSize;
+        const view = this.camera.tileBounds(tileSize);
 
-        for (const obj of map.objects) {
+        for (const obj of map.objectsInRect(view.x0, view.y0, view.x1, view.y1, this.visibleObjects)) {
             if (obj.type === 'lighthouse') {
                 spriteLoader.drawLighthouse(
                     ctx,
@@ -99,11 +366,10 @@ class RenderingSystem {
                     obj.y * tileSize
                 );
             } else if (obj.type === 'npc') {
-                spriteLoader.drawCharacter(
+                const sprites = spriteLoader.characterHandles(obj.charType || 'player');
+                spriteLoader.drawCharacterHandle(
                     ctx,
-                    obj.charType || 'player',  // Character type
-                    obj.sprite,                 // Direction
-                    0,                          // Frame (NPCs don't animate)
+                    sprites[DIRECTION_INDEX[obj.sprite] * 2],  // Facing, frame 0 (NPCs don't animate)
                     obj.x * tileSize,
                     obj.y * tileSize
                 );
@@ -114,7 +380,9 @@ class RenderingSystem {
                         ctx,
                         'lumina',
                         obj.x * tileSize,
-                        obj.y * tileSize
+                        obj.y * tileSize,
+                        false,
+                        spriteLoader.getCreatureFrame()
                     );
                 }
             }
@@ -126,11 +394,9 @@ class RenderingSystem {
         const tileSize = this.game.map.tileSize;
         const frame = this.game.player.moving ? this.game.player.walkFrame : 0;
 
-        spriteLoader.drawCharacter(
+        spriteLoader.drawCharacterHandle(
             ctx,
-            'player',                          // Character type
-            this.game.player.direction,        // Direction
-            frame,                             // Animation frame
+            this.playerSprites[DIRECTION_INDEX[this.game.player.direction] * 2 + frame % 2],
             this.game.player.x * tileSize,
             this.game.player.y * tileSize
         );
@@ -3,16 +3,367 @@
  * Loads PNG sprite sheets and provides methods to draw sprites
  */
 
+// Tileset tiles in tileset.json order. They get the first sprite handles,
+// so a tile's index here is its handle; map layers store these (see
+// WorldMap.tiles), and water frames must stay consecutive
+const TILE_NAMES = [
+    'grass_0', 'grass_1', 'grass_2', 'grass_3',
+    'water_0', 'water_1', 'water_2',
+    'sand_0', 'sand_1', 'sand_2',
+    'grass_sand_N', 'grass_sand_S', 'grass_sand_E', 'grass_sand_W',
+    'grass_sand_NE', 'grass_sand_NW', 'grass_sand_SE', 'grass_sand_SW',
+    'grass_water_N', 'grass_water_S', 'grass_water_E', 'grass_water_W',
+    'grass_water_NE', 'grass_water_NW', 'grass_water_SE', 'grass_water_SW'
+];
+const TILE_INDEX = Object.fromEntries(TILE_NAMES.map((name, index) => [name, index]));
+
+// Tile index for terrain without a tile; never resolves, so draws nothing
+const NO_TILE = 0xFFFF;
+
+// Character frames are laid out direction * 2 + frame in characterHandles()
+const DIRECTION_INDEX = { down: 0, up: 1, left: 2, right: 3 };
+const DIRECTIONS = Object.keys(DIRECTION_INDEX);
+
+// Area each procedural drawing covers around its (dx, dy), in game pixels;
+// roofs, sails and round line caps spill a little past the tile grid
+const STORE_BOUNDS = { x: -3, y: -1, w: 38, h: 34 };
+const BOAT_BOUNDS = { x: 0, y: -1, w: 48, h: 34 };
+const ROCK_BOUNDS = { x: 0, y: 0, w: 16, h: 16 };
+const TALL_GRASS_BOUNDS = { x: -1, y: -1, w: 20, h: 19 };
+const CREATURE_BOUNDS = { x: 0, y: 0, w: 16, h: 16 };
+
+// Creature pixel art for when the creature sheet isn't available, as
+// [color, x, y, w, h] rects drawn in order; colors are [r, g, b(, a)].
+// Mirrors CREATURE_ART in tools/generate_sprites.py (keep the two in sync):
+// 'shadow' is only drawn under the normal variant, and creatures without
+// 'enhanced' art get a brightened copy of 'normal' with a CREATURE_GLOW outline
+const CREATURE_ART = {
+    lumina: {
+        // Wounded glowing moth
+        shadow: [[3, 10, 11, 1]],
+        normal: [
+            [[0, 255, 255, 102], 5, 5, 6, 6],  // Glow aura
+            [[93, 78, 55], 7, 6, 2, 4],        // Body
+            [[147, 112, 219], 3, 6, 3, 3],     // Left wing (damaged)
+            [[0, 206, 209], 4, 7, 1, 1],
+            [[147, 112, 219], 10, 5, 4, 4],    // Right wing
+            [[0, 206, 209], 11, 6, 2, 2],
+            [[72, 209, 204], 12, 7, 1, 1],
+            [[0, 255, 255], 5, 7, 1, 1],       // Wing glow
+            [[0, 255, 255], 11, 7, 1, 1],
+            [[62, 39, 35], 7, 5, 2, 1],        // Head
+            [[26, 26, 26], 7, 4, 1, 1],        // Antennae
+            [[26, 26, 26], 8, 4, 1, 1],
+            [[255, 255, 0], 7, 5, 1, 1],       // Eyes
+            [[255, 255, 0], 8, 5, 1, 1]
+        ],
+        // Healed wings, brighter colors, glowing antennae
+        enhanced: [
+            [[0, 255, 255, 179], 4, 4, 8, 8],  // Glow aura
+            [[139, 111, 71], 7, 6, 2, 4],      // Body
+            [[186, 85, 211], 3, 5, 4, 4],      // Left wing
+            [[0, 255, 255], 4, 6, 2, 2],
+            [[72, 209, 204], 5, 7, 1, 1],
+            [[186, 85, 211], 9, 5, 4, 4],      // Right wing
+            [[0, 255, 255], 10, 6, 2, 2],
+            [[72, 209, 204], 10, 7, 1, 1],
+            [[255, 255, 255], 3, 5, 1, 1],     // Wing edges
+            [[255, 255, 255], 12, 5, 1, 1],
+            [[111, 78, 55], 7, 5, 2, 1],       // Head
+            [[62, 39, 35], 6, 4, 1, 1],        // Antennae
+            [[62, 39, 35], 9, 4, 1, 1],
+            [[255, 215, 0], 6, 3, 1, 1],       // Antenna tips
+            [[255, 215, 0], 9, 3, 1, 1],
+            [[255, 255, 255], 7, 5, 1, 1],     // Eyes
+            [[255, 255, 255], 8, 5, 1, 1]
+        ]
+    },
+    sprout: {
+        // Seedling with two leaves
+        shadow: [[4, 13, 8, 1]],
+        normal: [
+            [[139, 90, 60], 5, 9, 6, 4],     // Seed
+            [[170, 120, 80], 6, 9, 2, 1],
+            [[83, 141, 78], 7, 5, 2, 4],     // Stem
+            [[106, 170, 100], 4, 4, 3, 2],   // Leaves
+            [[140, 191, 124], 4, 4, 1, 1],
+            [[106, 170, 100], 9, 3, 3, 2],
+            [[140, 191, 124], 11, 3, 1, 1],
+            [[26, 26, 46], 6, 10, 1, 1],     // Eyes
+            [[26, 26, 46], 9, 10, 1, 1],
+            [[220, 120, 120], 5, 11, 1, 1],  // Cheeks
+            [[220, 120, 120], 10, 11, 1, 1]
+        ]
+    },
+    spark: {
+        // Firefly with a glowing abdomen
+        shadow: [[4, 13, 8, 1]],
+        normal: [
+            [[255, 235, 120, 90], 4, 5, 8, 8],  // Glow
+            [[200, 220, 240], 4, 4, 3, 2],      // Wings
+            [[200, 220, 240], 9, 4, 3, 2],
+            [[40, 40, 50], 7, 5, 2, 2],         // Head
+            [[60, 50, 40], 7, 7, 2, 2],         // Thorax
+            [[255, 235, 120], 6, 9, 4, 3],      // Abdomen
+            [[255, 250, 205], 7, 10, 2, 1],
+            [[40, 40, 50], 6, 3, 1, 2],         // Antennae
+            [[40, 40, 50], 9, 3, 1, 2],
+            [[255, 255, 255], 7, 5, 1, 1],      // Eyes
+            [[255, 255, 255], 8, 5, 1, 1]
+        ]
+    },
+    dusty: {
+        // Sand crab
+        shadow: [[3, 13, 10, 1]],
+        normal: [
+            [[180, 60, 40], 2, 11, 2, 1],  // Legs
+            [[180, 60, 40], 12, 11, 2, 1],
+            [[180, 60, 40], 3, 12, 1, 1],
+            [[180, 60, 40], 12, 12, 1, 1],
+            [[220, 90, 60], 4, 8, 8, 4],   // Shell
+            [[240, 130, 90], 5, 8, 3, 1],
+            [[200, 80, 50], 4, 7, 1, 1],   // Arms
+            [[200, 80, 50], 11, 7, 1, 1],
+            [[220, 90, 60], 2, 5, 3, 3],   // Claws
+            [[220, 90, 60], 11, 5, 3, 3],
+            [[180, 60, 40], 2, 5, 1, 1],
+            [[180, 60, 40], 13, 5, 1, 1],
+            [[180, 60, 40], 6, 6, 1, 2],   // Eye stalks
+            [[180, 60, 40], 9, 6, 1, 2],
+            [[26, 26, 46], 6, 5, 1, 1],    // Eyes
+            [[26, 26, 46], 9, 5, 1, 1]
+        ]
+    },
+    pebble: {
+        // Mossy river stone
+        shadow: [[3, 13, 10, 1]],
+        normal: [
+            [[128, 128, 128], 4, 7, 8, 5],  // Stone
+            [[128, 128, 128], 5, 6, 6, 1],
+            [[128, 128, 128], 5, 12, 6, 1],
+            [[169, 169, 169], 5, 7, 6, 4],
+            [[211, 211, 211], 5, 7, 2, 1],
+            [[106, 170, 100], 9, 7, 2, 1],  // Moss
+            [[106, 170, 100], 10, 8, 1, 1],
+            [[26, 26, 46], 6, 9, 1, 1],     // Eyes
+            [[26, 26, 46], 9, 9, 1, 1]
+        ]
+    },
+    marina: {
+        // Dolphin
+        shadow: [[3, 13, 10, 1]],
+        normal: [
+            [[91, 164, 200], 3, 7, 9, 4],    // Body
+            [[138, 199, 226], 5, 7, 4, 1],
+            [[200, 225, 240], 4, 10, 7, 1],  // Belly
+            [[91, 164, 200], 1, 8, 2, 2],    // Snout
+            [[62, 137, 178], 1, 9, 1, 1],
+            [[62, 137, 178], 7, 5, 2, 2],    // Dorsal fin
+            [[62, 137, 178], 12, 8, 2, 2],   // Tail
+            [[62, 137, 178], 14, 6, 1, 2],
+            [[62, 137, 178], 14, 10, 1, 2],
+            [[26, 26, 46], 4, 8, 1, 1]       // Eye
+        ]
+    },
+    frost: {
+        // Ice crystal
+        shadow: [[4, 13, 8, 1]],
+        normal: [
+            [[138, 199, 226, 90], 4, 3, 8, 10],  // Glow
+            [[140, 200, 230], 4, 6, 2, 4],       // Side shards
+            [[140, 200, 230], 10, 6, 2, 4],
+            [[180, 225, 245], 6, 4, 4, 8],       // Core
+            [[220, 240, 255], 7, 2, 2, 2],       // Tip
+            [[255, 255, 255], 7, 4, 1, 3],
+            [[43, 96, 125], 6, 8, 1, 1],         // Eyes
+            [[43, 96, 125], 9, 8, 1, 1]
+        ]
+    },
+    blaze: {
+        // Salamander
+        shadow: [[2, 13, 12, 1]],
+        normal: [
+            [[200, 70, 40], 2, 10, 3, 1],    // Tail
+            [[200, 70, 40], 1, 9, 1, 1],
+            [[230, 100, 50], 4, 9, 7, 3],    // Body
+            [[255, 180, 120], 5, 11, 5, 1],
+            [[230, 100, 50], 10, 7, 4, 3],   // Head
+            [[200, 70, 40], 5, 12, 1, 1],    // Legs
+            [[200, 70, 40], 9, 12, 1, 1],
+            [[255, 235, 120], 5, 9, 1, 1],   // Spots
+            [[255, 235, 120], 8, 10, 1, 1],
+            [[255, 235, 120], 11, 6, 2, 1],  // Crest
+            [[26, 26, 46], 12, 8, 1, 1]      // Eye
+        ]
+    }
+};
+const CREATURE_SHADOW = [0, 0, 0, 77];
+const CREATURE_GLOW = [255, 250, 205];
+
+// CSS color for a CREATURE_ART color, with its RGB scaled by brightness
+function creatureColor([r, g, b, a = 255], brightness = 1) {
+    const channel = value => Math.min(255, Math.round(value * brightness));
+    return `rgba(${channel(r)}, ${channel(g)}, ${channel(b)}, ${a / 255})`;
+}
+
+/**
+ * Bounded cache of procedural drawings rendered to offscreen canvases, so
+ * pixel art built from paths costs one drawImage after its first use.
+ * Least recently used entries are evicted past maxEntries
+ */
+class BitmapCache {
+    constructor(maxEntries = 64) {
+        this.maxEntries = maxEntries;
+        this.entries = new Map();   // key -> canvas, least recently used first
+    }
+
+    /**
+     * Draw the bitmap for key at (dx, dy), painting it on first use.
+     * key must identify everything the drawing depends on (kind, variant,
+     * animation frame, scale). paint(layerCtx) draws with its origin at
+     * (dx, dy), in game pixels; bounds is the area it covers relative to that
+     * origin, and scale the device pixels per game pixel to render at
+     */
+    draw(ctx, key, bounds, scale, dx, dy, paint) {
+        let canvas = this.entries.get(key);
+        if (canvas) {
+            // Re-insert to mark as most recently used
+            this.entries.delete(key);
+            this.entries.set(key, canvas);
+        } else {
+            canvas = this.render(bounds, scale, paint);
+            if (!canvas) {
+                // No offscreen canvas support (e.g. Node tests): draw directly
+                ctx.save();
+                ctx.translate(dx, dy);
+                paint(ctx);
+                ctx.restore();
+                return;
+            }
+            this.entries.set(key, canvas);
+            while (this.entries.size > this.maxEntries) {
+                this.entries.delete(this.entries.keys().next().value);
+            }
+        }
+
+        ctx.drawImage(canvas, dx + bounds.x, dy + bounds.y, bounds.w, bounds.h);
+    }
+
+    render(bounds, scale, paint) {
+        if (typeof document === 'undefined') return null;
+
+        const canvas = document.createElement('canvas');
+        canvas.width = Math.ceil(bounds.w * scale);
+        canvas.height = Math.ceil(bounds.h * scale);
+        const layerCtx = canvas.getContext('2d');
+        if (!layerCtx) return null;
+
+        layerCtx.setTransform(scale, 0, 0, scale, -bounds.x * scale, -bounds.y * scale);
+        paint(layerCtx);
+        return canvas;
+    }
+
+    clear() {
+        this.entries.clear();
+    }
+}
+
 class SpriteLoader {
     constructor() {
         this.images = {};
         this.indexes = {};
+        this.sprites = {};      // name -> { image, x, y, w, h } source rect
+        this.characters = {};   // charType -> { animations: { direction: { frames: [spriteName] } } }
+        this.creatures = {};    // creatureId -> { normal: { frames: [spriteName] }, enhanced: {...} }
+        this.scale = 1;         // Pixel scale of the loaded sheets (1x, 2x or 3x)
         this.loaded = false;
         this.waterFrame = 0;
         this.lastWaterUpdate = 0;
+        this.creatureFrame = 0;
+        this.lastCreatureUpdate = 0;
+
+        // Sprite handles: small integers standing for a sprite name, resolved
+        // once so draws skip the name lookup. Source rects are packed four
+        // to a handle; images stay null until the sheets load
+        this.handles = new Map();           // name -> handle
+        this.handleNames = [];              // handle -> name
+        this.handleImages = [];             // handle -> image
+        this.rects = new Uint16Array(64 * 4);   // handle -> x, y, w, h
+        this.characterSprites = new Map();  // charType -> handles (see characterHandles)
+        this.creatureSprites = new Map();   // creatureId -> { normal, enhanced } handles
+        this.bitmaps = new BitmapCache();   // procedural drawings (store, boat, rocks, ...)
+
+        TILE_NAMES.forEach(name => this.getHandle(name));
+        this.treeSprite = this.getHandle('tree');
+        this.lighthouseSprite = this.getHandle('lighthouse');
     }
 
     async load() {
+        // Prefer sheets pre-scaled for the screen, then fall back to 1x
+        const scales = [...new Set([this.pickScale(), 1])];
+
+        for (const scale of scales) {
+            try {
+                await this.loadAtlas(scale);
+            } catch (error) {
+                console.log(`⚠️  Sprite atlas @${scale}x unavailable, loading individual sheets`);
+                try {
+                    await this.loadSheets(scale);
+                } catch (sheetError) {
+                    if (scale === 1) throw sheetError;
+                    console.log(`⚠️  Sprite sheets @${scale}x unavailable, falling back to 1x`);
+                    continue;
+                }
+            }
+            this.scale = scale;
+            break;
+        }
+
+        this.loaded = true;
+        this.resolveHandles();
+        console.log(`✓ All sprites loaded (@${this.scale}x)`);
+    }
+
+    /**
+     * Sheet scale for this screen: devicePixelRatio rounded to the 1x/2x/3x
+     * sheets written by tools/generate_sprites.py
+     */
+    pickScale() {
+        const ratio = typeof window !== 'undefined' ? window.devicePixelRatio || 1 : 1;
+        return Math.min(3, Math.max(1, Math.round(ratio)));
+    }
+
+    spritePath(name, scale, ext) {
+        return `assets/sprites/${name}${scale === 1 ? '' : `@${scale}x`}.${ext}`;
+    }
+
+    /**
+     * Load the packed atlas: one image and one index for every sprite
+     * (see tools/generate_sprites.py)
+     */
+    async loadAtlas(scale = 1) {
+        const [img, index] = await Promise.all([
+            this.loadImage(this.spritePath('atlas', scale, 'png')),
+            fetch(this.spritePath('atlas', scale, 'json')).then(response => {
+                if (!response.ok) throw new Error(`atlas.json: HTTP ${response.status}`);
+                return response.json();
+            })
+        ]);
+
+        this.images.atlas = img;
+        this.indexes.atlas = index;
+        this.sprites = {};
+        for (const [name, rect] of Object.entries(index.sprites)) {
+            this.sprites[name] = { image: img, x: rect.x, y: rect.y, w: rect.w, h: rect.h };
+        }
+        this.characters = index.characters;
+        this.creatures = index.creatures || {};
+    }
+
+    /**
+     * Load the individual sprite sheets and index them the same way as the atlas
+     */
+    async loadSheets(scale = 1) {
         const sprites = [
             { name: 'tileset', hasIndex: true },
             { name: 'characters', hasIndex: true },
@@ -24,22 +375,19 @@ class SpriteLoader {
         const promises = sprites.map(async (sprite) => {
             try {
                 // Load image
-                const img = new Image();
-                img.src = `assets/sprites/${sprite.name}.png`;
-                await new Promise((resolve, reject) => {
-                    img.onload = resolve;
-                    img.onerror = reject;
-                });
-                this.images[sprite.name] = img;
+                this.images[sprite.name] = await this.loadImage(this.spritePath(sprite.name, scale, 'png'));
 
                 // Load index JSON if it exists
                 if (sprite.hasIndex) {
-                    const response = await fetch(`assets/sprites/${sprite.name}.json`);
+                    const response = await fetch(this.spritePath(sprite.name, scale, 'json'));
+                    if (!response.ok) throw new Error(`${sprite.name}.json: HTTP ${response.status}`);
                     this.indexes[sprite.name] = await response.json();
                 }
             } catch (error) {
-                // Creatures use programmatic rendering, so missing sprite files are OK
+                // Creatures fall back to programmatic rendering, so missing sprite files are OK
                 if (sprite.name === 'creatures') {
+                    delete this.images.creatures;
+                    delete this.indexes.creatures;
                     console.log('✓ Creatures will use programmatic rendering');
                 } else {
                     throw error;
@@ -48,8 +396,147 @@ class SpriteLoader {
         });
 
         await Promise.all(promises);
-        this.loaded = true;
-        console.log('✓ All sprites loaded');
+
+        this.sprites = {};
+        this.characters = {};
+
+        const tileset = this.indexes.tileset;
+        for (const [name, tile] of Object.entries(tileset.tiles)) {
+            this.addSprite(name, this.images.tileset,
+                tile.x * tileset.tileSize, tile.y * tileset.tileSize, tileset.tileSize, tileset.tileSize);
+        }
+
+        const chars = this.indexes.characters;
+        for (const [charType, charData] of Object.entries(chars.characters)) {
+            const animations = {};
+            for (const [direction, anim] of Object.entries(charData.animations)) {
+                animations[direction] = {
+                    frames: anim.frames.map((frame, i) => {
+                        const name = `${charType}_${direction}_${i}`;
+                        this.addSprite(name, this.images.characters,
+                            frame.x * chars.spriteWidth, frame.y * chars.spriteHeight,
+                            chars.spriteWidth, chars.spriteHeight);
+                        return name;
+                    })
+                };
+            }
+            this.characters[charType] = { animations };
+        }
+
+        this.creatures = {};
+        const creatures = this.indexes.creatures;
+        if (creatures) {
+            for (const [creatureId, variants] of Object.entries(creatures.creatures)) {
+                this.creatures[creatureId] = {};
+                for (const [variant, anim] of Object.entries(variants)) {
+                    const suffix = variant === 'enhanced' ? '_enhanced' : '';
+                    this.creatures[creatureId][variant] = {
+                        frames: anim.frames.map((frame, i) => {
+                            const name = `creature_${creatureId}${suffix}_${i}`;
+                            this.addSprite(name, this.images.creatures,
+                                frame.x * creatures.spriteSize, frame.y * creatures.spriteSize,
+                                creatures.spriteSize, creatures.spriteSize);
+                            return name;
+                        })
+                    };
+                }
+            }
+        }
+
+        this.addSprite('tree', this.images.tree, 0, 0, this.images.tree.width, this.images.tree.height);
+        this.addSprite('lighthouse', this.images.lighthouse, 0, 0,
+            this.images.lighthouse.width, this.images.lighthouse.height);
+    }
+
+    loadImage(src) {
+        return new Promise((resolve, reject) => {
+            const img = new Image();
+            img.onload = () => resolve(img);
+            img.onerror = reject;
+            img.src = src;
+        });
+    }
+
+    addSprite(name, image, x, y, w, h) {
+        this.sprites[name] = { image, x, y, w, h };
+    }
+
+    /**
+     * Handle for a sprite name, for drawHandle(). Handles can be taken before
+     * the sheets load; they start drawing once load() resolves them
+     * @returns {number}
+     */
+    getHandle(name) {
+        let handle = this.handles.get(name);
+        if (handle !== undefined) return handle;
+
+        handle = this.handleNames.length;
+        this.handles.set(name, handle);
+        this.handleNames.push(name);
+        this.handleImages.push(null);
+        if (this.rects.length < (handle + 1) * 4) {
+            const rects = new Uint16Array(this.rects.length * 2);
+            rects.set(this.rects);
+            this.rects = rects;
+        }
+        if (this.loaded) this.resolveHandle(handle, true);
+        return handle;
+    }
+
+    /**
+     * Point every handle at the loaded sheets, warning once per missing name
+     */
+    resolveHandles() {
+        this.creatureSprites.clear();
+        const missing = this.handleNames.filter((name, handle) => !this.resolveHandle(handle, false));
+        if (missing.length > 0) {
+            console.warn(`Sprites not found: ${missing.join(', ')}`);
+        }
+    }
+
+    resolveHandle(handle, warn) {
+        const name = this.handleNames[handle];
+        const sprite = this.sprites[name];
+        this.handleImages[handle] = sprite ? sprite.image : null;
+        if (!sprite) {
+            if (warn) console.warn(`Sprite not found: ${name}`);
+            return false;
+        }
+
+        const i = handle * 4;
+        this.rects[i] = sprite.x;
+        this.rects[i + 1] = sprite.y;
+        this.rects[i + 2] = sprite.w;
+        this.rects[i + 3] = sprite.h;
+        return true;
+    }
+
+    /**
+     * Draw a sprite by handle at (dx, dy), optionally scaled to (dw, dh).
+     * Sizes are in game pixels; high-DPI sheets are drawn at 1/scale.
+     * @returns {boolean} false if the sprite isn't loaded or doesn't exist
+     */
+    drawHandle(ctx, handle, dx, dy, dw, dh) {
+        const image = this.handleImages[handle];
+        if (!image) return false;
+
+        const rects = this.rects;
+        const i = handle * 4;
+        ctx.drawImage(
+            image,
+            rects[i], rects[i + 1], rects[i + 2], rects[i + 3],    // Source
+            dx, dy, dw ?? rects[i + 2] / this.scale, dh ?? rects[i + 3] / this.scale  // Destination
+        );
+        return true;
+    }
+
+    /**
+     * Draw a named sprite's source rect at (dx, dy), optionally scaled to (dw, dh).
+     * Sizes are in game pixels; high-DPI sheets are drawn at 1/scale.
+     * @returns {boolean} false if the sprite doesn't exist
+     */
+    drawSprite(ctx, name, dx, dy, dw, dh) {
+        return this.drawHandle(ctx, this.getHandle(name), dx, dy, dw, dh);
     }
 
     /**
@@ -63,21 +550,9 @@ class SpriteLoader {
     drawTile(ctx, tileName, dx, dy, size = 16) {
         if (!this.loaded) return;
 
-        const index = this.indexes.tileset;
-        const tile = index.tiles[tileName];
-        if (!tile) {
+        if (!this.drawSprite(ctx, tileName, dx, dy, size, size)) {
             console.warn(`Tile not found: ${tileName}`);
-            return;
         }
-
-        const sx = tile.x * index.tileSize;
-        const sy = tile.y * index.tileSize;
-
-        ctx.drawImage(
-            this.images.tileset,
-            sx, sy, index.tileSize, index.tileSize,  // Source
-            dx, dy, size, size                        // Destination
-        );
     }
 
     /**
@@ -90,43 +565,51 @@ class SpriteLoader {
      * @param {number} dy - Destination Y
      */
     drawCharacter(ctx, charType, direction, frame, dx, dy) {
-        if (!this.loaded) return;
-
-        const index = this.indexes.characters;
-        const charData = index.characters[charType];
-        if (!charData) {
-            console.warn(`Character type not found: ${charType}`);
-            return;
-        }
+        const handles = this.characterHandles(charType);
+        const index = DIRECTION_INDEX[direction];
+        if (index === undefined) return;
 
-        const anim = charData.animations[direction];
-        if (!anim) return;
+        this.drawCharacterHandle(ctx, handles[index * 2 + frame % 2], dx, dy);
+    }
 
-        const frameData = anim.frames[frame % 2];
-        const sx = frameData.x * index.spriteWidth;
-        const sy = frameData.y * index.spriteHeight;
+    /**
+     * Handles for a character's frames, at DIRECTION_INDEX[direction] * 2 + frame.
+     * Both loaders name character frames <charType>_<direction>_<frame>
+     * @returns {Uint16Array}
+     */
+    characterHandles(charType) {
+        let handles = this.characterSprites.get(charType);
+        if (!handles) {
+            handles = new Uint16Array(DIRECTIONS.length * 2);
+            DIRECTIONS.forEach((direction, index) => {
+                handles[index * 2] = this.getHandle(`${charType}_${direction}_0`);
+                handles[index * 2 + 1] = this.getHandle(`${charType}_${direction}_1`);
+            });
+            this.characterSprites.set(charType, handles);
+        }
+        return handles;
+    }
 
-        ctx.drawImage(
-            this.images.characters,
-            sx, sy, index.spriteWidth, index.spriteHeight,
-            dx, dy - 16, index.spriteWidth, index.spriteHeight  // -16 to center vertically on tile (24x32 chars)
-        );
+    /**
+     * Draw a character frame from characterHandles()
+     */
+    drawCharacterHandle(ctx, handle, dx, dy) {
+        // -16 to center vertically on tile (24x32 chars)
+        this.drawHandle(ctx, handle, dx, dy - 16);
     }
 
     /**
      * Draw tree (32x32, 2x2 tiles)
      */
     drawTree(ctx, dx, dy) {
-        if (!this.loaded) return;
-        ctx.drawImage(this.images.tree, dx, dy, 32, 32);
+        this.drawHandle(ctx, this.treeSprite, dx, dy, 32, 32);
     }
 
     /**
      * Draw lighthouse (48x80, 3x5 tiles)
      */
     drawLighthouse(ctx, dx, dy) {
-        if (!this.loaded) return;
-        ctx.drawImage(this.images.lighthouse, dx, dy, 48, 80);
+        this.drawHandle(ctx, this.lighthouseSprite, dx, dy, 48, 80);
     }
 
     /**
@@ -134,7 +617,14 @@ class SpriteLoader {
      */
     drawStore(ctx, dx, dy) {
         if (!this.loaded) return;
+        this.bitmaps.draw(ctx, `store@${this.scale}`, STORE_BOUNDS, this.scale, dx, dy,
+            layer => this.paintStore(layer, 0, 0));
+    }
 
+    /**
+     * Paint the store building as paths (see drawStore)
+     */
+    paintStore(ctx, dx, dy) {
         ctx.save();
 
         // Store building - simple shop structure
@@ -184,7 +674,14 @@ class SpriteLoader {
      */
     drawBoat(ctx, dx, dy) {
         if (!this.loaded) return;
+        this.bitmaps.draw(ctx, `boat@${this.scale}`, BOAT_BOUNDS, this.scale, dx, dy,
+            layer => this.paintBoat(layer, 0, 0));
+    }
 
+    /**
+     * Paint the boat as paths (see drawBoat)
+     */
+    paintBoat(ctx, dx, dy) {
         ctx.save();
 
         // Boat hull (brown wood)
@@ -238,7 +735,14 @@ class SpriteLoader {
      */
     drawRock(ctx, dx, dy) {
         if (!this.loaded) return;
+        this.bitmaps.draw(ctx, `rock@${this.scale}`, ROCK_BOUNDS, this.scale, dx, dy,
+            layer => this.paintRock(layer, 0, 0));
+    }
 
+    /**
+     * Paint the rock as paths (see drawRock)
+     */
+    paintRock(ctx, dx, dy) {
         ctx.save();
 
         // Draw a simple rock with shading
@@ -267,7 +771,14 @@ class SpriteLoader {
      */
     drawTallGrass(ctx, dx, dy) {
         if (!this.loaded) return;
+        this.bitmaps.draw(ctx, `tallgrass@${this.scale}`, TALL_GRASS_BOUNDS, this.scale, dx, dy,
+            layer => this.paintTallGrass(layer, 0, 0));
+    }
 
+    /**
+     * Paint the tall grass as paths (see drawTallGrass)
+     */
+    paintTallGrass(ctx, dx, dy) {
         ctx.save();
 
         // Draw several grass blades
@@ -321,6 +832,23 @@ class SpriteLoader {
         }
     }
 
+    /**
+     * Get current creature idle animation frame
+     */
+    getCreatureFrame() {
+        return this.creatureFrame;
+    }
+
+    /**
+     * Update creature idle animation
+     */
+    updateCreatureAnimation(timestamp) {
+        if (timestamp - this.lastCreatureUpdate > 400) {  // 400ms per frame
+            this.creatureFrame = (this.creatureFrame + 1) % 2;
+            this.lastCreatureUpdate = timestamp;
+        }
+    }
+
     /**
      * Get a tile variant deterministically based on position
      */
@@ -330,128 +858,99 @@ class SpriteLoader {
     }
 
     /**
-     * Draw creature sprite programmatically
-     * NOTE: Using programmatic pixel art instead of emoji for important game moments
+     * TILE_NAMES index of getTileVariant's tile, or NO_TILE if the tileset
+     * has no such tile
+     */
+    getTileVariantIndex(baseName, x, y, variantCount) {
+        const index = TILE_INDEX[this.getTileVariant(baseName, x, y, variantCount)];
+        return index === undefined ? NO_TILE : index;
+    }
+
+    /**
+     * Draw creature sprite (16x16)
+     * Blits the pre-baked creature frame when sprites are loaded, otherwise
+     * falls back to drawing the pixel art programmatically.
      * @param {CanvasRenderingContext2D} ctx - Canvas context
      * @param {string} creatureId - Creature ID ('lumina', etc)
      * @param {number} dx - Destination X
      * @param {number} dy - Destination Y
      * @param {boolean} enhanced - Draw enhanced/cute version for special moments
+     * @param {number} frame - Idle animation frame (see getCreatureFrame)
      */
-    drawCreature(ctx, creatureId, dx, dy, enhanced = false) {
+    drawCreature(ctx, creatureId, dx, dy, enhanced = false, frame = 0) {
+        const sprites = this.creatureHandles(creatureId);
+        if (sprites) {
+            const frames = enhanced ? sprites.enhanced : sprites.normal;
+            this.drawHandle(ctx, frames[frame % frames.length], dx, dy);
+            return;
+        }
+
+        const key = `creature:${creatureId}:${enhanced ? 'enhanced' : 'normal'}@${this.scale}`;
+        this.bitmaps.draw(ctx, key, CREATURE_BOUNDS, this.scale, dx, dy,
+            layer => this.drawCreatureProgrammatic(layer, creatureId, 0, 0, enhanced));
+    }
+
+    /**
+     * Frame handles for a creature's normal and enhanced idle animations,
+     * or null if the creature sheet has no such creature (or isn't loaded)
+     */
+    creatureHandles(creatureId) {
+        if (!this.loaded) return null;
+
+        let sprites = this.creatureSprites.get(creatureId);
+        if (sprites === undefined) {
+            const creature = this.creatures[creatureId];
+            const frames = variant => Uint16Array.from(variant.frames, name => this.getHandle(name));
+            sprites = creature ? { normal: frames(creature.normal), enhanced: frames(creature.enhanced) } : null;
+            this.creatureSprites.set(creatureId, sprites);
+        }
+        return sprites;
+    }
+
+    /**
+     * Draw creature sprite programmatically from CREATURE_ART, as
+     * create_creature_sprite does (idle frame 0); only used when the creature
+     * sheet isn't available, and then cached by drawCreature
+     */
+    drawCreatureProgrammatic(ctx, creatureId, dx, dy, enhanced = false) {
+        const art = CREATURE_ART[creatureId];
+        if (!art) return;
+
+        const derived = enhanced && !art.enhanced;
+        const rects = enhanced && art.enhanced ? art.enhanced : art.normal;
         ctx.save();
 
-        if (creatureId === 'lumina') {
-            if (enhanced) {
-                // CUTE ENHANCED VERSION - For naming/bonding moments
-                // Cleaner sprite: healed wings, brighter colors, bigger eyes, vibrant glow
-
-                // Enhanced glow aura (bright cyan) - larger and more vibrant
-                ctx.fillStyle = 'rgba(0, 255, 255, 0.7)';
-                this.drawPixel(ctx, dx + 4, dy + 4, 8, 8);  // Brighter cyan glow
-
-                // Moth body (warm brown, slightly larger)
-                ctx.fillStyle = '#8B6F47';
-                this.drawPixel(ctx, dx + 7, dy + 6, 2, 4);  // Body center
-
-                // Left wing (HEALED - now symmetrical!) - vibrant purple
-                ctx.fillStyle = '#BA55D3';  // Brighter medium orchid
-                this.drawPixel(ctx, dx + 3, dy + 5, 4, 4);  // Wing base
-
-                // Left wing cyan glow spots (larger for visibility when scaled)
-                ctx.fillStyle = '#00FFFF';  // Bright cyan
-                this.drawPixel(ctx, dx + 4, dy + 6, 2, 2);  // Main glow spot
-                ctx.fillStyle = '#48D1CC';  // Medium turquoise
-                this.drawPixel(ctx, dx + 5, dy + 7, 1, 1);  // Secondary spot
-
-                // Right wing (healthy - spread) - vibrant purple
-                ctx.fillStyle = '#BA55D3';  // Brighter medium orchid
-                this.drawPixel(ctx, dx + 9, dy + 5, 4, 4);  // Wing base
-
-                // Right wing cyan glow spots (larger for visibility when scaled)
-                ctx.fillStyle = '#00FFFF';  // Bright cyan
-                this.drawPixel(ctx, dx + 10, dy + 6, 2, 2);  // Main glow spot
-                ctx.fillStyle = '#48D1CC';  // Medium turquoise
-                this.drawPixel(ctx, dx + 10, dy + 7, 1, 1);  // Secondary spot
-
-                // Wing edge highlights (bright white for definition)
-                ctx.fillStyle = '#FFFFFF';
-                this.drawPixel(ctx, dx + 3, dy + 5, 1, 1);  // Left wing edge
-                this.drawPixel(ctx, dx + 12, dy + 5, 1, 1);  // Right wing edge
-
-                // Head (warm brown)
-                ctx.fillStyle = '#6F4E37';
-                this.drawPixel(ctx, dx + 7, dy + 5, 2, 1);  // Head
-
-                // Antennae with glowing tips
-                ctx.fillStyle = '#3E2723';  // Dark brown
-                this.drawPixel(ctx, dx + 6, dy + 4, 1, 1);  // Left antenna
-                this.drawPixel(ctx, dx + 9, dy + 4, 1, 1);  // Right antenna
-                ctx.fillStyle = '#FFD700';  // Gold glowing tips
-                this.drawPixel(ctx, dx + 6, dy + 3, 1, 1);
-                this.drawPixel(ctx, dx + 9, dy + 3, 1, 1);
-
-                // Bigger, brighter eyes for cuteness!
-                ctx.fillStyle = '#FFFF00';  // Bright yellow eyes
-                this.drawPixel(ctx, dx + 7, dy + 5, 1, 1);
-                this.drawPixel(ctx, dx + 8, dy + 5, 1, 1);
-                // White highlight for sparkle
-                ctx.fillStyle = '#FFFFFF';
-                this.drawPixel(ctx, dx + 7, dy + 5, 1, 1);
-                this.drawPixel(ctx, dx + 8, dy + 5, 1, 1);
-
-            } else {
-                // ORIGINAL VERSION - Wounded moth for regular encounters
-                // Lumina - A wounded glowing moth with pixel art detail
-                // Draw as 16x16 pixel art sprite with enhanced visibility
-
-                // Shadow for depth (darker outline underneath)
-                ctx.fillStyle = 'rgba(0, 0, 0, 0.3)';
-                this.drawPixel(ctx, dx + 3, dy + 10, 11, 1);  // Shadow under creature
-
-                // Glow aura (bright cyan/teal) - draw first so it's behind
-                ctx.fillStyle = 'rgba(0, 255, 255, 0.4)';
-                this.drawPixel(ctx, dx + 5, dy + 5, 6, 6);  // Cyan glow
-
-                // Moth body (rich dark brown for contrast)
-                ctx.fillStyle = '#5D4E37';
-                this.drawPixel(ctx, dx + 7, dy + 6, 2, 4);  // Body center
-
-                // Left wing (damaged - folded/broken) - deeper purple/violet
-                ctx.fillStyle = '#9370DB';  // Medium purple
-                this.drawPixel(ctx, dx + 3, dy + 6, 3, 3);  // Wing base
-                ctx.fillStyle = '#00CED1';  // Dark turquoise - glowing accent
-                this.drawPixel(ctx, dx + 4, dy + 7, 1, 1);  // Wing spot
-
-                // Right wing (healthy - spread) - vibrant purple with cyan accents
-                ctx.fillStyle = '#9370DB';  // Medium purple
-                this.drawPixel(ctx, dx + 10, dy + 5, 4, 4);  // Wing
-                ctx.fillStyle = '#00CED1';  // Dark turquoise - glowing accent
-                this.drawPixel(ctx, dx + 11, dy + 6, 2, 2);  // Wing spot
-                ctx.fillStyle = '#48D1CC';  // Medium turquoise
-                this.drawPixel(ctx, dx + 12, dy + 7, 1, 1);  // Detail
-
-                // Wing highlights (bright cyan for glow effect)
-                ctx.fillStyle = '#00FFFF';  // Bright cyan
-                this.drawPixel(ctx, dx + 5, dy + 7, 1, 1);  // Left wing glow
-                this.drawPixel(ctx, dx + 11, dy + 7, 1, 1);  // Right wing glow
-
-                // Head (dark brown)
-                ctx.fillStyle = '#3E2723';
-                this.drawPixel(ctx, dx + 7, dy + 5, 2, 1);  // Head
-
-                // Antennae (very dark brown)
-                ctx.fillStyle = '#1A1A1A';
-                this.drawPixel(ctx, dx + 7, dy + 4, 1, 1);
-                this.drawPixel(ctx, dx + 8, dy + 4, 1, 1);
-
-                // Eye spots (bright to show life)
-                ctx.fillStyle = '#FFFF00';  // Yellow eyes
-                this.drawPixel(ctx, dx + 7, dy + 5, 1, 1);
-                this.drawPixel(ctx, dx + 8, dy + 5, 1, 1);
+        if (!enhanced) {
+            ctx.fillStyle = creatureColor(CREATURE_SHADOW);
+            (art.shadow || []).forEach(([x, y, w, h]) => this.drawPixel(ctx, dx + x, dy + y, w, h));
+        }
+
+        if (derived) {
+            // 1px glow on the pixels next to the art, never under it, so
+            // translucent parts don't show glow through them. Only touches
+            // those pixels: with no offscreen canvas this draws on the scene
+            const covered = new Set();
+            rects.forEach(([, x, y, w, h]) => {
+                for (let py = y; py < y + h; py++) {
+                    for (let px = x; px < x + w; px++) covered.add(`${px},${py}`);
+                }
+            });
+            const next = (x, y) => covered.has(`${x - 1},${y}`) || covered.has(`${x + 1},${y}`) ||
+                covered.has(`${x},${y - 1}`) || covered.has(`${x},${y + 1}`);
+
+            ctx.fillStyle = creatureColor(CREATURE_GLOW);
+            for (let y = 0; y < CREATURE_BOUNDS.h; y++) {
+                for (let x = 0; x < CREATURE_BOUNDS.w; x++) {
+                    if (!covered.has(`${x},${y}`) && next(x, y)) this.drawPixel(ctx, dx + x, dy + y, 1, 1);
+                }
             }
         }
 
+        rects.forEach(([color, x, y, w, h]) => {
+            ctx.fillStyle = creatureColor(color, derived ? 1.2 : 1);
+            this.drawPixel(ctx, dx + x, dy + y, w, h);
+        });
+
         ctx.restore();
     }
 
@@ -0,0 +1,145 @@
+/**
+ * Trigger Zones - Areas of the map that react to the player
+ * Quest objectives, scripted encounters and region exits register their
+ * areas here. Zones are bucketed by tile, so a step only looks at the zones
+ * on the tile it lands on, however many are registered
+ */
+
+class TriggerZones {
+    /**
+     * @param {number} width - Map width in tiles
+     * @param {number} height - Map height in tiles
+     */
+    constructor(width, height) {
+        this.width = width;
+        this.height = height;
+        this.zones = new Map();     // id -> zone
+        this.buckets = new Map();   // tile index -> zones covering it
+        this.occupied = new Set();  // zones the player is standing in
+    }
+
+    /**
+     * Register a zone, replacing any zone with the same id. A zone is a
+     * rectangle { x, y, width, height } or a circle { x, y, radius } (tiles
+     * within radius of the center tile), in tiles, plus an id and optional
+     * onEnter(context, zone) / onExit(context, zone) callbacks. onEnter may
+     * run again while the player stays inside (see refresh), so it should
+     * check the game state it depends on
+     * @returns {Object} The zone
+     */
+    add(zone) {
+        this.remove(zone.id);
+
+        zone.tiles = this.zoneTiles(zone);
+        for (const tile of zone.tiles) {
+            let bucket = this.buckets.get(tile);
+            if (!bucket) {
+                bucket = [];
+                this.buckets.set(tile, bucket);
+            }
+            bucket.push(zone);
+        }
+        this.zones.set(zone.id, zone);
+        return zone;
+    }
+
+    /**
+     * Unregister a zone. No exit event fires, even if the player is inside
+     * @returns {boolean} false if there was no such zone
+     */
+    remove(id) {
+        const zone = this.zones.get(id);
+        if (!zone) return false;
+
+        for (const tile of zone.tiles) {
+            const bucket = this.buckets.get(tile);
+            bucket.splice(bucket.indexOf(zone), 1);
+            if (bucket.length === 0) this.buckets.delete(tile);
+        }
+        this.zones.delete(id);
+        this.occupied.delete(zone);
+        return true;
+    }
+
+    /**
+     * In-bounds tile indices a zone covers
+     */
+    zoneTiles(zone) {
+        const tiles = [];
+        const isCircle = zone.radius !== undefined;
+        const reach = isCircle ? Math.floor(zone.radius) : 0;
+        const x0 = Math.max(0, isCircle ? zone.x - reach : zone.x);
+        const y0 = Math.max(0, isCircle ? zone.y - reach : zone.y);
+        const x1 = Math.min(this.width, isCircle ? zone.x + reach + 1 : zone.x + zone.width);
+        const y1 = Math.min(this.height, isCircle ? zone.y + reach + 1 : zone.y + zone.height);
+
+        for (let y = y0; y < y1; y++) {
+            for (let x = x0; x < x1; x++) {
+                const dx = x - zone.x;
+                const dy = y - zone.y;
+                if (!isCircle || dx * dx + dy * dy <= zone.radius * zone.radius) {
+                    tiles.push(y * this.width + x);
+                }
+            }
+        }
+        return tiles;
+    }
+
+    /**
+     * Zones covering a tile
+     */
+    zonesAt(x, y) {
+        if (x < 0 || x >= this.width || y < 0 || y >= this.height) return [];
+        return this.buckets.get(y * this.width + x) || [];
+    }
+
+    /**
+     * True if the zone with this id covers the tile
+     */
+    contains(id, x, y) {
+        return this.zonesAt(x, y).some(zone => zone.id === id);
+    }
+
+    /**
+     * Move the player to a tile: fire onExit for zones they left, then
+     * onEnter for zones they entered. Only the zones they were in and the
+     * zones on the new tile are looked at
+     */
+    moveTo(x, y, context) {
+        const here = this.zonesAt(x, y);
+
+        for (const zone of [...this.occupied]) {
+            if (!here.includes(zone)) {
+                this.occupied.delete(zone);
+                if (zone.onExit) zone.onExit(context, zone);
+            }
+        }
+
+        // Copy: callbacks may add or remove zones
+        for (const zone of [...here]) {
+            if (!this.occupied.has(zone) && this.zones.get(zone.id) === zone) {
+                this.occupied.add(zone);
+                if (zone.onEnter) zone.onEnter(context, zone);
+            }
+        }
+    }
+
+    /**
+     * Re-check the player's tile after game state the zones depend on (the
+     * plot phase) changed without a step: like moveTo, and zones the player
+     * was already in get onEnter again
+     */
+    refresh(x, y, context) {
+        const stayed = this.zonesAt(x, y).filter(zone => this.occupied.has(zone));
+        this.moveTo(x, y, context);
+
+        for (const zone of stayed) {
+            if (zone.onEnter && this.zones.get(zone.id) === zone) zone.onEnter(context, zone);
+        }
+    }
+}
+
+// Export for Node.js (testing) and browser (game)
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = TriggerZones;
+}
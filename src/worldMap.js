@@ -0,0 +1,375 @@
+/**
+ * World Map - Chunked map store, occupancy grid and camera
+ * Splits the map into fixed-size chunks so rendering only visits the tiles
+ * and objects around the viewport, however large the world grows, and
+ * indexes objects by the tiles they stand on for collision and interaction
+ */
+
+// Tiles per chunk side
+const CHUNK_SIZE = 16;
+
+// Terrain IDs stored in WorldMap.terrain, and the names MAP_DATA.ground and
+// creature habitats use for them
+const TERRAIN = { WATER: 0, SAND: 1, GRASS: 2, CAVE: 3 };
+const TERRAIN_NAMES = ['water', 'sand', 'grass', 'cave'];
+const TERRAIN_IDS = Object.fromEntries(TERRAIN_NAMES.map((name, id) => [name, id]));
+
+// Tileset variants for each terrain, picked per tile by position. Water
+// resolves to water_0 and the renderer adds the animation frame
+const TERRAIN_TILES = {
+    [TERRAIN.WATER]: { base: 'water', variants: 1 },
+    [TERRAIN.SAND]: { base: 'sand', variants: 3 },
+    [TERRAIN.GRASS]: { base: 'grass', variants: 4 }
+};
+
+// Tiles an object's sprite covers from its (x, y) anchor, for culling.
+// Objects not listed cover one tile unless they set width/height
+// (the lighthouse). Characters are 24x32, drawn 16px above their tile
+const OBJECT_SPRITE_EXTENTS = {
+    tree: { w: 2, h: 2, up: 0 },
+    store: { w: 2, h: 2, up: 0 },
+    boat: { w: 3, h: 2, up: 0 },
+    npc: { w: 2, h: 2, up: 1 }
+};
+
+// Tiles an object stands on, for collision and interaction. Objects not
+// listed stand on one tile unless they set width/height (the lighthouse)
+const OBJECT_FOOTPRINTS = {
+    tree: { w: 2, h: 2 },
+    store: { w: 2, h: 2 },
+    boat: { w: 3, h: 2 }
+};
+
+// Always block movement. Creatures block only in some plot phases, so
+// game.canMoveTo checks them through objectsAt() instead
+const BLOCKING_TYPES = new Set(['lighthouse', 'tree', 'store', 'boat', 'rock', 'npc']);
+
+// Found by objectsAt(), for interaction and conditional collision
+const INTERACTIVE_TYPES = new Set(['creature', 'npc', 'store', 'boat']);
+
+const NO_OBJECTS = Object.freeze([]);
+
+class WorldMap {
+    /**
+     * @param {Object} data - Map in the MAP_DATA shape: width, height,
+     *     tileSize, flat ground array of terrain names and objects list
+     */
+    constructor(data, chunkSize = CHUNK_SIZE) {
+        this.width = data.width;
+        this.height = data.height;
+        this.tileSize = data.tileSize;
+        this.objects = data.objects;
+
+        // Ground as one byte per tile, and the tileset sprite handle each one
+        // draws with, resolved once here rather than per frame
+        const tileCount = this.width * this.height;
+        this.terrain = new Uint8Array(tileCount);
+        this.tiles = new Uint16Array(tileCount);
+        data.ground.forEach((name, index) => {
+            const id = TERRAIN_IDS[name];
+            if (id === undefined) {
+                throw new Error(`Unknown terrain '${name}' at tile ${index}`);
+            }
+            this.terrain[index] = id;
+            this.tiles[index] = this.resolveTile(id, index % this.width, Math.floor(index / this.width));
+        });
+
+        this.chunkSize = chunkSize;
+        this.chunksX = Math.ceil(this.width / chunkSize);
+        this.chunksY = Math.ceil(this.height / chunkSize);
+        this.chunks = new Map();    // "cx,cy" -> chunk, filled by loadChunk on first use
+
+        // Objects per chunk, for every chunk an object's sprite overlaps
+        this.chunkObjects = new Map();
+        this.drawOrder = new Map();     // object -> sequence number, so culled objects draw in map order
+        this.nextOrder = 0;
+        this.queryObjects = [];         // reused by objectsInRect
+
+        // Per-tile occupancy, so collision, terrain and interaction lookups
+        // don't scan every object. Counts allow overlapping footprints
+        this.blocking = new Uint8Array(tileCount);      // blocking objects on each tile
+        this.tallGrass = new Uint8Array(tileCount);     // tallgrass objects on each tile
+        this.occupants = new Array(tileCount).fill(null);   // interactive objects on each tile, in map order
+
+        this.version = 0;   // bumped whenever objects change, so the renderer repaints
+        this.objects.forEach(obj => this.indexObject(obj));
+    }
+
+    /**
+     * Sprite handle (a TILE_NAMES index, see spriteLoader.js) a tile of this
+     * terrain draws with
+     */
+    resolveTile(terrainId, x, y) {
+        const tiles = TERRAIN_TILES[terrainId];
+        if (!tiles) return NO_TILE;
+        return spriteLoader.getTileVariantIndex(tiles.base, x, y, tiles.variants);
+    }
+
+    /**
+     * Add an object to the map, keeping the chunk and occupancy indexes current
+     */
+    addObject(obj) {
+        this.objects.push(obj);
+        this.indexObject(obj);
+        this.version++;
+    }
+
+    /**
+     * Remove an object added to the map; returns false if it wasn't there
+     */
+    removeObject(obj) {
+        const index = this.objects.indexOf(obj);
+        if (index === -1) return false;
+
+        this.objects.splice(index, 1);
+        this.forEachChunkOf(obj, bucket => bucket.splice(bucket.indexOf(obj), 1));
+        this.forEachFootprintTile(obj, tile => {
+            if (BLOCKING_TYPES.has(obj.type)) this.blocking[tile]--;
+            if (obj.type === 'tallgrass') this.tallGrass[tile]--;
+            if (INTERACTIVE_TYPES.has(obj.type)) {
+                const occupants = this.occupants[tile];
+                occupants.splice(occupants.indexOf(obj), 1);
+                if (occupants.length === 0) this.occupants[tile] = null;
+            }
+        });
+        this.drawOrder.delete(obj);
+        this.version++;
+        return true;
+    }
+
+    indexObject(obj) {
+        this.drawOrder.set(obj, this.nextOrder++);
+        this.forEachChunkOf(obj, bucket => bucket.push(obj));
+        this.forEachFootprintTile(obj, tile => {
+            if (BLOCKING_TYPES.has(obj.type)) this.blocking[tile]++;
+            if (obj.type === 'tallgrass') this.tallGrass[tile]++;
+            if (INTERACTIVE_TYPES.has(obj.type)) {
+                if (!this.occupants[tile]) this.occupants[tile] = [];
+                this.occupants[tile].push(obj);
+            }
+        });
+    }
+
+    /**
+     * Call fn(tileIndex) for each in-bounds tile an object stands on
+     */
+    forEachFootprintTile(obj, fn) {
+        const footprint = OBJECT_FOOTPRINTS[obj.type];
+        const w = obj.width || (footprint ? footprint.w : 1);
+        const h = obj.height || (footprint ? footprint.h : 1);
+        const x0 = Math.max(0, obj.x);
+        const y0 = Math.max(0, obj.y);
+        const x1 = Math.min(this.width, obj.x + w);
+        const y1 = Math.min(this.height, obj.y + h);
+
+        for (let y = y0; y < y1; y++) {
+            for (let x = x0; x < x1; x++) {
+                fn(y * this.width + x);
+            }
+        }
+    }
+
+    inBounds(x, y) {
+        return x >= 0 && x < this.width && y >= 0 && y < this.height;
+    }
+
+    /**
+     * Ground terrain name at a tile ('water', 'sand', 'grass', ...)
+     */
+    terrainAt(x, y) {
+        return TERRAIN_NAMES[this.terrain[y * this.width + x]];
+    }
+
+    isWater(x, y) {
+        return this.terrain[y * this.width + x] === TERRAIN.WATER;
+    }
+
+    /**
+     * True if a lighthouse, tree, store, boat, rock or NPC stands on the tile
+     */
+    isBlocked(x, y) {
+        return this.inBounds(x, y) && this.blocking[y * this.width + x] > 0;
+    }
+
+    hasTallGrass(x, y) {
+        return this.inBounds(x, y) && this.tallGrass[y * this.width + x] > 0;
+    }
+
+    /**
+     * Creatures, NPCs, stores and boats standing on a tile, in map order
+     */
+    objectsAt(x, y) {
+        if (!this.inBounds(x, y)) return NO_OBJECTS;
+        return this.occupants[y * this.width + x] || NO_OBJECTS;
+    }
+
+    /**
+     * Tile rect [x0, x1) x [y0, y1) an object's sprite covers
+     */
+    objectExtent(obj) {
+        const extent = OBJECT_SPRITE_EXTENTS[obj.type];
+        const w = obj.width || (extent ? extent.w : 1);
+        const h = obj.height || (extent ? extent.h : 1);
+        const up = extent ? extent.up : 0;
+        return { x0: obj.x, y0: obj.y - up, x1: obj.x + w, y1: obj.y - up + h };
+    }
+
+    /**
+     * Call fn(bucket) with the object list of every chunk the object's
+     * sprite overlaps
+     */
+    forEachChunkOf(obj, fn) {
+        const { x0, y0, x1, y1 } = this.objectExtent(obj);
+        const size = this.chunkSize;
+        for (let cy = Math.floor(y0 / size); cy <= Math.floor((y1 - 1) / size); cy++) {
+            for (let cx = Math.floor(x0 / size); cx <= Math.floor((x1 - 1) / size); cx++) {
+                fn(this.chunkBucket(cx, cy));
+            }
+        }
+    }
+
+    chunkBucket(cx, cy) {
+        const key = `${cx},${cy}`;
+        let bucket = this.chunkObjects.get(key);
+        if (!bucket) {
+            bucket = [];
+            this.chunkObjects.set(key, bucket);
+        }
+        return bucket;
+    }
+
+    /**
+     * The chunk at chunk coordinates (cx, cy), loading it on first use,
+     * or null outside the map
+     */
+    getChunk(cx, cy) {
+        if (cx < 0 || cy < 0 || cx >= this.chunksX || cy >= this.chunksY) return null;
+
+        const key = `${cx},${cy}`;
+        let chunk = this.chunks.get(key);
+        if (!chunk) {
+            chunk = this.loadChunk(cx, cy);
+            this.chunks.set(key, chunk);
+        }
+        return chunk;
+    }
+
+    /**
+     * Build a chunk from the map data. This is the one place that would
+     * change to stream regions in from separate files
+     */
+    loadChunk(cx, cy) {
+        const x = cx * this.chunkSize;
+        const y = cy * this.chunkSize;
+        const w = Math.min(this.chunkSize, this.width - x);
+        const h = Math.min(this.chunkSize, this.height - y);
+
+        let hasWater = false;
+        for (let ty = y; ty < y + h && !hasWater; ty++) {
+            for (let tx = x; tx < x + w; tx++) {
+                if (this.terrain[ty * this.width + tx] === TERRAIN.WATER) {
+                    hasWater = true;
+                    break;
+                }
+            }
+        }
+
+        return {
+            cx, cy, x, y, w, h,
+            hasWater,   // Only chunks with water change with the water frame
+            objects: this.chunkBucket(cx, cy)     // shared, so later object changes show up
+        };
+    }
+
+    /**
+     * Call fn(chunk) for every chunk overlapping the tile rect [x0, x1) x [y0, y1)
+     */
+    forEachChunkInRect(x0, y0, x1, y1, fn) {
+        const size = this.chunkSize;
+        const cx0 = Math.max(0, Math.floor(x0 / size));
+        const cy0 = Math.max(0, Math.floor(y0 / size));
+        const cx1 = Math.min(this.chunksX - 1, Math.floor((x1 - 1) / size));
+        const cy1 = Math.min(this.chunksY - 1, Math.floor((y1 - 1) / size));
+
+        for (let cy = cy0; cy <= cy1; cy++) {
+            for (let cx = cx0; cx <= cx1; cx++) {
+                fn(this.getChunk(cx, cy));
+            }
+        }
+    }
+
+    /**
+     * Objects whose sprites overlap the tile rect, in map.objects order so
+     * they still draw back to front
+     */
+    objectsInRect(x0, y0, x1, y1, out = []) {
+        const found = this.queryObjects;
+        found.length = 0;
+        this.forEachChunkInRect(x0, y0, x1, y1, chunk => {
+            for (const obj of chunk.objects) found.push(obj);
+        });
+        found.sort((a, b) => this.drawOrder.get(a) - this.drawOrder.get(b));
+
+        out.length = 0;
+        for (let i = 0; i < found.length; i++) {
+            // Objects spanning chunks are listed once per chunk
+            if (i > 0 && found[i] === found[i - 1]) continue;
+
+            const obj = found[i];
+            const extent = this.objectExtent(obj);
+            if (extent.x0 < x1 && extent.x1 > x0 && extent.y0 < y1 && extent.y1 > y0) {
+                out.push(obj);
+            }
+        }
+        return out;
+    }
+}
+
+class Camera {
+    /**
+     * @param {number} width - Viewport width in game pixels
+     * @param {number} height - Viewport height in game pixels
+     */
+    constructor(width, height) {
+        this.x = 0;     // Top-left of the viewport in world pixels
+        this.y = 0;
+        this.width = width;
+        this.height = height;
+    }
+
+    /**
+     * Center on a world position, clamped so the viewport stays inside the
+     * map (a map smaller than the viewport is centered instead).
+     * Returns true if the camera moved
+     */
+    follow(worldX, worldY, mapWidth, mapHeight) {
+        const x = this.clampAxis(worldX - this.width / 2, mapWidth, this.width);
+        const y = this.clampAxis(worldY - this.height / 2, mapHeight, this.height);
+        const moved = x !== this.x || y !== this.y;
+        this.x = x;
+        this.y = y;
+        return moved;
+    }
+
+    clampAxis(position, mapSize, viewSize) {
+        if (mapSize <= viewSize) return Math.round((mapSize - viewSize) / 2);
+        return Math.round(Math.min(Math.max(position, 0), mapSize - viewSize));
+    }
+
+    /**
+     * Visible tile rect [x0, x1) x [y0, y1), not clamped to the map
+     */
+    tileBounds(tileSize) {
+        return {
+            x0: Math.floor(this.x / tileSize),
+            y0: Math.floor(this.y / tileSize),
+            x1: Math.ceil((this.x + this.width) / tileSize),
+            y1: Math.ceil((this.y + this.height) / tileSize)
+        };
+    }
+}
+
+// Export for Node.js (testing) and browser (game)
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { WorldMap, Camera, CHUNK_SIZE, TERRAIN, TERRAIN_NAMES };
+}
@@ -132,6 +132,8 @@ const scripts = [
     'src/questSystem.js',
     'src/dialogueQueueSystem.js',
     'src/inputRouter.js',
+    'src/worldMap.js',
+    'src/triggerZones.js',
     'src/renderingSystem.js',
     'src/game.js'
 ];
@@ -0,0 +1,214 @@
+/**
+ * Creature Sprite Fallback Tests
+ * Validates that drawCreatureProgrammatic (used when the creature sheet
+ * isn't loaded) draws every creature in both variants, including the
+ * brightened, outlined enhanced art derived for creatures without their own
+ */
+
+const { CREATURES, CREATURE_ART, spriteLoader } = require('./loadGameData.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+const SIZE = 16;
+const GLOW = [255, 250, 205];
+
+/**
+ * Square RGBA canvas stand-in (alpha 0-1) that blends fillRect like a 2D
+ * context does for source-over and destination-out, with translate()
+ */
+function createLayer(size = SIZE) {
+    const pixels = Array.from({ length: size * size }, () => [0, 0, 0, 0]);
+    const saved = [];
+    return {
+        pixels,
+        fillStyle: null,
+        globalCompositeOperation: 'source-over',
+        origin: [0, 0],
+        save() { saved.push([this.globalCompositeOperation, this.origin]); },
+        restore() { [this.globalCompositeOperation, this.origin] = saved.pop(); },
+        translate(x, y) { this.origin = [this.origin[0] + x, this.origin[1] + y]; },
+        fillRect(x, y, w, h) {
+            const [r, g, b, a] = this.fillStyle.match(/[\d.]+/g).map(Number);
+            x += this.origin[0];
+            y += this.origin[1];
+            for (let py = Math.max(0, y); py < Math.min(size, y + h); py++) {
+                for (let px = Math.max(0, x); px < Math.min(size, x + w); px++) {
+                    const p = pixels[py * size + px];
+                    if (this.globalCompositeOperation === 'destination-out') {
+                        p[3] *= 1 - a;
+                        continue;
+                    }
+                    const alpha = a + p[3] * (1 - a);
+                    [r, g, b].forEach((c, i) => { p[i] = (c * a + p[i] * p[3] * (1 - a)) / alpha; });
+                    p[3] = alpha;
+                }
+            }
+        }
+    };
+}
+
+function paint(creatureId, enhanced) {
+    const layer = createLayer();
+    spriteLoader.drawCreatureProgrammatic(layer, creatureId, 0, 0, enhanced);
+    return layer.pixels;
+}
+
+/**
+ * Pixels covered by a list of CREATURE_ART rects
+ */
+function footprint(rects) {
+    const covered = new Set();
+    rects.forEach(([, x, y, w, h]) => {
+        for (let py = y; py < y + h; py++) {
+            for (let px = x; px < x + w; px++) covered.add(py * SIZE + px);
+        }
+    });
+    return covered;
+}
+
+/**
+ * Whether a pixel outside `covered` is next to it (up, down, left or right)
+ */
+function touches(covered, index) {
+    const x = index % SIZE;
+    const y = Math.floor(index / SIZE);
+    return [[x - 1, y], [x + 1, y], [x, y - 1], [x, y + 1]].some(([nx, ny]) =>
+        nx >= 0 && nx < SIZE && ny >= 0 && ny < SIZE && covered.has(ny * SIZE + nx));
+}
+
+console.log('Testing creature sprite fallback...\n');
+
+test('Every creature has art the fallback can draw', () => {
+    Object.keys(CREATURES).forEach(creatureId => {
+        assert(CREATURE_ART[creatureId], `No CREATURE_ART for ${creatureId}`);
+        [false, true].forEach(enhanced => {
+            const opaque = paint(creatureId, enhanced).filter(p => p[3] === 1).length;
+            assert(opaque > 0, `${creatureId} (${enhanced ? 'enhanced' : 'normal'}) draws nothing`);
+        });
+    });
+});
+
+test('Unknown creatures draw nothing', () => {
+    assert(paint('missingno', false).every(p => p[3] === 0), 'Unknown creature should leave the layer empty');
+});
+
+test('Normal art draws its shadow; enhanced art does not', () => {
+    Object.entries(CREATURE_ART).forEach(([creatureId, art]) => {
+        const normal = paint(creatureId, false);
+        const enhanced = paint(creatureId, true);
+        const drawn = footprint(art.enhanced || art.normal);
+        footprint(art.shadow.map(rect => [null, ...rect])).forEach(index => {
+            const at = `${index % SIZE},${Math.floor(index / SIZE)}`;
+            assert(normal[index][3] > 0, `${creatureId} shadow missing at ${at}`);
+            if (!drawn.has(index) && !touches(drawn, index)) {
+                assert(enhanced[index][3] === 0, `${creatureId} enhanced should have no shadow at ${at}`);
+            }
+        });
+    });
+});
+
+test('Derived enhanced art is outlined with the glow, never under the art', () => {
+    Object.entries(CREATURE_ART).forEach(([creatureId, art]) => {
+        if (art.enhanced) return;
+        const pixels = paint(creatureId, true);
+        const covered = footprint(art.normal);
+        const artOnly = createLayer();
+        art.normal.forEach(([color, x, y, w, h]) => {
+            artOnly.fillStyle = `rgba(0, 0, 0, ${(color[3] === undefined ? 255 : color[3]) / 255})`;
+            artOnly.fillRect(x, y, w, h);
+        });
+
+        pixels.forEach((p, index) => {
+            const x = index % SIZE;
+            const y = Math.floor(index / SIZE);
+            if (covered.has(index)) {
+                assert(Math.abs(p[3] - artOnly.pixels[index][3]) < 1e-9,
+                       `${creatureId} at ${x},${y}: glow shows through the art`);
+                return;
+            }
+            const edge = touches(covered, index);
+            const glow = p[3] === 1 && GLOW.every((c, i) => Math.round(p[i]) === c);
+            assert(edge ? glow : p[3] === 0,
+                   `${creatureId} at ${x},${y}: expected ${edge ? 'glow' : 'nothing'}, got ${p.map(Math.round)}`);
+        });
+    });
+});
+
+test('Derived enhanced art is brightened', () => {
+    const normal = paint('pebble', false);
+    const enhanced = paint('pebble', true);
+    const [, x, y] = CREATURE_ART.pebble.normal[3];  // opaque stone_mid
+    const index = y * SIZE + x + 2;
+    assert(normal[index].slice(0, 3).map(Math.round).join() === '169,169,169', 'Normal stone should be stone_mid');
+    assert(enhanced[index].slice(0, 3).map(Math.round).join() === '203,203,203',
+           `Enhanced stone should be 1.2x brighter, got ${enhanced[index].slice(0, 3).map(Math.round)}`);
+});
+
+test('Without an offscreen canvas, creatures draw over the scene without erasing it', () => {
+    // Node has no document, so BitmapCache paints straight onto the target
+    const scene = createLayer(SIZE * 2);
+    scene.fillStyle = 'rgba(62, 137, 178, 1)';
+    scene.fillRect(0, 0, SIZE * 2, SIZE * 2);
+
+    Object.keys(CREATURE_ART).forEach(creatureId => {
+        [false, true].forEach(enhanced => {
+            spriteLoader.drawCreature(scene, creatureId, 8, 8, enhanced);
+            const holes = scene.pixels.filter(p => p[3] < 1).length;
+            assert(holes === 0, `${creatureId} (${enhanced ? 'enhanced' : 'normal'}) erased ${holes} scene pixels`);
+        });
+    });
+
+    const alone = createLayer(SIZE * 2);
+    spriteLoader.drawCreature(alone, 'pebble', 8, 8, true);
+    const layer = paint('pebble', true);
+    layer.forEach((p, index) => {
+        const q = alone.pixels[(Math.floor(index / SIZE) + 8) * SIZE * 2 + index % SIZE + 8];
+        assert(p.every((c, i) => Math.abs(c - q[i]) < 1e-9), 'Direct drawing should match the cached layer');
+    });
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ CREATURE SPRITE TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL CREATURE SPRITE TESTS PASSED!');
+    process.exit(0);
+}
@@ -0,0 +1,169 @@
+/**
+ * Dialogue Compilation Tests
+ * Validates compileDialogues (grouping by plot phase, load-time shadowing
+ * checks) and findDialogue lookups against the game's NPCs
+ */
+
+const { NPCS, compileDialogues, findDialogue } = require('./loadGameData.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+function assertThrows(fn, pattern, message) {
+    try {
+        fn();
+    } catch (e) {
+        assert(pattern.test(e.message), `${message}: unexpected error "${e.message}"`);
+        return;
+    }
+    throw new Error(`${message}: nothing was thrown`);
+}
+
+function npcWith(dialogues) {
+    return { test_npc: { id: 'test_npc', name: 'Test', type: 'dialogue_npc', dialogues } };
+}
+
+console.log('Testing dialogue compilation...\n');
+
+test('phase can be a single phase or a list of phases', () => {
+    const single = { phase: 'wake_up', text: 'single' };
+    const shared = { phase: ['boat_quest', 'working'], text: 'shared' };
+    const npc = compileDialogues(npcWith([single, shared])).test_npc;
+
+    assert(npc.dialoguesByPhase.get('wake_up')[0] === single, 'wake_up should hold the single-phase dialogue');
+    assert(npc.dialoguesByPhase.get('boat_quest')[0] === shared, 'boat_quest should hold the shared dialogue');
+    assert(npc.dialoguesByPhase.get('working')[0] === shared, 'working should hold the shared dialogue');
+    assert(findDialogue(npc, { plotPhase: 'working' }) === shared, 'working should find the shared dialogue');
+    assert(single.condition({ plotPhase: 'wake_up' }) && !single.condition({ plotPhase: 'working' }),
+           'Compiled condition should check the phase');
+});
+
+test('when picks the first entry of the phase whose guard holds', () => {
+    const poor = { phase: ['boat_quest', 'working'], when: (game) => game.coins < 20, text: 'poor' };
+    const rich = { phase: 'working', when: (game) => game.coins >= 20, text: 'rich' };
+    const fallback = { phase: 'working', text: 'fallback' };
+    const npc = compileDialogues(npcWith([poor, rich, fallback])).test_npc;
+
+    assert(findDialogue(npc, { plotPhase: 'working', coins: 5 }) === poor, 'coins < 20 should find the first entry');
+    assert(findDialogue(npc, { plotPhase: 'working', coins: 50 }) === rich, 'coins >= 20 should find the second entry');
+    assert(findDialogue(npc, { plotPhase: 'boat_quest', coins: 50 }) === null,
+           'boat_quest has no entry for coins >= 20');
+    assert(rich.condition({ plotPhase: 'working', coins: 50 }) === true &&
+           rich.condition({ plotPhase: 'working', coins: 5 }) === false,
+           'Compiled condition should check when as well');
+});
+
+test('findDialogue only evaluates guards of the current phase', () => {
+    const calls = [];
+    const guard = (name, result) => () => { calls.push(name); return result; };
+    const npc = compileDialogues(npcWith([
+        { phase: 'wake_up', when: guard('wake_up', true), text: 'a' },
+        { phase: 'working', when: guard('working', false), text: 'b' },
+        { phase: 'working', when: guard('working 2', true), text: 'c' }
+    ])).test_npc;
+
+    findDialogue(npc, { plotPhase: 'working' });
+    assert(calls.join() === 'working,working 2', `Expected only working guards, got ${calls.join()}`);
+});
+
+test('findDialogue returns null for phases with no dialogue', () => {
+    const npc = compileDialogues(npcWith([{ phase: 'wake_up', text: 'a' }])).test_npc;
+    assert(findDialogue(npc, { plotPhase: 'departure' }) === null, 'Unknown phase should find nothing');
+    assert(findDialogue(NPCS.marina, { plotPhase: 'wake_up' }) === null, 'Non-dialogue NPCs should find nothing');
+});
+
+test('An unconditional entry shadowing a later one throws', () => {
+    assertThrows(() => compileDialogues(npcWith([
+        { phase: 'wake_up', text: 'always' },
+        { phase: 'wake_up', when: () => true, text: 'never' }
+    ])), /test_npc dialogue 1 can never show in phase 'wake_up': dialogue 0 always matches first/,
+    'Same phase');
+
+    assertThrows(() => compileDialogues(npcWith([
+        { phase: ['boat_quest', 'working'], text: 'always' },
+        { phase: 'working', text: 'never' }
+    ])), /dialogue 1 can never show in phase 'working'/, 'Overlapping phase lists');
+});
+
+test('Guarded entries before an unconditional one are allowed', () => {
+    compileDialogues(npcWith([
+        { phase: 'working', when: () => false, text: 'guarded' },
+        { phase: 'working', text: 'fallback' }
+    ]));
+});
+
+test('A dialogue without a phase throws', () => {
+    assertThrows(() => compileDialogues(npcWith([{ when: () => true, text: 'lost' }])),
+                 /test_npc dialogue 0 has no phase/, 'Missing phase');
+    assertThrows(() => compileDialogues(npcWith([{ phase: [], text: 'lost' }])),
+                 /test_npc dialogue 0 has no phase/, 'Empty phase list');
+});
+
+test('Game NPCs: findDialogue agrees with the compiled conditions', () => {
+    const phases = ['wake_up', 'find_creature', 'creature_found', 'meet_villager',
+                    'boat_quest', 'working', 'boat_ready', 'departure'];
+    const quests = ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'];
+    let checked = 0;
+
+    Object.entries(NPCS).forEach(([npcId, npc]) => {
+        if (npc.type !== 'dialogue_npc') return;
+        phases.forEach(plotPhase => [0, 25].forEach(coins => [0, 4].forEach(planks =>
+            [false, true].forEach(hasInspectedBoat => [0, 1, 4].forEach(done => {
+                const game = {
+                    plotPhase, coins, hasInspectedBoat,
+                    boatQuest: { planks: { collected: planks } },
+                    completedQuests: new Set(quests.slice(0, done))
+                };
+                const expected = npc.dialogues.find(d => d.condition(game)) || null;
+                assert(findDialogue(npc, game) === expected,
+                       `${npcId} in ${JSON.stringify({ plotPhase, coins, planks, hasInspectedBoat, done })}`);
+                checked++;
+            })))));
+    });
+    assert(checked > 0, 'No game NPC dialogues checked');
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ DIALOGUE COMPILATION TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL DIALOGUE COMPILATION TESTS PASSED!');
+    process.exit(0);
+}
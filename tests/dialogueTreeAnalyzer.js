@@ -32,10 +32,11 @@ class DialogueTreeAnalyzer {
         };
 
         if (npc.type === 'dialogue_npc' && npc.dialogues) {
-            // Test each game state
+            // Test each game state against the dialogues of its phase
             gameStates.forEach(state => {
-                const matchingDialogues = npc.dialogues.filter(d =>
-                    d.condition(state)
+                const phaseDialogues = npc.dialoguesByPhase.get(state.plotPhase) || [];
+                const matchingDialogues = phaseDialogues.filter(d =>
+                    !d.when || d.when(state)
                 );
 
                 if (matchingDialogues.length === 0) {
@@ -0,0 +1,145 @@
+/**
+ * Encounter Table Tests
+ * Validates precomputed encounter odds against rolling each creature in
+ * turn, and that seeded encounter runs replay exactly
+ */
+
+const { CREATURES, buildEncounterTables, rollEncounter, createSeededRandom } = require('./loadGameData.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+/**
+ * Chance of each creature under the per-creature rolls the tables replace:
+ * each eligible creature in CREATURES order gets its own roll, first hit wins
+ */
+function sequentialOdds(terrain, discovered, abilities, rateMultiplier) {
+    const odds = {};
+    let miss = 1;
+    for (const [creatureId, creature] of Object.entries(CREATURES)) {
+        if (discovered.has(creatureId)) continue;
+        if (!creature.habitats.includes(terrain)) continue;
+        if (creature.requiresAbility && !abilities.has(creature.requiresAbility)) continue;
+
+        const rate = creature.encounterRate * rateMultiplier;
+        odds[creatureId] = miss * rate;
+        miss *= 1 - rate;
+    }
+    return odds;
+}
+
+const TERRAINS = ['sand', 'grass', 'tallgrass', 'water', 'cave'];
+const SCENARIOS = [
+    { name: 'new game', discovered: new Set(), abilities: new Set(), rateMultiplier: 1 },
+    { name: 'lumina found', discovered: new Set(['lumina']), abilities: new Set(), rateMultiplier: 1 },
+    { name: 'golden net', discovered: new Set(['lumina']), abilities: new Set(), rateMultiplier: 2 },
+    { name: 'surf and torch', discovered: new Set(), abilities: new Set(['surf', 'torch']), rateMultiplier: 2 }
+];
+
+console.log('Testing encounter tables...\n');
+
+SCENARIOS.forEach(scenario => {
+    test(`Table odds match per-creature rolls (${scenario.name})`, () => {
+        const tables = buildEncounterTables(CREATURES, scenario.discovered, scenario.abilities, scenario.rateMultiplier);
+
+        TERRAINS.forEach(terrain => {
+            const expected = sequentialOdds(terrain, scenario.discovered, scenario.abilities, scenario.rateMultiplier);
+            const table = tables[terrain];
+
+            if (Object.keys(expected).length === 0) {
+                assert(!table, `${terrain} should have no table`);
+                return;
+            }
+
+            assert(table.creatureIds.join() === Object.keys(expected).join(),
+                   `${terrain} creatures: expected ${Object.keys(expected).join()}, got ${table.creatureIds.join()}`);
+
+            let previous = 0;
+            table.creatureIds.forEach((creatureId, i) => {
+                const chance = table.cumulative[i] - previous;
+                assert(Math.abs(chance - expected[creatureId]) < 1e-12,
+                       `${terrain}/${creatureId}: expected ${expected[creatureId]}, got ${chance}`);
+                previous = table.cumulative[i];
+            });
+        });
+    });
+});
+
+test('Rolls map onto the cumulative ranges', () => {
+    const tables = buildEncounterTables(CREATURES, new Set(), new Set(), 1);
+    const table = tables.sand;
+
+    assert(rollEncounter(table, 0) === table.creatureIds[0], 'Roll 0 should pick the first creature');
+    assert(rollEncounter(table, table.cumulative[0]) === table.creatureIds[1],
+           'A roll on a boundary should pick the next creature');
+    assert(rollEncounter(table, table.cumulative[table.cumulative.length - 1]) === null,
+           'Rolls past the last range should encounter nothing');
+});
+
+test('Seeded runs replay the same encounters', () => {
+    const tables = buildEncounterTables(CREATURES, new Set(), new Set(), 1);
+    const run = seed => {
+        const random = createSeededRandom(seed);
+        return Array.from({ length: 200 }, () => rollEncounter(tables.sand, random())).join();
+    };
+
+    assert(run(42) === run(42), 'Same seed should give the same encounters');
+    assert(run(42) !== run(7), 'Different seeds should give different encounters');
+});
+
+test('Seeded rolls are spread over [0, 1)', () => {
+    const random = createSeededRandom(1);
+    const buckets = new Array(10).fill(0);
+    for (let i = 0; i < 10000; i++) {
+        const roll = random();
+        assert(roll >= 0 && roll < 1, `Roll out of range: ${roll}`);
+        buckets[Math.floor(roll * 10)]++;
+    }
+    assert(buckets.every(count => count > 900 && count < 1100),
+           `Rolls should be roughly uniform, got ${buckets.join(', ')}`);
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ ENCOUNTER TABLE TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL ENCOUNTER TABLE TESTS PASSED!');
+    process.exit(0);
+}
@@ -0,0 +1,31 @@
+/**
+ * State Space Exploration
+ * Explores every game state reachable from a new game and reports
+ * unreachable dialogues and dead ends (see stateSpaceExplorer.js)
+ *
+ * Usage: node tests/explore-state-space.js [--strict] [--max-states N]
+ *   --strict  exit 1 if any dialogue is unreachable or any state is a dead end
+ */
+
+const data = require('./loadGameData.js');
+const StateSpaceExplorer = require('./stateSpaceExplorer.js');
+
+const args = process.argv.slice(2);
+const strict = args.includes('--strict');
+const maxStatesIndex = args.indexOf('--max-states');
+const maxStates = maxStatesIndex >= 0 ? parseInt(args[maxStatesIndex + 1], 10) : undefined;
+
+console.log('\n╔═══════════════════════════════════════╗');
+console.log('║  Dialogue State Space Exploration    ║');
+console.log('╚═══════════════════════════════════════╝');
+
+const explorer = new StateSpaceExplorer(data, { maxStates });
+const start = Date.now();
+const result = explorer.explore();
+console.log(explorer.report(result));
+console.log(`Explored in ${Date.now() - start}ms`);
+
+if (strict && (result.unreachableDialogues.length > 0 || result.deadEnds.length > 0 || result.truncated)) {
+    console.log('\n❌ State space has unreachable dialogues or dead ends!');
+    process.exit(1);
+}
@@ -0,0 +1,85 @@
+/**
+ * Generate Golden Interaction Trees
+ * Creates reference files for all NPC dialogue flows to detect regressions.
+ * Only files whose NPC, quest or serializer changed since the last run are
+ * rewritten; pass --full (or set GOLDEN_FULL=1) to regenerate everything
+ *
+ * Usage: node tests/generate-golden-trees.js [--full]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const gameData = require('./loadGameData.js');
+const golden = require('./goldenTrees.js');
+
+const { NPCS } = gameData;
+const { GOLDEN_DIR } = golden;
+
+const full = process.argv.includes('--full') || process.env.GOLDEN_FULL === '1';
+
+const manifest = golden.loadManifest();
+const hashes = golden.inputHashes(gameData);
+const serializerChanged = manifest.serializer !== hashes.serializer;
+
+const next = {
+    version: golden.MANIFEST_VERSION,
+    serializer: hashes.serializer,
+    npcs: hashes.npcs,
+    quests: hashes.quests,
+    files: {}
+};
+
+let written = 0;
+let unchanged = 0;
+
+console.log(full ? 'Generating all golden trees (--full)...\n' : 'Generating golden trees for changed NPCs and quests...\n');
+
+Object.entries(NPCS).forEach(([npcId, npc]) => {
+    const npcDir = path.join(GOLDEN_DIR, npcId);
+
+    // Which files this NPC has only changes with the NPC itself, so an
+    // unchanged NPC can take the list from the manifest without rendering
+    const npcUnchanged = !full && !serializerChanged && manifest.npcs[npcId] === hashes.npcs[npcId];
+    const recorded = Object.keys(manifest.files).filter(rel => rel.startsWith(`${npcId}/`));
+    const files = npcUnchanged && recorded.length > 0
+        ? recorded.map(rel => rel.slice(npcId.length + 1))
+        : golden.goldenFiles(npc, gameData);
+
+    const changes = [];
+    files.forEach(filename => {
+        const rel = `${npcId}/${filename}`;
+        const filePath = path.join(npcDir, filename);
+        const entry = golden.goldenEntry(npcId, filename, gameData);
+        const input = golden.entryHash(hashes, rel, entry);
+        const existing = fs.existsSync(filePath) ? fs.readFileSync(filePath, 'utf8') : null;
+
+        let content = existing;
+        if (full || existing === null || !golden.isFresh(manifest, rel, input, existing)) {
+            content = entry.render();
+            if (content !== existing) {
+                fs.mkdirSync(npcDir, { recursive: true });
+                fs.writeFileSync(filePath, content);
+                written++;
+                changes.push(`  ✓ ${filename}${existing === null ? ' (new)' : ' (updated)'}`);
+            } else {
+                unchanged++;
+            }
+        } else {
+            unchanged++;
+        }
+
+        next.files[rel] = { input, output: golden.hash(content) };
+    });
+
+    if (changes.length > 0) {
+        console.log(`Processing ${npcId} (${npc.name})...`);
+        changes.forEach(line => console.log(line));
+        console.log('');
+    }
+});
+
+golden.saveManifest(next);
+
+console.log(`✓ ${written} golden tree(s) written, ${unchanged} unchanged, in ${GOLDEN_DIR}/`);
+console.log('These are your dialogue regression test references.');
+console.log('Commit them (and manifest.json) to git so tests can detect changes.\n');
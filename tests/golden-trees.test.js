@@ -0,0 +1,130 @@
+/**
+ * Golden Tree Tests
+ * Validates current dialogue against golden reference files
+ * RELEASE BLOCKING - must pass before deployment
+ */
+
+const fs = require('fs');
+const path = require('path');
+const gameData = require('./loadGameData.js');
+const golden = require('./goldenTrees.js');
+
+const { NPCS } = gameData;
+const { GOLDEN_DIR } = golden;
+
+// Skip files whose inputs match manifest.json unless asked to check everything
+const full = process.argv.includes('--full') || process.env.GOLDEN_FULL === '1';
+
+if (!fs.existsSync(GOLDEN_DIR)) {
+    console.log('❌ ERROR: Golden trees not found!');
+    console.log('Run ./generate-golden-trees.sh first to create reference files.');
+    process.exit(1);
+}
+
+const manifest = golden.loadManifest();
+const hashes = golden.inputHashes(gameData);
+
+// ============================================================================
+// TEST EXECUTION
+// ============================================================================
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+let cached = 0;
+const failures = [];
+
+console.log(full ? 'Running golden tree validation tests (--full)...\n' : 'Running golden tree validation tests...\n');
+
+Object.entries(NPCS).forEach(([npcId, npc]) => {
+    const npcDir = path.join(GOLDEN_DIR, npcId);
+
+    if (!fs.existsSync(npcDir)) {
+        console.log(`⚠️  ${npcId}: No golden trees found (skipping)`);
+        return;
+    }
+
+    console.log(`Testing ${npcId} (${npc.name})...`);
+
+    const goldenFiles = fs.readdirSync(npcDir);
+
+    goldenFiles.forEach(filename => {
+        totalTests++;
+
+        const rel = `${npcId}/${filename}`;
+        const expected = fs.readFileSync(path.join(npcDir, filename), 'utf8');
+        const entry = golden.goldenEntry(npcId, filename, gameData);
+
+        if (!entry) {
+            failed++;
+            console.log(`  ❌ ${filename}`);
+            failures.push({ test: rel, file: rel, golden: expected, current: '(not a recognised golden file name)' });
+            return;
+        }
+
+        // Same inputs as when this golden was generated: rendering again
+        // would reproduce it exactly
+        if (!full && golden.isFresh(manifest, rel, golden.entryHash(hashes, rel, entry), expected)) {
+            passed++;
+            cached++;
+            console.log(`  ✓ ${filename} (unchanged)`);
+            return;
+        }
+
+        const current = entry.render();
+        if (current === expected) {
+            passed++;
+            console.log(`  ✓ ${filename}`);
+        } else {
+            failed++;
+            console.log(`  ❌ ${filename}`);
+            failures.push({
+                test: entry.testName,
+                file: path.join(npcId, filename),
+                golden: expected,
+                current
+            });
+        }
+    });
+
+    console.log('');
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log(`Re-rendered: ${totalTests - cached} (${cached} unchanged since manifest.json, use --full to check them too)`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ DIALOGUE REGRESSION DETECTED!\n');
+
+    failures.forEach((failure, i) => {
+        console.log(`Failure ${i + 1}: ${failure.test}`);
+        console.log(`File: ${failure.file}`);
+        console.log('\n--- EXPECTED (Golden) ---');
+        console.log(failure.golden);
+        console.log('\n--- ACTUAL (Current) ---');
+        console.log(failure.current);
+        console.log('\n' + '─'.repeat(70) + '\n');
+    });
+
+    console.log('⚠️  RELEASE BLOCKED - Fix dialogue regressions before deploying!');
+    console.log('\nTo update golden trees after intentional changes:');
+    console.log('  ./generate-golden-trees.sh');
+    console.log('  git add golden-trees/');
+    console.log('  git commit -m "Update golden trees for intentional dialogue changes"');
+
+    process.exit(1);
+} else {
+    console.log('✅ ALL DIALOGUE TREES MATCH GOLDEN REFERENCES!');
+    console.log('Safe to release.');
+    process.exit(0);
+}
@@ -0,0 +1,328 @@
+/**
+ * Golden Trees
+ * Shared by generate-golden-trees.js and golden-trees.test.js: which golden
+ * files an NPC has, how each is serialized, and the manifest of content
+ * hashes that lets both skip files whose inputs haven't changed
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const GOLDEN_DIR = path.join(__dirname, 'golden-trees');
+const MANIFEST_PATH = path.join(GOLDEN_DIR, 'manifest.json');
+
+// Bump to invalidate every manifest entry
+const MANIFEST_VERSION = 1;
+
+const PLOT_PHASES = ['wake_up', 'find_creature', 'creature_found', 'meet_villager', 'boat_quest', 'working'];
+
+// Quest-progress states for quest NPCs, written as dialogue_<name>.txt
+const QUEST_STATES = [
+    { name: 'no_boat', label: 'no boat', hasInspectedBoat: false, completedQuests: [] },
+    { name: 'no_quests', label: 'no quests', hasInspectedBoat: true, completedQuests: [] },
+    { name: 'some_quests', label: 'some quests', hasInspectedBoat: true, completedQuests: ['fishing_crates'] },
+    { name: 'all_quests', label: 'all quests', hasInspectedBoat: true, completedQuests: ['fishing_crates', 'fishing_nets', 'fishing_baskets', 'fishing_records'] }
+];
+
+// ============================================================================
+// SERIALIZATION
+// ============================================================================
+
+function createMockGame(state, GameState) {
+    return {
+        state: state.state || GameState.EXPLORING,
+        plotPhase: state.plotPhase || 'boat_quest',
+        hasInspectedBoat: state.hasInspectedBoat !== undefined ? state.hasInspectedBoat : false,
+        completedQuests: state.completedQuests || new Set(),
+        activeQuest: null,
+        questObjective: null,
+        player: { x: 10, y: 10 },
+        npcInteractions: new Map(),
+        discoveredCreatures: new Set()
+    };
+}
+
+function serializeDialogue(dialogue, npcName) {
+    const lines = [];
+
+    lines.push(`Speaker: ${npcName}`);
+
+    // Serialize text
+    if (Array.isArray(dialogue.text)) {
+        lines.push(`Text: [${dialogue.text.length} lines]`);
+        dialogue.text.forEach((line, i) => {
+            if (typeof line === 'string') {
+                lines.push(`  Line ${i + 1}: "${line}"`);
+            } else if (line.speaker && line.text) {
+                lines.push(`  Line ${i + 1}: [${line.speaker}] "${line.text}"`);
+            } else {
+                lines.push(`  Line ${i + 1}: [complex]`);
+            }
+        });
+    } else if (typeof dialogue.text === 'string') {
+        lines.push(`Text: "${dialogue.text}"`);
+    } else {
+        lines.push(`Text: [complex type]`);
+    }
+
+    // Serialize choices
+    if (dialogue.choices && dialogue.choices.length > 0) {
+        lines.push(`Choices: ${dialogue.choices.length}`);
+        dialogue.choices.forEach((choice, i) => {
+            lines.push(`  ${i + 1}. "${choice.text}"`);
+        });
+    } else {
+        lines.push(`Choices: none (press A to continue)`);
+    }
+
+    // Metadata
+    lines.push(`Has onClose: ${!!dialogue.onClose}`);
+
+    return lines.join('\n');
+}
+
+function serializeQuestFlow(questId, quest) {
+    const lines = [];
+
+    lines.push(`Quest: ${quest.name || questId}`);
+    lines.push(`ID: ${questId}`);
+    lines.push(`Type: ${quest.type}`);
+    lines.push(`Reward: ${quest.reward} coins`);
+
+    if (quest.type === 'multi_step' && quest.steps) {
+        lines.push(`Steps: ${quest.steps.length}`);
+        lines.push('');
+
+        quest.steps.forEach((step, i) => {
+            lines.push(`Step ${i + 1}/${quest.steps.length}:`);
+            lines.push(`  Type: ${step.type}`);
+            lines.push(`  Description: "${step.description}"`);
+
+            if (step.location) {
+                lines.push(`  Location: (${step.location.x}, ${step.location.y})`);
+                lines.push(`  Radius: ${step.radius || 1}`);
+            }
+
+            if (step.markerText) {
+                lines.push(`  Marker: ${step.markerText}`);
+            }
+
+            if (step.onArrive) {
+                if (step.onArrive.message) {
+                    lines.push(`  Arrival Message: "${step.onArrive.message}"`);
+                }
+
+                if (step.onArrive.problem) {
+                    const prob = step.onArrive.problem;
+                    lines.push(`  Problem:`);
+                    lines.push(`    Question: "${prob.question}"`);
+                    lines.push(`    Answers: [${prob.answers.join(', ')}]`);
+                    lines.push(`    Correct: ${prob.correct}`);
+                }
+            }
+
+            lines.push('');
+        });
+    } else if (quest.type === 'one_off' && quest.problem) {
+        lines.push(`Problem:`);
+        lines.push(`  Question: "${quest.problem.question}"`);
+        lines.push(`  Answers: [${quest.problem.answers.join(', ')}]`);
+        lines.push(`  Correct: ${quest.problem.correct}`);
+    }
+
+    return lines.join('\n');
+}
+
+// ============================================================================
+// GOLDEN FILES
+// ============================================================================
+
+function matchDialogue(npc, state, GameState) {
+    const game = createMockGame(state, GameState);
+    return npc.dialogues?.find(d => d.condition(game));
+}
+
+function renderDialogue(npc, state, GameState) {
+    const dialogue = matchDialogue(npc, state, GameState);
+    return dialogue ? serializeDialogue(dialogue, npc.name) : 'NO DIALOGUE MATCHED';
+}
+
+function questIds(npc) {
+    if (!npc.quests) return [];
+    return [...(npc.quests.oneOff || []), ...(npc.quests.full ? [npc.quests.full] : [])];
+}
+
+/**
+ * Golden files generation writes for an NPC: one per plot phase (or quest
+ * state) that some dialogue matches, plus one per quest it gives
+ */
+function goldenFiles(npc, { QUESTS, GameState }) {
+    const files = [];
+
+    if (npc.type === 'dialogue_npc' && npc.dialogues) {
+        PLOT_PHASES.forEach(phase => {
+            if (matchDialogue(npc, { plotPhase: phase }, GameState)) files.push(`${phase}.txt`);
+        });
+    } else if (npc.type === 'quest_npc' || (npc.quests && npc.dialogues)) {
+        QUEST_STATES.forEach(state => {
+            if (matchDialogue(npc, { ...state, completedQuests: new Set(state.completedQuests) }, GameState)) {
+                files.push(`dialogue_${state.name}.txt`);
+            }
+        });
+    } else {
+        return files;
+    }
+
+    questIds(npc).forEach(questId => {
+        if (QUESTS[questId]) files.push(`quest_${questId}.txt`);
+    });
+    return files;
+}
+
+/**
+ * What a golden file checks, worked out from its name:
+ * { testName, npcId, questId, render() }, or null for an unknown name
+ */
+function goldenEntry(npcId, filename, { NPCS, QUESTS, GameState }) {
+    const npc = NPCS[npcId];
+
+    if (filename.startsWith('quest_')) {
+        const questId = filename.replace('quest_', '').replace('.txt', '');
+        const quest = QUESTS[questId];
+        return {
+            testName: `${npcId}/quest:${questId}`,
+            npcId: null,
+            questId,
+            render: () => quest ? serializeQuestFlow(questId, quest) : 'QUEST NOT FOUND'
+        };
+    }
+
+    if (!filename.startsWith('dialogue_') && !filename.endsWith('.txt')) {
+        return null;
+    }
+
+    const basename = filename.replace('.txt', '');
+    const questState = QUEST_STATES.find(state => basename.includes(`_${state.name}`));
+    if (questState) {
+        return {
+            testName: `${npcId}/dialogue (${questState.label})`,
+            npcId,
+            questId: null,
+            render: () => renderDialogue(npc, {
+                hasInspectedBoat: questState.hasInspectedBoat,
+                completedQuests: new Set(questState.completedQuests)
+            }, GameState)
+        };
+    }
+
+    // Plot phase test
+    return {
+        testName: `${npcId}/${basename}`,
+        npcId,
+        questId: null,
+        render: () => renderDialogue(npc, { plotPhase: basename }, GameState)
+    };
+}
+
+// ============================================================================
+// MANIFEST
+// ============================================================================
+
+function hash(text) {
+    return crypto.createHash('sha1').update(text).digest('hex');
+}
+
+/**
+ * Deterministic text form of game data. Functions are included by source,
+ * so editing a condition or onClose handler changes the hash too
+ */
+function stableSource(value) {
+    if (typeof value === 'function') return value.toString();
+    if (value instanceof Set || value instanceof Map) return `${value.constructor.name}(${stableSource([...value])})`;
+    if (Array.isArray(value)) return `[${value.map(stableSource).join(',')}]`;
+    if (value && typeof value === 'object') {
+        return `{${Object.keys(value).sort().map(key => `${JSON.stringify(key)}:${stableSource(value[key])}`).join(',')}}`;
+    }
+    return value === undefined ? 'undefined' : JSON.stringify(value);
+}
+
+/**
+ * Hashes of everything a golden file can depend on. The serializer hash
+ * covers this file, the data loader and the dialogue selection helpers in
+ * data.js, so changing how goldens are produced invalidates them all
+ */
+function inputHashes({ NPCS, QUESTS, GameState, compileDialogues, findDialogue }) {
+    const tooling = ['goldenTrees.js', 'loadGameData.js']
+        .map(file => fs.readFileSync(path.join(__dirname, file), 'utf8'))
+        .concat(stableSource([compileDialogues, findDialogue]));
+    const hashAll = table => Object.fromEntries(
+        Object.entries(table).map(([id, value]) => [id, hash(stableSource(value))]));
+
+    return {
+        serializer: hash([MANIFEST_VERSION, ...tooling, stableSource(GameState)].join('\n')),
+        npcs: hashAll(NPCS),
+        quests: hashAll(QUESTS)
+    };
+}
+
+/**
+ * Hash of one golden file's inputs: the serializer, its name, and the NPC
+ * or quest it renders
+ */
+function entryHash(hashes, rel, entry) {
+    return hash([
+        hashes.serializer,
+        rel,
+        entry.npcId ? hashes.npcs[entry.npcId] || 'missing' : '',
+        entry.questId ? hashes.quests[entry.questId] || 'missing' : ''
+    ].join('\n'));
+}
+
+/**
+ * The stored manifest, or an empty one if it is missing, unreadable or
+ * from another MANIFEST_VERSION
+ */
+function loadManifest() {
+    try {
+        const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf8'));
+        if (manifest.version === MANIFEST_VERSION) return manifest;
+    } catch (e) {
+        // Missing or corrupt: everything counts as changed
+    }
+    return { version: MANIFEST_VERSION, serializer: null, npcs: {}, quests: {}, files: {} };
+}
+
+function saveManifest(manifest) {
+    fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2) + '\n');
+}
+
+/**
+ * True if the manifest says rendering `input` produced `content`, so the
+ * golden file needs neither regenerating nor re-checking
+ */
+function isFresh(manifest, rel, input, content) {
+    const recorded = manifest.files[rel];
+    return !!recorded && recorded.input === input && recorded.output === hash(content);
+}
+
+module.exports = {
+    GOLDEN_DIR,
+    MANIFEST_PATH,
+    MANIFEST_VERSION,
+    PLOT_PHASES,
+    QUEST_STATES,
+    createMockGame,
+    serializeDialogue,
+    serializeQuestFlow,
+    questIds,
+    goldenFiles,
+    goldenEntry,
+    hash,
+    stableSource,
+    inputHashes,
+    entryHash,
+    loadManifest,
+    saveManifest,
+    isFresh
+};
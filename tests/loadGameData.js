@@ -1,15 +1,34 @@
 /**
  * Load game data for testing
- * Extracts NPCS, QUESTS, QUEST_STEP_HANDLERS from data.js
- * and GameState from game.js
+ * Extracts NPCS (dialogues compiled by phase), QUESTS, QUEST_STEP_HANDLERS,
+ * compileDialogues and findDialogue from data.js,
+ * GameState from game.js, the QuestSystem and TriggerZones classes, and
+ * WorldMap with the sprite loader globals it resolves tiles through
+ * (including the CREATURE_ART creatures fall back to)
  */
 
 const fs = require('fs');
 const path = require('path');
+const { workerData } = require('worker_threads');
 
-// Read game.js to extract GameState
-const gamePath = path.join(__dirname, '../src/game.js');
-const gameContent = fs.readFileSync(gamePath, 'utf8');
+/**
+ * Read the source files the game data is evaluated from.
+ * run-tests.js reads them once and hands them to every worker
+ */
+function readGameSources() {
+    const read = file => fs.readFileSync(path.join(__dirname, '../src', file), 'utf8');
+    return {
+        game: read('game.js'),
+        data: read('data.js'),
+        questSystem: read('questSystem.js'),
+        triggerZones: read('triggerZones.js'),
+        spriteLoader: read('spriteLoader.js'),
+        worldMap: read('worldMap.js')
+    };
+}
+
+const sources = (workerData && workerData.gameSources) || readGameSources();
+const gameContent = sources.game;
 
 // Extract GameState definition
 const gameStateMatch = gameContent.match(/const GameState = \{[^}]+\}/s);
@@ -21,9 +40,7 @@ if (!gameStateMatch) {
 const gameStateFunc = new Function(gameStateMatch[0] + '\nreturn GameState;');
 const GameState = gameStateFunc();
 
-// Read data.js
-const dataPath = path.join(__dirname, '../src/data.js');
-const dataContent = fs.readFileSync(dataPath, 'utf8');
+const dataContent = sources.data;
 
 // Create a mock environment for the browser-based code
 global.PlotPhase = {
@@ -37,10 +54,31 @@ global.PlotPhase = {
 };
 
 // Use Function constructor to safely evaluate the code
-const func = new Function('PlotPhase', 'GameState', dataContent + '\nreturn { NPCS, QUESTS, CREATURES, MAP_DATA, QUEST_STEP_HANDLERS };');
+const func = new Function('PlotPhase', 'GameState', dataContent + '\nreturn { NPCS, QUESTS, CREATURES, MAP_DATA, QUEST_STEP_HANDLERS, SHOP_ITEMS, buildEncounterTables, rollEncounter, createSeededRandom, compileDialogues, findDialogue };');
 const data = func(PlotPhase, GameState);
 
+// QuestSystem only touches the DOM to hide the job panel
+const questSystemContent = sources.questSystem;
+const mockDocument = {
+    getElementById: () => ({ classList: { add() {}, remove() {} } })
+};
+const QuestSystem = new Function('QUESTS', 'QUEST_STEP_HANDLERS', 'GameState', 'document',
+    questSystemContent + '\nreturn QuestSystem;')(data.QUESTS, data.QUEST_STEP_HANDLERS, GameState, mockDocument);
+
+// Quest objectives register their areas in game.triggers
+const TriggerZones = new Function(sources.triggerZones + '\nreturn TriggerZones;')();
+
+// WorldMap resolves tile handles through the global spriteLoader, which
+// only needs Image and document once sprites are loaded
+const mapModule = new Function(sources.spriteLoader + '\n' + sources.worldMap +
+    '\nreturn { WorldMap, TERRAIN, TERRAIN_NAMES, TILE_NAMES, NO_TILE, spriteLoader, CREATURE_ART };')();
+
 module.exports = {
     ...data,
-    GameState
+    GameState,
+    QuestSystem,
+    TriggerZones,
+    ...mapModule,
+    sources,
+    readGameSources
 };
@@ -0,0 +1,186 @@
+#!/usr/bin/env node
+/**
+ * Test Runner
+ * Runs the test suite in one node process, spreading test files across
+ * worker threads. Game data is read and checked once here and handed to
+ * every worker, so loadGameData.js doesn't go back to disk per test.
+ *
+ * Usage:
+ *   node tests/run-tests.js                  # whole suite (npm test)
+ *   node tests/run-tests.js golden behavior  # files whose path contains a filter
+ *   node tests/run-tests.js -j 4 --verbose
+ */
+
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+
+const REPO_ROOT = path.join(__dirname, '..');
+
+// Paths relative to the repo root. Each file is a standalone script that
+// exits non-zero on failure, so it still runs on its own with `node <file>`
+const SUITE = [
+    'tests/golden-trees.test.js',
+    'tests/dialogue-behavior.test.js',
+    'tests/encounter-tables.test.js',
+    'tests/dialogue-compile.test.js',
+    'tests/trigger-zones.test.js',
+    'tests/world-map.test.js',
+    'tests/creature-sprites.test.js',
+    'tests/state-space.test.js',
+    'tests/run-dialogue-tests.js',
+    'tests/test-dialogue-e2e.sh',
+    'tests/test-dialogue-runtime.sh',
+    'tests/test-dialogue-validation.sh',
+    'tests/test-marlowe-restart.sh',
+    'test-inputrouter-fix.js',
+    'test-handler-execution-real.js',
+    'test-creature-naming.js'
+];
+
+const DEFAULT_TIMEOUT = 30000;
+
+function parseArgs(argv) {
+    const args = {
+        filters: [],
+        jobs: Math.max(1, (os.availableParallelism ? os.availableParallelism() : os.cpus().length)),
+        timeout: DEFAULT_TIMEOUT,
+        verbose: false
+    };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        if (arg === '-j' || arg === '--jobs') {
+            args.jobs = Math.max(1, parseInt(argv[++i], 10) || 1);
+        } else if (arg === '--timeout') {
+            args.timeout = parseInt(argv[++i], 10) || DEFAULT_TIMEOUT;
+        } else if (arg === '-v' || arg === '--verbose') {
+            args.verbose = true;
+        } else if (arg === '-h' || arg === '--help') {
+            console.log('Usage: node tests/run-tests.js [-j N] [--timeout MS] [--verbose] [FILTER...]');
+            process.exit(0);
+        } else {
+            args.filters.push(arg);
+        }
+    }
+    return args;
+}
+
+/**
+ * Run one test file in a fresh worker. Tests set up their own globals
+ * (JSDOM windows, mock documents), so workers are never reused.
+ * Resolves with { file, passed, ms, output, reason }
+ */
+function runTest(file, gameSources, timeout) {
+    return new Promise(resolve => {
+        const start = process.hrtime.bigint();
+        const chunks = [];
+        let error = null;
+        let timedOut = false;
+
+        const worker = new Worker(path.join(REPO_ROOT, file), {
+            workerData: { gameSources },
+            argv: [],
+            stdout: true,
+            stderr: true
+        });
+        worker.stdout.on('data', chunk => chunks.push(chunk));
+        worker.stderr.on('data', chunk => chunks.push(chunk));
+        worker.on('error', err => { error = err; });
+
+        const timer = setTimeout(() => {
+            timedOut = true;
+            worker.terminate();
+        }, timeout);
+
+        worker.on('exit', code => {
+            clearTimeout(timer);
+            const ms = Number(process.hrtime.bigint() - start) / 1e6;
+            let reason = null;
+            if (timedOut) {
+                reason = `timed out after ${timeout}ms`;
+            } else if (error) {
+                reason = error.stack || String(error);
+            } else if (code !== 0) {
+                reason = `exit code ${code}`;
+            }
+            resolve({ file, passed: reason === null, ms, output: Buffer.concat(chunks).toString(), reason });
+        });
+    });
+}
+
+/**
+ * Run files with at most `jobs` workers alive at once, reporting each as it finishes
+ */
+async function runAll(files, gameSources, args) {
+    const queue = files.slice();
+    const results = [];
+
+    async function next() {
+        while (queue.length > 0) {
+            const result = await runTest(queue.shift(), gameSources, args.timeout);
+            results.push(result);
+            console.log(`  ${result.passed ? '✓' : '❌'} ${result.file.padEnd(40)} ${result.ms.toFixed(0).padStart(6)}ms`);
+            let detail = args.verbose || !result.passed ? result.output.trimEnd() : '';
+            if (!result.passed) {
+                detail += (detail ? '\n' : '') + result.reason;
+            }
+            if (detail) {
+                console.log(detail.replace(/^/gm, '      '));
+            }
+        }
+    }
+
+    await Promise.all(Array.from({ length: Math.min(args.jobs, files.length) }, next));
+    return results;
+}
+
+async function main() {
+    const args = parseArgs(process.argv.slice(2));
+    const files = args.filters.length > 0
+        ? SUITE.filter(file => args.filters.some(filter => file.includes(filter)))
+        : SUITE;
+
+    if (files.length === 0) {
+        console.log(`No test matches ${args.filters.join(' ')}`);
+        process.exit(2);
+    }
+
+    // Tests read files relative to the repo root, and workers share our cwd
+    process.chdir(REPO_ROOT);
+
+    // Load once up front: a broken data.js fails here, not in every test
+    const loadStart = process.hrtime.bigint();
+    const { sources } = require('./loadGameData.js');
+    const loadMs = Number(process.hrtime.bigint() - loadStart) / 1e6;
+
+    const jobs = Math.min(args.jobs, files.length);
+    console.log(`Running ${files.length} test file(s) on ${jobs} worker(s) (game data loaded in ${loadMs.toFixed(0)}ms)\n`);
+
+    const start = process.hrtime.bigint();
+    const results = await runAll(files, sources, args);
+    const wallMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+    const failed = results.filter(result => !result.passed);
+    const totalMs = results.reduce((sum, result) => sum + result.ms, 0);
+
+    console.log('');
+    console.log('='.repeat(70));
+    console.log(`Passed: ${results.length - failed.length}/${results.length}`);
+    console.log(`Time: ${wallMs.toFixed(0)}ms wall, ${totalMs.toFixed(0)}ms across tests`);
+
+    const slowest = results.slice().sort((a, b) => b.ms - a.ms).slice(0, 3);
+    console.log(`Slowest: ${slowest.map(result => `${path.basename(result.file)} (${result.ms.toFixed(0)}ms)`).join(', ')}`);
+
+    if (failed.length > 0) {
+        console.log(`\n❌ ${failed.length} test file(s) failed:`);
+        failed.forEach(result => console.log(`  ${result.file}: ${result.reason.split('\n')[0]}`));
+        process.exit(1);
+    }
+
+    console.log('\n✅ ALL TESTS PASSED!');
+}
+
+main().catch(err => {
+    console.error(err);
+    process.exit(1);
+});
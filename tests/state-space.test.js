@@ -0,0 +1,100 @@
+/**
+ * State Space Tests
+ * Runs the state space explorer (see explore-state-space.js) over the game
+ * and checks that every dialogue is reachable and no state is a dead end,
+ * so a change that strands a dialogue or adds a dead end fails the suite
+ */
+
+const data = require('./loadGameData.js');
+const StateSpaceExplorer = require('./stateSpaceExplorer.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+// Callum has nothing to say before the story starts. Remove entries as they
+// are fixed; the test fails until the list matches again.
+const KNOWN_SILENT = ['callum in phase=wake_up, boat=false, coins=0, planks=0, quests=[]'];
+
+/**
+ * Fail on findings that aren't known, and on known ones that are gone
+ */
+function assertFindings(found, known, what) {
+    const added = found.filter(finding => !known.includes(finding));
+    const fixed = known.filter(finding => !found.includes(finding));
+    assert(added.length === 0, `New ${what}: ${added.join('; ')}`);
+    assert(fixed.length === 0, `No longer ${what} (remove from the known list): ${fixed.join('; ')}`);
+}
+
+console.log('Testing the reachable state space...\n');
+
+const explorer = new StateSpaceExplorer(data);
+const result = explorer.explore();
+
+test('Exploration covers the whole state space', () => {
+    assert(!result.truncated, `Stopped at ${result.states.size} states; raise maxStates`);
+    const phases = new Set([...result.states.values()].map(({ state }) => state.plotPhase));
+    ['wake_up', 'find_creature', 'creature_found', 'meet_villager', 'boat_quest', 'working', 'boat_ready',
+     'departure'].forEach(phase => {
+        assert(phases.has(phase), `Phase ${phase} should be reachable`);
+    });
+});
+
+test('Every dialogue is reachable', () => {
+    const unreachable = result.unreachableDialogues.map(d => `${d.npcId} #${d.index + 1}`);
+    assert(unreachable.length === 0, `Unreachable dialogues: ${unreachable.join('; ')}`);
+});
+
+test('No state is a dead end', () => {
+    const deadEnds = result.deadEnds.map(d => explorer.describeState(d.state));
+    assert(deadEnds.length === 0, `Dead ends: ${deadEnds.join('; ')}`);
+});
+
+test('Only the known NPCs have nothing to say', () => {
+    assertFindings(result.silentTalks.map(s => `${s.npcId} in ${explorer.describeState(s.state)}`),
+                   KNOWN_SILENT, 'NPCs with no matching dialogue');
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ STATE SPACE TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL STATE SPACE TESTS PASSED!');
+    process.exit(0);
+}
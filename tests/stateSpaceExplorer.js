@@ -0,0 +1,605 @@
+/**
+ * State Space Explorer
+ * Walks every game state reachable from a new game - talking to NPCs,
+ * picking dialogue choices, running onClose effects and quest steps
+ * (QuestSystem + QUEST_STEP_HANDLERS) - and reports dialogues that no
+ * reachable state shows and states the story can't move on from
+ */
+
+/**
+ * Progression fields of a new game (mirrors the LighthouseGame constructor)
+ */
+const NEW_GAME = {
+    plotPhase: 'wake_up',
+    hasInspectedBoat: false,
+    firstEncounterTriggered: false,
+    coins: 0,
+    planks: 0,
+    completedQuests: [],
+    discoveredCreatures: [],
+    party: [],
+    spoken: [],
+    activeQuest: null
+};
+
+/**
+ * The next creature random encounters can find (checkRandomEncounter), in
+ * CREATURES order: only how many are discovered affects the story
+ */
+function nextCreature(game, data) {
+    const tables = data.buildEncounterTables(data.CREATURES, game.discoveredCreatures, game.playerAbilities);
+    const findable = new Set(Object.values(tables).flatMap(table => table.creatureIds));
+    return Object.keys(data.CREATURES).find(id => findable.has(id));
+}
+
+// Plot phases whose milestones count creatures. Creatures found earlier
+// count as the phase starts (refreshTriggers -> checkCreatureMilestones), the
+// same as finding them then, so discoveries are only offered in these
+const CREATURE_PHASES = ['return_keeper', 'working'];
+
+/**
+ * checkCreatureMilestones: the phase the discovered creatures move the plot to
+ */
+function creatureMilestone(game) {
+    const found = game.discoveredCreatures.size;
+    if (game.plotPhase === 'return_keeper' && found >= 3) return 'working';
+    if (game.plotPhase === 'working' && found >= 5) return 'boat_ready';
+    return game.plotPhase;
+}
+
+// Plot phases whose dialogues read coins. Coins earned earlier could as well
+// be earned once one starts, so jobs are only offered then
+const JOB_PHASES = ['boat_quest', 'working'];
+
+/**
+ * showJob answered correctly (submitJobAnswer) for a job NPC. Only offered
+ * while planks are out of reach, which keeps coins bounded
+ */
+function jobEvent(npcId) {
+    return {
+        name: `${npcId} job`,
+        when: (game, data) => {
+            const item = data.SHOP_ITEMS.find(i => i.id === 'planks');
+            return data.NPCS[npcId] && item && JOB_PHASES.includes(game.plotPhase) && game.coins < item.price;
+        },
+        run: (game, data) => { game.coins += data.NPCS[npcId].payment; }
+    };
+}
+
+/**
+ * Game-side events that change progression outside data.js
+ * (each mirrors the named LighthouseGame method)
+ */
+const WORLD_EVENTS = [
+    {
+        // showBoatDialogue
+        name: 'inspect boat',
+        when: game => game.plotPhase === 'boat_quest' && !game.hasInspectedBoat,
+        run: game => { game.hasInspectedBoat = true; }
+    },
+    {
+        // showBoatDialogue once the boat is ready
+        name: 'board boat',
+        when: game => game.plotPhase === 'boat_ready',
+        run: game => { game.plotPhase = 'departure'; }
+    },
+    {
+        // checkCreatureEncounter -> startFirstCreatureEncounter -> finalizeCreatureNaming
+        name: 'first creature encounter',
+        when: game => game.plotPhase === 'find_creature' && !game.firstEncounterTriggered,
+        run: game => {
+            game.firstEncounterTriggered = true;
+            game.party.push({ id: 'lumina', name: 'Shimmer', isStarter: true });
+            game.discoveredCreatures.add('lumina');
+            game.plotPhase = 'creature_found';
+        }
+    },
+    {
+        // checkRandomEncounter -> triggerCreatureEncounter -> discoverCreature
+        name: 'discover creature',
+        when: (game, data) => CREATURE_PHASES.includes(game.plotPhase) && !!nextCreature(game, data),
+        run: (game, data) => {
+            game.discoveredCreatures.add(nextCreature(game, data));
+            game.plotPhase = creatureMilestone(game);
+        }
+    },
+    jobEvent('dr_nova'),
+    jobEvent('fisherman'),
+    {
+        // buyItem('planks'); more than the boat needs changes nothing
+        name: 'buy planks',
+        when: (game, data) => {
+            const item = data.SHOP_ITEMS.find(i => i.id === 'planks');
+            return item && game.coins >= item.price &&
+                game.boatQuest.planks.collected < game.boatQuest.planks.required;
+        },
+        run: (game, data) => {
+            const item = data.SHOP_ITEMS.find(i => i.id === 'planks');
+            game.coins -= item.price;
+            game.boatQuest.planks.collected += item.quantity || 1;
+        }
+    }
+];
+
+// Thrown when a dialogue offers choices the current choice path doesn't cover
+class ChoicePoint {
+    constructor(count) {
+        this.count = count;
+    }
+}
+
+class StateSpaceExplorer {
+    /**
+     * @param {Object} data - { NPCS, QUESTS, QUEST_STEP_HANDLERS, SHOP_ITEMS, findDialogue, GameState, QuestSystem, TriggerZones } (see loadGameData.js)
+     * @param {Object} [options]
+     * @param {Object} [options.initialState] - Overrides for NEW_GAME
+     * @param {Array} [options.worldEvents] - Replaces WORLD_EVENTS
+     * @param {Array} [options.terminalPhases] - Plot phases where the story may end (not dead ends)
+     * @param {number} [options.maxStates] - Stop exploring after this many states
+     * @param {number} [options.maxChoiceDepth] - Longest chain of nested choices followed per event
+     */
+    constructor(data, options = {}) {
+        this.data = data;
+        this.npcs = data.NPCS;
+        this.initialState = { ...NEW_GAME, ...(options.initialState || {}) };
+        this.worldEvents = options.worldEvents || WORLD_EVENTS;
+        this.terminalPhases = new Set(options.terminalPhases || ['departure']);
+        this.maxStates = options.maxStates || 100000;
+        this.maxChoiceDepth = options.maxChoiceDepth || 8;
+
+        // npcId -> Map(read fields -> { fields, table: Map(projected values -> dialogue index) })
+        this.selectionMemo = new Map();
+        this.memoHits = 0;
+        this.memoMisses = 0;
+        this.forgetPastPhases = true;
+    }
+
+    /**
+     * Explore breadth-first from the initial state.
+     *
+     * NPC "spoken to" flags are per plot phase, so while phases only move
+     * forward the flags of phases already left can never matter again and
+     * are dropped from the state. If the phases reached turn out to contain
+     * a cycle, the space is explored again keeping every flag.
+     * @returns {Object} { states, edges, truncated, deadEnds, unreachableDialogues, silentTalks, memo, forgotPastPhases }
+     */
+    explore() {
+        this.forgetPastPhases = true;
+        const result = this.exploreStates();
+        if (!this.hasCycle(result.phaseEdges)) return result;
+
+        this.forgetPastPhases = false;
+        return this.exploreStates();
+    }
+
+    exploreStates() {
+        const start = this.canonicalize(this.createGame(this.initialState).game);
+        const startHash = this.hashState(start);
+        const states = new Map([[startHash, { state: start, depth: 0, parent: null, label: 'new game' }]]);
+        const queue = [startHash];
+        const shown = new Set();        // `${npcId}#${index}` of dialogues shown in full
+        const silentTalks = new Map();  // npcId -> first state hash where nothing matched
+        const deadEnds = [];
+        const phaseEdges = new Set();
+        let edges = 0;
+        let truncated = false;
+
+        for (let head = 0; head < queue.length; head++) {
+            const hash = queue[head];
+            const { state, depth } = states.get(hash);
+            let progresses = false;
+
+            for (const event of this.events(state)) {
+                for (const outcome of this.outcomes(state, event)) {
+                    outcome.observed.forEach(seen => {
+                        if (seen.dialogue !== undefined && !seen.repeat) shown.add(`${seen.npcId}#${seen.dialogue}`);
+                        if (seen.dialogue === -1 && !silentTalks.has(seen.npcId)) silentTalks.set(seen.npcId, hash);
+                    });
+
+                    const nextHash = this.hashState(outcome.state);
+                    if (nextHash === hash) continue;
+                    progresses = true;
+                    edges++;
+                    if (outcome.state.plotPhase !== state.plotPhase) {
+                        phaseEdges.add(`${state.plotPhase}>${outcome.state.plotPhase}`);
+                    }
+
+                    if (!states.has(nextHash)) {
+                        if (states.size >= this.maxStates) {
+                            truncated = true;
+                            continue;
+                        }
+                        states.set(nextHash, { state: outcome.state, depth: depth + 1, parent: hash, label: outcome.label });
+                        queue.push(nextHash);
+                    }
+                }
+            }
+
+            if (!progresses && !this.terminalPhases.has(state.plotPhase)) {
+                deadEnds.push(hash);
+            }
+        }
+
+        const unreachableDialogues = [];
+        Object.entries(this.npcs).forEach(([npcId, npc]) => {
+            if (npc.type !== 'dialogue_npc' || !npc.dialogues) return;
+            npc.dialogues.forEach((dialogue, index) => {
+                if (!shown.has(`${npcId}#${index}`)) {
+                    unreachableDialogues.push({ npcId, index, text: this.describeText(dialogue.text) });
+                }
+            });
+        });
+
+        return {
+            states,
+            edges,
+            truncated,
+            deadEnds: deadEnds.map(hash => ({ state: states.get(hash).state, path: this.pathTo(states, hash) })),
+            unreachableDialogues,
+            silentTalks: [...silentTalks].map(([npcId, hash]) => ({
+                npcId, state: states.get(hash).state, path: this.pathTo(states, hash)
+            })),
+            memo: { hits: this.memoHits, misses: this.memoMisses },
+            phaseEdges,
+            forgotPastPhases: this.forgetPastPhases
+        };
+    }
+
+    /**
+     * Whether the plot phase graph ('from>to' edges) has a cycle
+     */
+    hasCycle(phaseEdges) {
+        const next = new Map();
+        phaseEdges.forEach(edge => {
+            const [from, to] = edge.split('>');
+            if (!next.has(from)) next.set(from, []);
+            next.get(from).push(to);
+        });
+
+        const visiting = new Set();
+        const done = new Set();
+        const visit = phase => {
+            if (done.has(phase)) return false;
+            if (visiting.has(phase)) return true;
+            visiting.add(phase);
+            const cyclic = (next.get(phase) || []).some(visit);
+            visiting.delete(phase);
+            done.add(phase);
+            return cyclic;
+        };
+        return [...next.keys()].some(visit);
+    }
+
+    /**
+     * Everything the player can do in a state
+     * @returns {Array} [{ label, run(game) }]
+     */
+    events(state) {
+        const { game } = this.createGame(state);
+        const events = [];
+
+        Object.entries(this.npcs).forEach(([npcId, npc]) => {
+            if (npc.type === 'dialogue_npc' && npc.dialogues) {
+                events.push({ label: `talk to ${npcId}`, run: g => this.talk(g, npcId) });
+            }
+        });
+
+        this.worldEvents.forEach(event => {
+            if (event.when(game, this.data)) {
+                events.push({ label: event.name, run: g => event.run(g, this.data) });
+            }
+        });
+
+        // Walk to the active quest step's location (its objective zone's onEnter)
+        const active = game.activeQuest;
+        const step = active && active.quest.steps && active.quest.steps[active.currentStep];
+        if (step && step.location) {
+            events.push({
+                label: `go to ${active.questId} step ${active.currentStep + 1}`,
+                run: g => {
+                    g.player.x = step.location.x;
+                    g.player.y = step.location.y;
+                    g.triggers.moveTo(step.location.x, step.location.y, g);
+                }
+            });
+        }
+
+        return events;
+    }
+
+    /**
+     * Every state an event can lead to, one per path through the choices it offers
+     * @returns {Array} [{ state, label, observed }]
+     */
+    outcomes(state, event) {
+        const outcomes = [];
+        const paths = [[]];
+
+        while (paths.length > 0) {
+            const path = paths.pop();
+            const { game, observed, choiceTexts } = this.createGame(state, path);
+            try {
+                event.run(game);
+                game.dialogue.flush();
+            } catch (error) {
+                if (!(error instanceof ChoicePoint)) throw error;
+                if (path.length < this.maxChoiceDepth) {
+                    for (let i = error.count - 1; i >= 0; i--) paths.push([...path, i]);
+                }
+                continue;
+            }
+            const label = [event.label, ...choiceTexts.map(text => `"${text}"`)].join(' → ');
+            outcomes.push({ state: this.canonicalize(game), label, observed });
+        }
+
+        return outcomes;
+    }
+
+    /**
+     * Talk to an NPC (mirrors DialogueQueueSystem.showNPCDialog)
+     */
+    talk(game, npcId) {
+        const npc = this.npcs[npcId];
+        const index = this.selectDialogue(npcId, game);
+        if (index === -1) {
+            game.observed.push({ npcId, dialogue: -1 });
+            return;
+        }
+
+        const dialogue = npc.dialogues[index];
+        const interactionKey = `${npcId}_${game.plotPhase}`;
+        const timesSpoken = game.npcInteractions.get(interactionKey) || 0;
+        if (timesSpoken > 0 && dialogue.repeatText) {
+            game.observed.push({ npcId, dialogue: index, repeat: true });
+            return;
+        }
+
+        game.npcInteractions.set(interactionKey, timesSpoken + 1);
+        game.observed.push({ npcId, dialogue: index });
+
+        const choices = dialogue.choices ? dialogue.choices.map(choice => ({
+            text: choice.text,
+            action: () => choice.action(game)
+        })) : null;
+        game.dialogue.startDialogue([], choices, dialogue.onClose || null, npc.name);
+    }
+
+    /**
+     * Index of the first dialogue whose condition matches, or -1.
+     * Memoized on the game fields the conditions actually read, so states
+     * that differ only in fields no condition looks at share one evaluation.
+     */
+    selectDialogue(npcId, game) {
+        if (!this.selectionMemo.has(npcId)) this.selectionMemo.set(npcId, new Map());
+        const memo = this.selectionMemo.get(npcId);
+
+        for (const { fields, table } of memo.values()) {
+            const key = this.projectionKey(game, fields);
+            if (table.has(key)) {
+                this.memoHits++;
+                return table.get(key);
+            }
+        }
+
+        this.memoMisses++;
+        const read = new Set();
+        const tracked = new Proxy(game, {
+            get(target, prop, receiver) {
+                if (typeof prop === 'string') read.add(prop);
+                return Reflect.get(target, prop, receiver);
+            }
+        });
+        const npc = this.npcs[npcId];
+        const dialogue = this.data.findDialogue(npc, tracked);
+        const index = dialogue ? npc.dialogues.indexOf(dialogue) : -1;
+
+        const fields = [...read].sort();
+        const signature = fields.join(',');
+        if (!memo.has(signature)) memo.set(signature, { fields, table: new Map() });
+        memo.get(signature).table.set(this.projectionKey(game, fields), index);
+        return index;
+    }
+
+    projectionKey(game, fields) {
+        return JSON.stringify(fields.map(field => {
+            const value = game[field];
+            if (value instanceof Set) return [...value].sort();
+            if (value instanceof Map) return [...value.keys()].sort();
+            return typeof value === 'function' ? null : value;
+        }));
+    }
+
+    /**
+     * A mock game for a canonical state. Dialogues are queued like
+     * DialogueQueueSystem and closed in order; a dialogue with choices takes
+     * the next index from choicePath, or throws ChoicePoint when it runs out.
+     */
+    createGame(state, choicePath = []) {
+        const { QUESTS, GameState, QuestSystem, TriggerZones } = this.data;
+        const observed = [];
+        const choiceTexts = [];
+        const path = [...choicePath];
+        const queue = [];
+
+        const game = {
+            state: GameState.EXPLORING,
+            plotPhase: state.plotPhase,
+            hasInspectedBoat: state.hasInspectedBoat,
+            firstEncounterTriggered: state.firstEncounterTriggered,
+            coins: state.coins,
+            completedQuests: new Set(state.completedQuests),
+            discoveredCreatures: new Set(state.discoveredCreatures),
+            playerAbilities: new Set(),
+            party: state.party.map((id, i) => ({ id, name: id, isStarter: i === 0 })),
+            npcInteractions: new Map(state.spoken.map(key => [key, 1])),
+            activeQuest: state.activeQuest ? {
+                ...state.activeQuest,
+                quest: QUESTS[state.activeQuest.questId],
+                npcName: this.npcs[state.activeQuest.npcId] ? this.npcs[state.activeQuest.npcId].name : state.activeQuest.npcId
+            } : null,
+            questObjective: null,
+            boatQuest: {
+                planks: { required: 8, collected: state.planks },
+                rope: { required: 20, collected: 0 },
+                compass: { required: true, acquired: false },
+                helpFromCallum: { required: true, earned: false }
+            },
+            inventory: new Set(['map']),
+            player: { x: 15, y: 19 },
+            map: { tileSize: 16, objects: [] },
+            triggers: new TriggerZones(32, 32),
+            observed,
+
+            showDialog() {},
+            updateUI() {},
+            clearAllKeys() {},
+            showBoatQuestExplanation() {},
+            startDialogue: (lines, choices, onClose) => game.dialogue.startDialogue(lines, choices, onClose),
+            advanceQuestStep: () => game.questSystem.advanceQuestStep(),
+            showQuestProblem: (...args) => game.questSystem.showQuestProblem(...args),
+
+            dialogue: {
+                startDialogue(lines, choices = null, onClose = null) {
+                    queue.push({ choices, onClose });
+                },
+                queue(dialogue) {
+                    // Mirrors the game's trigger:quest_step_completed listener
+                    const onClose = dialogue.trigger === 'quest_step_completed' ? () => {
+                        if (game.activeQuest.currentStep >= game.activeQuest.quest.steps.length) {
+                            game.questSystem.completeQuest();
+                        } else {
+                            game.questSystem.advanceQuestStep();
+                        }
+                    } : null;
+                    queue.push({ choices: dialogue.choices || null, onClose });
+                },
+                queueFlow() {},
+                showDialog() {},
+                // Close queued dialogues in order, picking choices from the path
+                flush() {
+                    while (queue.length > 0) {
+                        const { choices, onClose } = queue.shift();
+                        if (choices && choices.length > 0) {
+                            if (path.length === 0) throw new ChoicePoint(choices.length);
+                            const choice = choices[path.shift()];
+                            choiceTexts.push(choice.text);
+                            if (choice.action) choice.action();
+                        }
+                        if (onClose) onClose(game);
+                    }
+                }
+            }
+        };
+        game.questSystem = new QuestSystem(game);
+        game.questSystem.syncObjectiveZone();  // A restored quest's current step
+
+        return { game, observed, choiceTexts };
+    }
+
+    /**
+     * The progression fields of a game as plain data; equal states hash equally
+     */
+    canonicalize(game) {
+        return {
+            plotPhase: game.plotPhase,
+            hasInspectedBoat: !!game.hasInspectedBoat,
+            firstEncounterTriggered: !!game.firstEncounterTriggered,
+            coins: game.coins || 0,
+            planks: game.boatQuest ? game.boatQuest.planks.collected : 0,
+            completedQuests: [...game.completedQuests].sort(),
+            discoveredCreatures: [...game.discoveredCreatures].sort(),
+            party: game.party.map(c => c.id),
+            // Only "spoken before" matters to showNPCDialog, not how often
+            spoken: [...game.npcInteractions.keys()]
+                .filter(key => game.npcInteractions.get(key) > 0)
+                .filter(key => !this.forgetPastPhases || key.endsWith(`_${game.plotPhase}`))
+                .sort(),
+            activeQuest: game.activeQuest ? {
+                questId: game.activeQuest.questId,
+                currentStep: game.activeQuest.currentStep,
+                npcId: game.activeQuest.npcId
+            } : null
+        };
+    }
+
+    hashState(state) {
+        return JSON.stringify(state);
+    }
+
+    pathTo(states, hash) {
+        const labels = [];
+        for (let entry = states.get(hash); entry && entry.parent !== null; entry = states.get(entry.parent)) {
+            labels.push(entry.label);
+        }
+        return labels.reverse();
+    }
+
+    describeText(text) {
+        if (typeof text === 'function') return '[Dynamic function]';
+        if (Array.isArray(text)) return text.map(t => (typeof t === 'object' ? t.text : t)).join(' | ');
+        return text;
+    }
+
+    describeState(state) {
+        const parts = [`phase=${state.plotPhase}`, `boat=${state.hasInspectedBoat}`, `coins=${state.coins}`, `planks=${state.planks}`];
+        parts.push(`quests=[${state.completedQuests.join(',')}]`);
+        if (state.activeQuest) parts.push(`active=${state.activeQuest.questId}#${state.activeQuest.currentStep + 1}`);
+        return parts.join(', ');
+    }
+
+    /**
+     * Text report of an explore() result
+     */
+    report(result, { maxExamples = 5 } = {}) {
+        let output = `\n=== Reachable State Space ===\n`;
+        output += `States: ${result.states.size}${result.truncated ? ` (stopped at maxStates=${this.maxStates})` : ''}\n`;
+        output += `Transitions: ${result.edges}\n`;
+        if (!result.forgotPastPhases) {
+            output += `Plot phases can repeat, so every "spoken to" flag was kept\n`;
+        }
+        output += `Condition memo: ${result.memo.hits} hits, ${result.memo.misses} evaluations\n`;
+
+        const phases = new Map();
+        result.states.forEach(({ state }) => phases.set(state.plotPhase, (phases.get(state.plotPhase) || 0) + 1));
+        output += `Phases: ${[...phases].map(([phase, count]) => `${phase} (${count})`).join(', ')}\n`;
+
+        if (result.unreachableDialogues.length > 0) {
+            output += `\n⚠️  UNREACHABLE DIALOGUES (${result.unreachableDialogues.length}):\n`;
+            result.unreachableDialogues.forEach(d => {
+                output += `  ${d.npcId} #${d.index + 1}: "${d.text}"\n`;
+            });
+        }
+
+        if (result.silentTalks.length > 0) {
+            output += `\n⚠️  NPCS WITH NO MATCHING DIALOGUE (${result.silentTalks.length}):\n`;
+            result.silentTalks.forEach(s => {
+                output += `  ${s.npcId} in ${this.describeState(s.state)}\n`;
+                output += `    via: ${s.path.join(' ⇒ ') || 'new game'}\n`;
+            });
+        }
+
+        if (result.deadEnds.length > 0) {
+            output += `\n❌ DEAD ENDS (${result.deadEnds.length}):\n`;
+            result.deadEnds.slice(0, maxExamples).forEach(d => {
+                output += `  ${this.describeState(d.state)}\n`;
+                output += `    via: ${d.path.join(' ⇒ ') || 'new game'}\n`;
+            });
+            if (result.deadEnds.length > maxExamples) {
+                output += `  ... and ${result.deadEnds.length - maxExamples} more\n`;
+            }
+        }
+
+        if (result.unreachableDialogues.length === 0 && result.deadEnds.length === 0) {
+            output += `\n✓ Every dialogue is reachable and every state can progress\n`;
+        }
+
+        return output;
+    }
+}
+
+// Export for use in tests
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = StateSpaceExplorer;
+    module.exports.WORLD_EVENTS = WORLD_EVENTS;
+    module.exports.NEW_GAME = NEW_GAME;
+}
@@ -23,6 +23,7 @@ const transformedCode = dataCode
 
 eval(transformedCode);
 const { NPCS } = global;
+global.findDialogue = findDialogue;  // used by showNPCDialog
 
 // Load DialogueQueueSystem
 const DialogueQueueSystem = require('../src/dialogueQueueSystem.js');
@@ -30,6 +30,8 @@ const files = [
     '../src/questSystem.js',
     '../src/dialogueQueueSystem.js',
     '../src/inputRouter.js',
+    '../src/worldMap.js',
+    '../src/triggerZones.js',
     '../src/renderingSystem.js',
     '../src/game.js'
 ];
@@ -16,6 +16,7 @@ const transformedCode = dataCode
 
 eval(transformedCode);
 const { NPCS } = global;
+global.findDialogue = findDialogue;  // used by showNPCDialog
 
 const DialogueQueueSystem = require('../src/dialogueQueueSystem.js');
 
@@ -119,11 +119,11 @@ for (let i = 0; i < fishingRecords.steps.length; i++) {
     mockGame.player.y = step.location.y;
     console.log(`  Player moves to (${step.location.x}, ${step.location.y})`);
 
-    // Trigger onUpdate
-    const result = handler.onUpdate(mockGame, step);
-    console.log(`  Handler returned: completed=${result.completed}`);
+    // Arrive (what the objective zone's onEnter runs)
+    const result = handler.onArrive(mockGame, step);
+    console.log(`  Handler returned: "${result.message}"`);
 
-    if (result.completed && result.choices) {
+    if (result.choices) {
         console.log(`  Problem presented with ${result.choices.length} choices`);
 
         // Find correct answer
@@ -0,0 +1,330 @@
+/**
+ * Trigger Zone Tests
+ * Validates tile coverage of rectangle and circle zones, enter/exit events
+ * as the player moves, refresh after a state change, and zone removal, and
+ * that quest objectives complete from their zone's enter event
+ */
+
+const { TriggerZones, QUESTS, QuestSystem } = require('./loadGameData.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+/**
+ * Zones that log their events, as 'enter <id>' / 'exit <id>'
+ */
+function loggedZone(log, zone) {
+    return {
+        ...zone,
+        onEnter: (context, z) => log.push(`enter ${z.id}`),
+        onExit: (context, z) => log.push(`exit ${z.id}`)
+    };
+}
+
+/**
+ * The parts of Game that QuestSystem and the step handlers use, recording
+ * the dialogues they start
+ */
+function createQuestGame() {
+    const game = {
+        triggers: new TriggerZones(32, 32),
+        player: { x: 15, y: 19 },
+        inventory: new Set(),
+        activeQuest: null,
+        questObjective: null,
+        coins: 0,
+        completedQuests: new Set(),
+        dialogues: [],
+        startDialogue: (lines, choices) => game.dialogues.push({ text: lines.join(' '), choices }),
+        showDialog: text => game.dialogues.push({ text }),
+        dialogue: { queue: line => game.dialogues.push(line) },
+        advanceQuestStep: () => game.questSystem.advanceQuestStep(),
+        updateUI: () => {}
+    };
+    game.questSystem = new QuestSystem(game);
+    return game;
+}
+
+/**
+ * Start a multi-step quest the way QuestSystem.startQuest does
+ */
+function startQuest(game, questId, quest = QUESTS[questId]) {
+    game.activeQuest = { questId, quest, currentStep: 0, npcName: 'Marlowe' };
+    game.questSystem.advanceQuestStep();
+}
+
+/**
+ * Move the player as Game.updateMovement and Game.teleportPlayer do
+ */
+function moveTo(game, x, y) {
+    game.player.x = x;
+    game.player.y = y;
+    game.triggers.moveTo(x, y, game);
+}
+
+/**
+ * Pick the right answer from the problem shown on arriving at a step
+ */
+function answerCorrectly(game, step) {
+    const shown = game.dialogues[game.dialogues.length - 1];
+    shown.choices.find(choice => choice.text === String(step.onArrive.problem.correct)).action();
+}
+
+console.log('Testing trigger zones...\n');
+
+test('Rectangles cover exactly their tiles, clipped to the map', () => {
+    const zones = new TriggerZones(10, 10);
+    zones.add({ id: 'rect', x: 7, y: 7, width: 2, height: 2 });
+    zones.add({ id: 'edge', x: 8, y: -1, width: 4, height: 3 });
+
+    for (let y = 0; y < 10; y++) {
+        for (let x = 0; x < 10; x++) {
+            const inRect = x >= 7 && x < 9 && y >= 7 && y < 9;
+            const inEdge = x >= 8 && y < 2;
+            assert(zones.contains('rect', x, y) === inRect, `rect at ${x},${y} should be ${inRect}`);
+            assert(zones.contains('edge', x, y) === inEdge, `edge at ${x},${y} should be ${inEdge}`);
+        }
+    }
+    assert(zones.zonesAt(-1, 0).length === 0 && zones.zonesAt(10, 9).length === 0,
+           'Off-map tiles should have no zones');
+});
+
+test('Circles match the quest steps\' distance test', () => {
+    let checked = 0;
+    Object.values(QUESTS).forEach(quest => (quest.steps || []).forEach(step => {
+        if (!step.location) return;
+        const zones = new TriggerZones(32, 32);
+        zones.add({ id: 'step', x: step.location.x, y: step.location.y, radius: step.radius });
+
+        for (let y = 0; y < 32; y++) {
+            for (let x = 0; x < 32; x++) {
+                const dx = x - step.location.x;
+                const dy = y - step.location.y;
+                const expected = Math.sqrt(dx * dx + dy * dy) <= step.radius;
+                assert(zones.contains('step', x, y) === expected,
+                       `${quest.name} step at ${x},${y}: expected ${expected}`);
+                checked++;
+            }
+        }
+    }));
+    assert(checked > 0, 'No quest steps with a location');
+});
+
+test('Moving fires exit before enter, once per crossing', () => {
+    const log = [];
+    const zones = new TriggerZones(32, 32);
+    zones.add(loggedZone(log, { id: 'a', x: 7, y: 7, width: 2, height: 2 }));
+    zones.add(loggedZone(log, { id: 'b', x: 10, y: 7, radius: 1 }));
+
+    [[6, 7], [7, 7], [8, 7], [8, 8], [9, 7], [10, 7], [10, 8], [12, 7]].forEach(([x, y]) => {
+        log.push(`@${x},${y}`);
+        zones.moveTo(x, y, null);
+    });
+
+    const expected = '@6,7 @7,7 enter a @8,7 @8,8 @9,7 exit a enter b @10,7 @10,8 @12,7 exit b';
+    assert(log.join(' ') === expected, `Expected "${expected}", got "${log.join(' ')}"`);
+});
+
+test('Callbacks receive the context and zone', () => {
+    const seen = [];
+    const zones = new TriggerZones(8, 8);
+    const game = { name: 'game' };
+    zones.add({ id: 'z', x: 1, y: 1, width: 1, height: 1, onEnter: (context, zone) => seen.push([context, zone.id]) });
+    zones.moveTo(1, 1, game);
+    assert(seen.length === 1 && seen[0][0] === game && seen[0][1] === 'z', 'onEnter should get (context, zone)');
+});
+
+test('refresh re-runs onEnter for zones the player stays in', () => {
+    const game = { phase: 'wake_up', encounters: 0 };
+    const zones = new TriggerZones(32, 32);
+    zones.add({
+        id: 'first_encounter', x: 7, y: 7, width: 2, height: 2,
+        onEnter: context => {
+            if (context.phase === 'find_creature') context.encounters++;
+        }
+    });
+
+    zones.moveTo(7, 7, game);
+    assert(game.encounters === 0, 'Wrong phase: no encounter on entry');
+
+    game.phase = 'find_creature';
+    zones.refresh(7, 7, game);
+    assert(game.encounters === 1, 'Phase change inside the zone should trigger it');
+
+    zones.refresh(20, 20, game);
+    zones.refresh(8, 8, game);
+    assert(game.encounters === 2, 'refresh should also handle a teleport into the zone');
+});
+
+test('remove fires no exit and clears the zone\'s tiles', () => {
+    const log = [];
+    const zones = new TriggerZones(16, 16);
+    zones.add(loggedZone(log, { id: 'a', x: 2, y: 2, width: 3, height: 3 }));
+    zones.add(loggedZone(log, { id: 'b', x: 3, y: 3, radius: 1 }));
+
+    zones.moveTo(3, 3, null);
+    assert(zones.remove('a') === true, 'remove should report the zone existed');
+    assert(zones.remove('a') === false, 'Removing twice should report nothing removed');
+    zones.moveTo(9, 9, null);
+
+    assert(log.join(' ') === 'enter a enter b exit b', `Unexpected events: ${log.join(' ')}`);
+    assert(!zones.contains('a', 2, 2) && zones.zonesAt(3, 3).map(z => z.id).join() === 'b',
+           'Removed zone should be gone from its tiles');
+    zones.remove('b');
+    assert(zones.buckets.size === 0, `Empty buckets should be dropped, ${zones.buckets.size} left`);
+});
+
+test('Adding a zone with an existing id replaces it', () => {
+    const zones = new TriggerZones(16, 16);
+    zones.add({ id: 'objective', x: 1, y: 1, radius: 1 });
+    zones.add({ id: 'objective', x: 10, y: 10, radius: 0 });
+
+    assert(!zones.contains('objective', 1, 1), 'Old area should be gone');
+    assert(zones.contains('objective', 10, 10), 'New area should be registered');
+    assert(zones.zones.size === 1, 'Only one zone should be registered');
+});
+
+test('Callbacks may remove zones during a move', () => {
+    const log = [];
+    const zones = new TriggerZones(16, 16);
+    zones.add({ id: 'once', x: 4, y: 4, width: 1, height: 1, onEnter: () => { log.push('once'); zones.remove('other'); } });
+    zones.add(loggedZone(log, { id: 'other', x: 4, y: 4, width: 1, height: 1 }));
+
+    zones.moveTo(4, 4, null);
+    assert(log.join(' ') === 'once', `A zone removed by an earlier callback should not fire, got ${log.join(' ')}`);
+});
+
+test('Walking into a step\'s zone completes its objective', () => {
+    const game = createQuestGame();
+    const [first] = QUESTS.fishing_records.steps;
+    startQuest(game, 'fishing_records');
+    assert(game.questObjective === first.description, 'Starting the step should set its objective');
+
+    // (6, 8) radius 2: the zone starts at x = 8 along row 8
+    [[10, 8], [9, 8]].forEach(([x, y]) => {
+        moveTo(game, x, y);
+        assert(game.dialogues.length === 0, `Nothing should happen at ${x},${y}, outside the zone`);
+    });
+
+    moveTo(game, 8, 8);
+    assert(game.dialogues.length === 1, `Entering the zone should show one dialogue, got ${game.dialogues.length}`);
+    assert(game.dialogues[0].text.includes(first.onArrive.problem.question), 'Arrival should show the problem');
+    assert(game.questObjective === null, 'Arriving should clear the objective');
+    assert(game.activeQuest.currentStep === 0, 'visit_and_solve should wait for the answer');
+
+    moveTo(game, 7, 8);
+    assert(game.dialogues.length === 1, 'Moving within the zone should not show it again');
+});
+
+test('Teleporting into the next step\'s zone completes it', () => {
+    const game = createQuestGame();
+    const [first, second] = QUESTS.fishing_records.steps;
+    startQuest(game, 'fishing_records');
+    moveTo(game, first.location.x, first.location.y);
+    answerCorrectly(game, first);
+
+    assert(game.activeQuest.currentStep === 1, 'The right answer should advance to step 2');
+    assert(game.questObjective === second.description, 'Step 2 should set its objective');
+    assert(!game.triggers.contains('quest_objective', first.location.x, first.location.y),
+           'Step 1\'s zone should be replaced by step 2\'s');
+
+    const shown = game.dialogues.length;
+    moveTo(game, second.location.x, second.location.y);
+    assert(game.dialogues.length === shown + 1, 'Teleporting in should complete the objective');
+    assert(game.dialogues[shown].text.includes(second.onArrive.problem.question), 'Arrival should show step 2\'s problem');
+});
+
+test('An abandoned quest\'s zone does nothing and removes itself', () => {
+    const game = createQuestGame();
+    const [first] = QUESTS.fishing_records.steps;
+    startQuest(game, 'fishing_records');
+    game.activeQuest = null;  // As "Abandon Quest" does
+
+    moveTo(game, first.location.x, first.location.y);
+    assert(game.dialogues.length === 0, 'No quest is active, so nothing should show');
+    assert(!game.triggers.contains('quest_objective', first.location.x, first.location.y),
+           'The stale zone should remove itself');
+});
+
+test('Finishing the quest removes its objective zone', () => {
+    const game = createQuestGame();
+    const steps = QUESTS.fishing_records.steps;
+    startQuest(game, 'fishing_records');
+    steps.forEach(step => {
+        moveTo(game, 0, 0);
+        moveTo(game, step.location.x, step.location.y);
+        answerCorrectly(game, step);
+    });
+
+    game.questSystem.completeQuest();  // The last answer's quest_step_completed trigger
+    assert(game.completedQuests.has('fishing_records'), 'The quest should be completed');
+    assert(game.triggers.zones.size === 0, 'No objective zone should be left');
+});
+
+test('Getting the item completes a fetch_item step', () => {
+    const quest = {
+        type: 'multi_step',
+        steps: [{ type: 'fetch_item', itemId: 'net', description: 'Find a net', onComplete: { message: 'Got the net!' } }]
+    };
+
+    const game = createQuestGame();
+    startQuest(game, 'fetch_net', quest);
+    const shown = game.dialogues.length;
+    game.questSystem.itemAdded('map');
+    assert(game.dialogues.length === shown, 'Another item should not complete the step');
+
+    game.inventory.add('net');
+    game.questSystem.itemAdded('net');
+    assert(game.dialogues[shown].text === 'Got the net!', 'Getting the item should complete the step');
+    assert(game.activeQuest.currentStep === 1, 'fetch_item should advance past the step');
+
+    const carrying = createQuestGame();
+    carrying.inventory.add('net');
+    startQuest(carrying, 'fetch_net', quest);
+    assert(carrying.dialogues.some(d => d.text === 'Got the net!'), 'Already carrying the item should complete it at once');
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ TRIGGER ZONE TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL TRIGGER ZONE TESTS PASSED!');
+    process.exit(0);
+}
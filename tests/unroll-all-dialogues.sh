@@ -317,13 +317,12 @@ game.player.x = firstStep.location.x;
 game.player.y = firstStep.location.y;
 
 console.log(`\nPlayer at (${game.player.x}, ${game.player.y})`);
-console.log(`Calling handler.onUpdate()...`);
+console.log(`Calling handler.onArrive() (the objective zone's onEnter)...`);
 
 game.clearLogs();
-const updateResult = handler.onUpdate(game, firstStep);
+const updateResult = handler.onArrive(game, firstStep);
 
 console.log(`\n📝 HANDLER RETURNED:`);
-console.log(`  completed: ${updateResult.completed}`);
 console.log(`  message: "${updateResult.message}"`);
 console.log(`  choices: ${updateResult.choices ? updateResult.choices.length : 0}`);
 
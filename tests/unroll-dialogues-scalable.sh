@@ -224,7 +224,7 @@ function testQuestHandlers() {
                     results.issues.push(`Quest "${questId}" step ${stepIndex}: No handler for type "${step.type}"`);
                 } else {
                     handlerResult.hasOnStart = !!handler.onStart;
-                    handlerResult.hasOnUpdate = !!handler.onUpdate;
+                    handlerResult.hasOnArrive = !!handler.onArrive;
                     handlerResult.hasOnRender = !!handler.onRender;
 
                     // Try running onStart
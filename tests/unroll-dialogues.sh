@@ -217,13 +217,12 @@ game.player.x = firstStep.location.x;
 game.player.y = firstStep.location.y;
 
 console.log(`\nPlayer position: (${game.player.x}, ${game.player.y})`);
-console.log(`\nCalling: handler.onUpdate(game, step)`);
+console.log(`\nCalling: handler.onArrive(game, step) (the objective zone's onEnter)`);
 
 game.clearStateLog();
-const updateResult = handler.onUpdate(game, firstStep);
+const updateResult = handler.onArrive(game, firstStep);
 
 console.log('\n📝 HANDLER RETURNED:');
-console.log(`  completed: ${updateResult.completed}`);
 if (updateResult.message) {
     console.log(`  message: "${updateResult.message}"`);
 }
@@ -255,10 +254,10 @@ if (game.questObjective === firstStep.description) {
     issues.push(`Quest objective mismatch: expected "${firstStep.description}", got "${game.questObjective}"`);
 }
 
-if (updateResult && updateResult.completed) {
-    successes.push('Handler.onUpdate() returns completed=true at location');
+if (updateResult && updateResult.message) {
+    successes.push('Handler.onArrive() returns the arrival message');
 } else {
-    issues.push('Handler.onUpdate() did not complete at location');
+    issues.push('Handler.onArrive() returned no message');
 }
 
 if (updateResult && updateResult.choices && updateResult.choices.length > 0) {
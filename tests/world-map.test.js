@@ -0,0 +1,292 @@
+/**
+ * World Map Tests
+ * Validates the occupancy grid (blocking, tall grass and interactive
+ * objects per tile) and chunked object queries against scanning every
+ * object, including as objects are added and removed, and the typed terrain
+ * and tile arrays against MAP_DATA and what the renderer draws from them
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { WorldMap, MAP_DATA, TERRAIN, TERRAIN_NAMES, TILE_NAMES, NO_TILE, spriteLoader } = require('./loadGameData.js');
+
+let totalTests = 0;
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+    totalTests++;
+    try {
+        fn();
+        passed++;
+        console.log(`✓ ${name}`);
+    } catch (e) {
+        failed++;
+        console.log(`✗ ${name}`);
+        failures.push({ name, error: e.message });
+    }
+}
+
+function assert(condition, message) {
+    if (!condition) {
+        throw new Error(message);
+    }
+}
+
+const BLOCKING = ['lighthouse', 'tree', 'store', 'boat', 'rock', 'npc'];
+const INTERACTIVE = ['creature', 'npc', 'store', 'boat'];
+const FOOTPRINTS = { tree: [2, 2], store: [2, 2], boat: [3, 2] };
+const EXTENTS = { tree: [2, 2, 0], store: [2, 2, 0], boat: [3, 2, 0], npc: [2, 2, 1] };
+
+/**
+ * A fresh map, so tests can add and remove objects without touching MAP_DATA
+ */
+function freshMap(data = MAP_DATA, chunkSize) {
+    return new WorldMap({ ...data, objects: data.objects.map(obj => ({ ...obj })) }, chunkSize);
+}
+
+/**
+ * Grass map of the given size with these objects
+ */
+function grassMap(width, height, objects, chunkSize) {
+    return new WorldMap({
+        width, height, tileSize: 16,
+        ground: new Array(width * height).fill('grass'),
+        objects
+    }, chunkSize);
+}
+
+function standsOn(obj, x, y) {
+    const [w, h] = FOOTPRINTS[obj.type] || [1, 1];
+    const width = obj.width || w;
+    const height = obj.height || h;
+    return x >= obj.x && x < obj.x + width && y >= obj.y && y < obj.y + height;
+}
+
+function overlapsRect(obj, x0, y0, x1, y1) {
+    const [w, h, up] = EXTENTS[obj.type] || [1, 1, 0];
+    const top = obj.y - up;
+    return obj.x < x1 && obj.x + (obj.width || w) > x0 && top < y1 && top + (obj.height || h) > y0;
+}
+
+/**
+ * Compare every tile's occupancy with a scan over map.objects
+ */
+function assertOccupancyMatchesScan(map) {
+    for (let y = -1; y <= map.height; y++) {
+        for (let x = -1; x <= map.width; x++) {
+            const on = map.objects.filter(obj => standsOn(obj, x, y));
+            const inside = map.inBounds(x, y);
+            const blocked = inside && on.some(obj => BLOCKING.includes(obj.type));
+            const grass = inside && on.some(obj => obj.type === 'tallgrass');
+            const interactive = inside ? on.filter(obj => INTERACTIVE.includes(obj.type)) : [];
+
+            assert(map.isBlocked(x, y) === blocked, `isBlocked(${x}, ${y}) should be ${blocked}`);
+            assert(map.hasTallGrass(x, y) === grass, `hasTallGrass(${x}, ${y}) should be ${grass}`);
+            const found = map.objectsAt(x, y);
+            assert(found.length === interactive.length && found.every((obj, i) => obj === interactive[i]),
+                   `objectsAt(${x}, ${y}) should list ${interactive.map(obj => obj.id || obj.type).join() || 'nothing'}`);
+        }
+    }
+}
+
+console.log('Testing world map occupancy...\n');
+
+test('MAP_DATA occupancy matches scanning every object', () => {
+    assertOccupancyMatchesScan(freshMap());
+});
+
+test('Removing one of two overlapping blockers keeps the tile blocked', () => {
+    const tree = { type: 'tree', x: 4, y: 4 };
+    const rock = { type: 'rock', x: 5, y: 5 };
+    const map = grassMap(12, 12, [tree, rock]);
+
+    assert(map.isBlocked(5, 5), 'Overlapping tile should be blocked');
+    assert(map.removeObject(rock), 'Rock should be removed');
+    assert(map.isBlocked(5, 5), 'Tree still covers the tile');
+    assert(map.removeObject(tree), 'Tree should be removed');
+    assert(!map.isBlocked(5, 5) && !map.isBlocked(4, 4), 'Nothing left to block');
+    assertOccupancyMatchesScan(map);
+});
+
+test('Overlapping interactive objects are listed and removed individually', () => {
+    const boat = { type: 'boat', id: 'boat', x: 2, y: 2 };
+    const npc = { type: 'npc', id: 'npc', x: 3, y: 3 };
+    const creature = { type: 'creature', id: 'creature', x: 3, y: 3 };
+    const map = grassMap(10, 10, [boat, npc]);
+
+    map.addObject(creature);
+    assert(map.objectsAt(3, 3).map(obj => obj.id).join() === 'boat,npc,creature',
+           `Expected map order, got ${map.objectsAt(3, 3).map(obj => obj.id).join()}`);
+
+    map.removeObject(npc);
+    assert(map.objectsAt(3, 3).map(obj => obj.id).join() === 'boat,creature', 'NPC should be gone from the tile');
+    assert(map.isBlocked(3, 3), 'Boat still blocks the tile');
+
+    map.removeObject(boat);
+    map.removeObject(creature);
+    assert(map.objectsAt(3, 3).length === 0 && map.occupants.every(list => list === null),
+           'Emptied tiles should hold no occupant lists');
+    assertOccupancyMatchesScan(map);
+});
+
+test('Tall grass is counted per tile', () => {
+    const a = { type: 'tallgrass', x: 1, y: 1 };
+    const b = { type: 'tallgrass', x: 1, y: 1 };
+    const map = grassMap(4, 4, [a, b]);
+
+    map.removeObject(a);
+    assert(map.hasTallGrass(1, 1), 'The second patch still covers the tile');
+    map.removeObject(b);
+    assert(!map.hasTallGrass(1, 1), 'No grass left');
+});
+
+test('Footprints are clipped to the map', () => {
+    const map = grassMap(6, 6, [
+        { type: 'boat', x: -1, y: 5 },
+        { type: 'lighthouse', x: 4, y: 4, width: 4, height: 4 }
+    ]);
+    assertOccupancyMatchesScan(map);
+    assert(map.isBlocked(0, 5) && map.isBlocked(1, 5), 'Boat covers the in-bounds part of its footprint');
+    assert(map.isBlocked(5, 5), 'Lighthouse covers the in-bounds part of its footprint');
+});
+
+test('addObject and removeObject keep occupancy and version current', () => {
+    const map = freshMap();
+    const before = map.version;
+    const added = [
+        { type: 'rock', x: 10, y: 10 },
+        { type: 'npc', id: 'visitor', x: 11, y: 10 },
+        { type: 'tallgrass', x: 12, y: 12 }
+    ];
+
+    added.forEach(obj => map.addObject(obj));
+    assertOccupancyMatchesScan(map);
+
+    map.removeObject(added[1]);
+    assertOccupancyMatchesScan(map);
+    assert(map.version === before + 4, `version should count every change, got ${map.version - before}`);
+    assert(map.removeObject(added[1]) === false, 'Removing twice should report nothing removed');
+    assert(map.version === before + 4, 'A no-op removal should not bump version');
+});
+
+test('objectsInRect matches a scan, once per object, in map order', () => {
+    const map = freshMap(MAP_DATA, 8);
+    map.addObject({ type: 'boat', id: 'straddler', x: 7, y: 7 });  // spans four chunks
+
+    const rects = [[0, 0, map.width, map.height], [5, 5, 12, 12], [7, 6, 9, 8], [20, 0, 32, 10], [30, 30, 40, 40]];
+    rects.forEach(([x0, y0, x1, y1]) => {
+        const expected = map.objects.filter(obj => overlapsRect(obj, x0, y0, x1, y1));
+        const found = map.objectsInRect(x0, y0, x1, y1);
+        assert(found.length === expected.length && found.every((obj, i) => obj === expected[i]),
+               `Rect ${[x0, y0, x1, y1]}: expected ${expected.length} objects, got ${found.length}`);
+    });
+
+    const straddler = map.objects[map.objects.length - 1];
+    map.removeObject(straddler);
+    assert(!map.objectsInRect(0, 0, map.width, map.height).includes(straddler),
+           'Removed objects should leave every chunk they spanned');
+});
+
+console.log('\nTesting world map terrain...\n');
+
+/**
+ * Tileset tile a ground tile should draw with (water shows its first frame)
+ */
+function expectedTile(name, x, y) {
+    if (name === 'water') return 'water_0';
+    if (name === 'grass') return `grass_${(x * 7 + y * 13) % 4}`;
+    if (name === 'sand') return `sand_${(x * 7 + y * 13) % 3}`;
+    return null;
+}
+
+test('Terrain and tile arrays round-trip MAP_DATA', () => {
+    const map = freshMap();
+    assert(map.terrain instanceof Uint8Array && map.tiles instanceof Uint16Array, 'Typed arrays expected');
+    assert(map.terrain.length === MAP_DATA.ground.length && map.tiles.length === MAP_DATA.ground.length,
+           'One entry per tile expected');
+
+    MAP_DATA.ground.forEach((name, index) => {
+        const x = index % map.width;
+        const y = Math.floor(index / map.width);
+        assert(TERRAIN_NAMES[map.terrain[index]] === name && map.terrainAt(x, y) === name,
+               `Tile ${x},${y}: expected terrain ${name}`);
+        assert(map.isWater(x, y) === (name === 'water'), `isWater(${x}, ${y}) should be ${name === 'water'}`);
+        assert(TILE_NAMES[map.tiles[index]] === expectedTile(name, x, y),
+               `Tile ${x},${y}: expected ${expectedTile(name, x, y)}, got ${TILE_NAMES[map.tiles[index]]}`);
+    });
+});
+
+test('Terrain without a tileset tile resolves to NO_TILE', () => {
+    const map = new WorldMap({ width: 2, height: 1, tileSize: 16, ground: ['cave', 'sand'], objects: [] });
+    assert(map.terrain[0] === TERRAIN.CAVE && map.terrainAt(0, 0) === 'cave', 'Cave should be stored');
+    assert(map.tiles[0] === NO_TILE, `Cave should have NO_TILE, got ${map.tiles[0]}`);
+    assert(TILE_NAMES[map.tiles[1]] === 'sand_1', 'Sand at 1,0 should be sand_1');
+});
+
+test('Unknown terrain names are rejected', () => {
+    let error = null;
+    try {
+        new WorldMap({ width: 2, height: 1, tileSize: 16, ground: ['sand', 'lava'], objects: [] });
+    } catch (e) {
+        error = e;
+    }
+    assert(error && error.message === "Unknown terrain 'lava' at tile 1", `Unexpected error: ${error && error.message}`);
+});
+
+test('drawTerrain offsets water tiles by the water frame', () => {
+    const source = fs.readFileSync(path.join(__dirname, '../src/renderingSystem.js'), 'utf8');
+    const drawn = [];
+    const recorder = { drawHandle: (ctx, handle, x, y) => drawn.push({ handle, x, y }) };
+    const RenderingSystem = new Function('spriteLoader', 'TERRAIN', source + '\nreturn RenderingSystem;')(recorder, TERRAIN);
+
+    const map = freshMap();
+    const chunk = map.getChunk(0, 0);
+    const waterFrames = TILE_NAMES.filter(name => name.startsWith('water_')).length;
+
+    // Every frame updateWaterAnimation cycles through
+    let frames = new Set();
+    for (let t = 0; t <= 501 * waterFrames; t += 501) {
+        spriteLoader.updateWaterAnimation(t);
+        frames.add(spriteLoader.getWaterFrame());
+    }
+    assert(frames.size === waterFrames, `Expected ${waterFrames} water frames, saw ${frames.size}`);
+
+    frames.forEach(frame => {
+        drawn.length = 0;
+        RenderingSystem.prototype.drawTerrain.call(null, null, map, chunk, frame, 0, 0);
+        assert(drawn.length === chunk.w * chunk.h, `Expected ${chunk.w * chunk.h} tiles, drew ${drawn.length}`);
+
+        drawn.forEach(({ handle, x, y }) => {
+            const name = MAP_DATA.ground[(y / map.tileSize) * map.width + x / map.tileSize];
+            const expected = name === 'water' ? `water_${frame}` : expectedTile(name, x / map.tileSize, y / map.tileSize);
+            assert(TILE_NAMES[handle] === expected,
+                   `Frame ${frame} at ${x / map.tileSize},${y / map.tileSize}: expected ${expected}, drew ${TILE_NAMES[handle]}`);
+        });
+    });
+});
+
+// ============================================================================
+// RESULTS
+// ============================================================================
+
+console.log('\n' + '='.repeat(70));
+console.log('TEST RESULTS');
+console.log('='.repeat(70));
+console.log(`Total Tests: ${totalTests}`);
+console.log(`Passed: ${passed}`);
+console.log(`Failed: ${failed}`);
+console.log('');
+
+if (failed > 0) {
+    console.log('❌ WORLD MAP TESTS FAILED!\n');
+    failures.forEach((failure, i) => {
+        console.log(`${i + 1}. ${failure.name}`);
+        console.log(`   Error: ${failure.error}\n`);
+    });
+    process.exit(1);
+} else {
+    console.log('✅ ALL WORLD MAP TESTS PASSED!');
+    process.exit(0);
+}
@@ -1,131 +1,292 @@
 #!/usr/bin/env python3
 """
 Dialogue Tree Auditor
-Parses data.js and generates visual dialogue trees for all NPCs
+Parses src/data.js and generates visual dialogue trees for all NPCs
 """
 
+import argparse
+import functools
+import hashlib
+import json
+import os
 import re
-from typing import List, Dict, Any
-
-def parse_text_content(text_match_str: str) -> List[str]:
-    """Parse text content - can be string or array"""
-    if text_match_str.strip().startswith('['):
-        # Array - extract all quoted strings
-        lines = re.findall(r'"([^"]*)"', text_match_str)
-        return lines
+import sys
+import time
+from collections import namedtuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_JS = os.path.join(REPO_ROOT, 'src', 'data.js')
+
+# Parsed and analyzed NPCs, keyed by a hash of each NPC's source (see audit_npcs)
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dialogue-cache.json')
+
+# Version of the --format jsonl records; bump it when a field changes meaning or goes away
+# (2: dialogue records carry phase/when instead of condition)
+SCHEMA_VERSION = 2
+
+ISSUE_PREFIXES = {'critical': '🔴 CRITICAL', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+
+# A lexical token: kind is 'name', 'string', 'template', 'number', 'punct' or 'op';
+# start/end index into the source so expressions can be sliced out verbatim
+Token = namedtuple('Token', 'kind value start end')
+
+# A JS expression kept as source text (functions, identifiers, numbers, calls...)
+Raw = namedtuple('Raw', 'source')
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>\d[\w.]*)
+  | (?P<punct>=>|\.\.\.|[{}\[\]().,:;])
+  | (?P<op>.)
+""", re.DOTALL | re.VERBOSE)
+
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+OPENERS = {'{': '}', '[': ']', '(': ')'}
+CLOSERS = set(OPENERS.values())
+
+def unescape(body: str) -> str:
+    """Resolve JS escapes in a string literal body (\\' -> ', \\n -> newline, ...)"""
+    return ESCAPE_RE.sub(lambda m: ESCAPES.get(m.group(1), m.group(1)), body)
+
+def _scan_template(source: str, pos: int) -> int:
+    """Index just past the template literal opening at pos, skipping ${...} holes"""
+    i = pos + 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+        elif char == '`':
+            return i + 1
+        elif source.startswith('${', i):
+            # Balance braces inside the hole, stepping over strings and nested templates
+            depth, i = 1, i + 2
+            while depth and i < len(source):
+                char = source[i]
+                if char == '`':
+                    i = _scan_template(source, i)
+                    continue
+                if char in '\'"':
+                    match = TOKEN_RE.match(source, i)
+                    i = match.end() if match.lastgroup == 'string' else i + 1
+                    continue
+                depth += {'{': 1, '}': -1}.get(char, 0)
+                i += 1
+        else:
+            i += 1
+    raise ValueError(f'Unterminated template literal at offset {pos}')
+
+def iter_tokens(source: str) -> Iterator[Token]:
+    """Lex JS source left to right, dropping whitespace and comments"""
+    pos = 0
+    while pos < len(source):
+        if source[pos] == '`':
+            end = _scan_template(source, pos)
+            yield Token('template', source[pos + 1:end - 1], pos, end)
+            pos = end
+            continue
+        match = TOKEN_RE.match(source, pos)
+        kind = match.lastgroup
+        if kind == 'string':
+            yield Token(kind, unescape(match.group()[1:-1]), pos, match.end())
+        elif kind not in ('space', 'comment'):
+            yield Token(kind, match.group(), pos, match.end())
+        pos = match.end()
+
+def tokenize(source: str) -> List[Token]:
+    """Split JS source into tokens in one left-to-right pass"""
+    return list(iter_tokens(source))
+
+def _skip_expression(tokens: List[Token], i: int) -> int:
+    """Index of the ',' or closing bracket that ends the expression starting at i"""
+    depth = 0
+    while i < len(tokens):
+        value = tokens[i].value if tokens[i].kind == 'punct' else None
+        if value in OPENERS:
+            depth += 1
+        elif value in CLOSERS:
+            if depth == 0:
+                return i
+            depth -= 1
+        elif value in (',', ';') and depth == 0:
+            return i
+        i += 1
+    return i
+
+def parse_value(source: str, tokens: List[Token], i: int) -> Tuple[Any, int]:
+    """
+    Parse the expression starting at tokens[i] into a dict (object literal),
+    list (array literal), str (string literal), None (null) or Raw (anything else).
+    Returns (value, index of the token after it).
+    """
+    token = tokens[i]
+    if token.kind == 'punct' and token.value == '{':
+        value, end = parse_object(source, tokens, i)
+    elif token.kind == 'punct' and token.value == '[':
+        value, end = parse_array(source, tokens, i)
+    elif token.kind in ('string', 'template'):
+        value, end = token.value, i + 1
+    elif token.kind == 'name' and token.value == 'null':
+        value, end = None, i + 1
     else:
-        # Single string
-        return [text_match_str.strip().strip('"')]
+        value, end = None, i
+
+    # Anything more before the next ',' makes it an expression (calls, operators, arrows...)
+    if end == i or (end < len(tokens) and not _ends_value(tokens[end])):
+        end = _skip_expression(tokens, end)
+        value = Raw(source[token.start:tokens[end - 1].end])
+    return value, end
+
+def _ends_value(token: Token) -> bool:
+    return token.kind == 'punct' and (token.value in CLOSERS or token.value in (',', ';'))
+
+def parse_object(source: str, tokens: List[Token], i: int) -> Tuple[Dict[str, Any], int]:
+    """Parse an object literal whose '{' is tokens[i]; entries that aren't key: value are skipped"""
+    entries = {}
+    i += 1
+    while i < len(tokens) and tokens[i].value != '}':
+        key = tokens[i]
+        if key.kind in ('name', 'string', 'number') and tokens[i + 1].value == ':':
+            entries[key.value], i = parse_value(source, tokens, i + 2)
+        else:
+            # Shorthand, spread, computed keys and methods
+            i = _skip_expression(tokens, i)
+        if tokens[i].value == ',':
+            i += 1
+    return entries, i + 1
+
+def parse_array(source: str, tokens: List[Token], i: int) -> Tuple[List[Any], int]:
+    """Parse an array literal whose '[' is tokens[i]"""
+    items = []
+    i += 1
+    while i < len(tokens) and tokens[i].value != ']':
+        item, i = parse_value(source, tokens, i)
+        items.append(item)
+        if tokens[i].value == ',':
+            i += 1
+    return items, i + 1
+
+def iter_entries(tokens: Iterable[Token], name: str) -> Iterator[List[Token]]:
+    """
+    Token lists of each entry of the object literal in `const <name> = {...}`
+    (or passed through a wrapper call, `const NPCS = compileDialogues({...})`),
+    one entry at a time, so only the entry being handled is held in memory
+    """
+    tokens = iter(tokens)
+    window = []
+    for token in tokens:
+        window = (window + [token.value])[-6:]
+        if window[-4:] == ['const', name, '=', '{']:
+            break
+        if window[:3] == ['const', name, '='] and window[4:] == ['(', '{']:
+            break
+    else:
+        return
 
-def parse_choices(choices_str: str) -> List[str]:
+    entry, depth = [], 0
+    for token in tokens:
+        value = token.value if token.kind == 'punct' else None
+        if depth == 0 and value in (',', '}'):
+            if entry:
+                yield entry
+            if value == '}':
+                return
+            entry = []
+            continue
+        if value in OPENERS:
+            depth += 1
+        elif value in CLOSERS:
+            depth -= 1
+        entry.append(token)
+    if entry:
+        yield entry
+
+def function_body(raw: Raw) -> str:
+    """Source of an arrow function's body ('(game) => x' -> 'x'); other expressions as-is"""
+    match = re.match(r'\s*(?:\([^()]*\)|[\w$]+)\s*=>\s*', raw.source)
+    return raw.source[match.end():] if match else raw.source
+
+def returned_value(raw: Raw) -> Any:
+    """The literal a function returns (its last `return`), or None if it isn't a literal"""
+    tokens = tokenize(raw.source)
+    returns = [i for i, token in enumerate(tokens) if token.kind == 'name' and token.value == 'return']
+    if not returns or returns[-1] + 1 >= len(tokens):
+        return None
+    value = parse_value(raw.source, tokens, returns[-1] + 1)[0]
+    return None if isinstance(value, Raw) else value
+
+def parse_text_content(text: Any) -> Tuple[List[str], List[Optional[str]]]:
+    """
+    Parse text content - a string, an array of strings and {speaker, text}
+    objects, or a function returning either. Returns (lines, speakers).
+    """
+    if isinstance(text, Raw):
+        text = returned_value(text)
+    if isinstance(text, str):
+        return [text], [None]
+    lines, speakers = [], []
+    for line in text if isinstance(text, list) else []:
+        if isinstance(line, dict) and isinstance(line.get('text'), str):
+            lines.append(line['text'])
+            speakers.append(line.get('speaker') if isinstance(line.get('speaker'), str) else None)
+        elif isinstance(line, str):
+            lines.append(line)
+            speakers.append(None)
+    return lines, speakers
+
+def text_form(text: Any) -> str:
+    """How a dialogue's text is written: 'string', 'array' or 'function'"""
+    if isinstance(text, list):
+        return 'array'
+    return 'function' if isinstance(text, Raw) else 'string'
+
+def parse_choices(choices: Any) -> List[str]:
     """Parse choices array"""
-    if not choices_str or choices_str.strip() == 'null' or choices_str.strip() == '':
+    if not isinstance(choices, list):
         return []
-
-    # Find all text: "..." patterns within choice objects
-    choice_texts = re.findall(r'text:\s*"([^"]*)"', choices_str)
-    return choice_texts
-
-def extract_dialogues_manually(data_js_path: str) -> Dict[str, List[Dict[str, Any]]]:
-    """Manually extract all dialogue NPCs and their dialogues"""
-
-    with open(data_js_path, 'r') as f:
-        content = f.read()
-
-    # Find the NPCS object
-    npcs_match = re.search(r'const NPCS = \{(.*?)\n\};', content, re.DOTALL)
-    if not npcs_match:
-        return {}
-
-    npcs_content = npcs_match.group(1)
-
-    # Split into individual NPC definitions
-    # Look for pattern: npcId: { ... }
-    npc_blocks = {}
-
-    # Find all top-level NPC IDs
-    npc_ids = re.findall(r'^\s*(\w+):\s*\{', npcs_content, re.MULTILINE)
-
-    for npc_id in npc_ids:
-        # Extract this NPC's block
-        pattern = rf'{npc_id}:\s*\{{(.*?)(?:\n\s*\}},|\n\s*\}}$)'
-        match = re.search(pattern, npcs_content, re.DOTALL)
-        if not match:
+    return [choice['text'] for choice in choices
+            if isinstance(choice, dict) and isinstance(choice.get('text'), str)]
+
+def parse_phases(phase: Any) -> List[str]:
+    """Plot phases a dialogue's `phase` names (a string or an array of them); ['unknown'] otherwise"""
+    phases = [phase] if isinstance(phase, str) else phase
+    if not isinstance(phases, list) or not all(isinstance(p, str) for p in phases):
+        return ['unknown']
+    return phases
+
+def parse_npc(npc_id: str, npc: Any) -> Optional[Dict[str, Any]]:
+    """Name and dialogues of a parsed NPC entry, or None if it isn't a dialogue_npc"""
+    if not isinstance(npc, dict) or npc.get('type') != 'dialogue_npc':
+        return None
+
+    npc_name = npc['name'] if isinstance(npc.get('name'), str) else npc_id
+    dialogues = []
+    for dialogue in npc.get('dialogues') or []:
+        if not isinstance(dialogue, dict) or 'phase' not in dialogue:
             continue
 
-        npc_data = match.group(1)
-
-        # Check if it's a dialogue_npc
-        if "type: 'dialogue_npc'" not in npc_data:
-            continue
-
-        # Extract NPC name
-        name_match = re.search(r"name:\s*'([^']*)'", npc_data)
-        npc_name = name_match.group(1) if name_match else npc_id
-
-        # Extract dialogues array
-        dialogues_match = re.search(r'dialogues:\s*\[(.*?)\](?:\s*,\s*quests:|$)', npc_data, re.DOTALL)
-        if not dialogues_match:
-            continue
-
-        dialogues_str = dialogues_match.group(1)
-
-        # Parse each dialogue object
-        dialogues = []
-
-        # Split by top-level dialogue objects
-        # Each dialogue starts with { and has condition:
-        dialogue_parts = []
-        current_dialogue = ""
-        brace_depth = 0
-        in_dialogue = False
-
-        for char in dialogues_str:
-            if char == '{':
-                if brace_depth == 0:
-                    in_dialogue = True
-                brace_depth += 1
-            elif char == '}':
-                brace_depth -= 1
-                if brace_depth == 0 and in_dialogue:
-                    current_dialogue += char
-                    dialogue_parts.append(current_dialogue)
-                    current_dialogue = ""
-                    in_dialogue = False
-                    continue
-
-            if in_dialogue:
-                current_dialogue += char
-
-        for dialogue_str in dialogue_parts:
-            if 'condition:' not in dialogue_str:
-                continue
-
-            # Extract condition
-            condition_match = re.search(r'condition:\s*\(game\)\s*=>\s*(.*?)(?=,\s*text:)', dialogue_str, re.DOTALL)
-            condition = condition_match.group(1).strip() if condition_match else "unknown"
-
-            # Extract text
-            text_match = re.search(r'text:\s*(\[[\s\S]*?\](?=\s*,)|"[^"]*")', dialogue_str)
-            text_content = parse_text_content(text_match.group(1)) if text_match else []
-
-            # Extract choices
-            choices_match = re.search(r'choices:\s*(\[[\s\S]*?\](?=\s*\})|null)', dialogue_str)
-            choices = parse_choices(choices_match.group(1)) if choices_match else []
-
-            dialogues.append({
-                'condition': condition,
-                'text': text_content,
-                'choices': choices,
-                'npc_name': npc_name
-            })
-
-        npc_blocks[npc_id] = {
-            'name': npc_name,
-            'dialogues': dialogues
-        }
-
-    return npc_blocks
+        phase, when = dialogue['phase'], dialogue.get('when')
+        text, speakers = parse_text_content(dialogue.get('text'))
+        dialogues.append({
+            'phase': parse_phases(phase),
+            'when': function_body(when).strip() if isinstance(when, Raw) else None,
+            'text': text,
+            'text_form': text_form(dialogue.get('text')),
+            'speakers': speakers,
+            'repeat_text': dialogue.get('repeatText') if isinstance(dialogue.get('repeatText'), str) else None,
+            'choices': parse_choices(dialogue.get('choices')),
+            'npc_name': npc_name
+        })
+
+    return {
+        'name': npc_name,
+        'dialogues': dialogues
+    }
 
 def generate_dialogue_tree(npc_id: str, npc_data: Dict[str, Any]) -> str:
     """Generate a visual dialogue tree"""
@@ -136,16 +297,25 @@ def generate_dialogue_tree(npc_id: str, npc_data: Dict[str, Any]) -> str:
 
     for i, dialogue in enumerate(npc_data['dialogues']):
         output.append(f"Dialogue #{i+1}")
-        output.append(f"Condition: {dialogue['condition']}")
+        output.append(f"Phase: {', '.join(dialogue['phase'])}")
+        if dialogue['when']:
+            output.append(f"When: {dialogue['when']}")
         output.append("")
 
         # Show text lines
+        speakers = dialogue.get('speakers') or [None] * len(dialogue['text'])
         if len(dialogue['text']) == 1:
-            output.append(f"  NPC: \"{dialogue['text'][0]}\"")
+            output.append(f"  {speakers[0] or 'NPC'}: \"{dialogue['text'][0]}\"")
+        elif not dialogue['text']:
+            output.append("  NPC: [text built at runtime]")
         else:
             output.append(f"  NPC (conversation flow):")
-            for j, line in enumerate(dialogue['text']):
-                output.append(f"    {j+1}. \"{line}\"")
+            for j, (line, speaker) in enumerate(zip(dialogue['text'], speakers)):
+                prefix = f"{speaker}: " if speaker else ""
+                output.append(f"    {j+1}. {prefix}\"{line}\"")
+
+        if dialogue.get('repeat_text'):
+            output.append(f"  Repeat: \"{dialogue['repeat_text']}\"")
 
         output.append("")
 
@@ -167,62 +337,136 @@ def generate_dialogue_tree(npc_id: str, npc_data: Dict[str, Any]) -> str:
 
     return "\n".join(output)
 
-def analyze_unnatural_turns(npc_id: str, npc_data: Dict[str, Any]) -> List[str]:
-    """Identify unnatural dialogue turns"""
+def find_issues(npc_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Identify unnatural dialogue turns as records:
+    {'dialogue': n, 'line': n or None, 'severity', 'code', 'message'} (1-based)
+    """
     issues = []
 
+    def issue(i, severity, code, message, line=None):
+        issues.append({'dialogue': i + 1, 'line': line, 'severity': severity, 'code': code, 'message': message})
+
     for i, dialogue in enumerate(npc_data['dialogues']):
         # CRITICAL: Single choices should auto-advance
         if len(dialogue['choices']) == 1:
-            issues.append(f"  🔴 CRITICAL Dialogue #{i+1}: Single choice '{dialogue['choices'][0]}' - player shouldn't need to click this!")
+            issue(i, 'critical', 'single_choice',
+                  f"Single choice '{dialogue['choices'][0]}' - player shouldn't need to click this!")
 
         # Check for very long single statements
         for j, line in enumerate(dialogue['text']):
             if len(line) > 120:
-                issues.append(f"  ⚠️  Dialogue #{i+1}, Line {j+1}: Long line ({len(line)} chars)")
+                issue(i, 'warning', 'long_line', f"Long line ({len(line)} chars)", line=j + 1)
 
         # Check for single-line multi-line arrays (unnecessary)
-        if len(dialogue['text']) == 1 and isinstance(dialogue['text'], list):
-            issues.append(f"  ℹ️  Dialogue #{i+1}: Single line in array - could simplify")
+        if len(dialogue['text']) == 1 and dialogue.get('text_form') == 'array':
+            issue(i, 'info', 'single_line_array', "Single line in array - could simplify")
 
         # Check for conversations that end abruptly
         if dialogue['choices'] and len(dialogue['choices']) == 0:
-            issues.append(f"  ℹ️  Dialogue #{i+1}: Conversation ends with NPC speaking - feels abrupt")
+            issue(i, 'info', 'abrupt_end', "Conversation ends with NPC speaking - feels abrupt")
 
         # Check for fake choices (all choices lead to same action - need to parse actions for this)
         if len(dialogue['choices']) > 1:
             # Check if all choices are very similar
             if len(set(dialogue['choices'])) < len(dialogue['choices']):
-                issues.append(f"  ⚠️  Dialogue #{i+1}: Duplicate choice text detected")
+                issue(i, 'warning', 'duplicate_choices', "Duplicate choice text detected")
 
     return issues
 
-def main():
-    print("Dialogue Tree Auditor")
-    print("=" * 80)
+def format_issue(issue: Dict[str, Any]) -> str:
+    """One report line for a find_issues record"""
+    where = f"Dialogue #{issue['dialogue']}"
+    if issue['line']:
+        where += f", Line {issue['line']}"
+    return f"  {ISSUE_PREFIXES[issue['severity']]} {where}: {issue['message']}"
+
+def tool_digest() -> str:
+    """Hash of this script, so cached results are dropped when the parser or checks change"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_cache(path: str) -> Dict[str, Dict[str, Any]]:
+    """Cached NPC audits from the last run, or {} if missing or built by another version"""
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('npcs', {}) if cache.get('tool') == tool_digest() else {}
+
+def save_cache(path: str, entries: Dict[str, Dict[str, Any]]):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'tool': tool_digest(), 'npcs': entries}, f)
+    os.replace(tmp_path, path)
+
+def audit_npcs(content: str, cache: Dict[str, Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any], Optional[str]]]:
+    """
+    Audit every NPC in the NPCS block as it is reached, reusing cached results
+    for NPCs whose source hasn't changed.
+
+    The file is still lexed, but only new or changed NPCs are parsed, drawn
+    as trees and analyzed. Yields (npc_id, entry, 'new' | 'changed' | None)
+    in file order; entry['npc'] is None for non-dialogue NPCs.
+    """
+    for entry_tokens in iter_entries(iter_tokens(content), 'NPCS'):
+        key = entry_tokens[0]
+        if key.kind not in ('name', 'string', 'number') or len(entry_tokens) < 3 or entry_tokens[1].value != ':':
+            continue
 
-    # Parse data.js
-    npcs = extract_dialogues_manually('data.js')
+        npc_id = key.value
+        npc_source = content[key.start:entry_tokens[-1].end]
+        digest = hashlib.sha256(npc_source.encode('utf-8')).hexdigest()
+        cached = cache.get(npc_id)
+        if cached and cached['hash'] == digest:
+            yield npc_id, cached, None
+            continue
 
+        entry_tokens.append(Token('punct', ',', len(content), len(content)))
+        npc_data = parse_npc(npc_id, parse_value(content, entry_tokens, 2)[0])
+        yield npc_id, {
+            'hash': digest,
+            'npc': npc_data,
+            'tree': generate_dialogue_tree(npc_id, npc_data) if npc_data else None,
+            'issues': find_issues(npc_data) if npc_data else [],
+        }, 'changed' if cached else 'new'
+
+def _read_audit(data_js_path: str, cache_path: Optional[str]):
+    """(content, cache, entries) where entries collects audit_npcs results to save back"""
+    with open(data_js_path, 'r') as f:
+        content = f.read()
+    return content, load_cache(cache_path) if cache_path else {}, {}
+
+def audit(data_js_path: str, output_file: str, cache_path: Optional[str]) -> bool:
+    """Audit once and write the trees; returns False if no dialogue NPCs were found"""
+    content, cache, entries = _read_audit(data_js_path, cache_path)
+    reaudited = []
+    for npc_id, entry, reason in audit_npcs(content, cache):
+        entries[npc_id] = entry
+        if reason:
+            reaudited.append((npc_id, reason))
+    if cache_path:
+        save_cache(cache_path, entries)
+
+    npcs = {npc_id: entry['npc'] for npc_id, entry in entries.items() if entry['npc']}
     if not npcs:
         print("❌ No dialogue NPCs found!")
-        return
-
-    all_output = []
-    all_issues = {}
+        return False
 
-    for npc_id, npc_data in npcs.items():
-        # Generate tree
-        tree = generate_dialogue_tree(npc_id, npc_data)
-        all_output.append(tree)
+    removed = [npc_id for npc_id in cache if npc_id not in entries]
+    if reaudited or removed:
+        changes = [f"{npc_id} ({reason})" for npc_id, reason in reaudited]
+        changes += [f"{npc_id} (removed)" for npc_id in removed]
+        print(f"Re-audited {len(reaudited)} of {len(entries)} NPCs: {', '.join(changes)}")
+    else:
+        print(f"✓ All {len(entries)} NPCs unchanged (cached)")
 
-        # Analyze for unnatural turns
-        issues = analyze_unnatural_turns(npc_id, npc_data)
-        if issues:
-            all_issues[npc_id] = issues
+    all_output = [entries[npc_id]['tree'] for npc_id in npcs]
+    all_issues = {npc_id: [format_issue(issue) for issue in entries[npc_id]['issues']]
+                  for npc_id in npcs if entries[npc_id]['issues']}
 
     # Write trees to file
-    output_file = 'dialogue_trees.txt'
     with open(output_file, 'w') as f:
         f.write('\n'.join(all_output))
 
@@ -252,6 +496,146 @@ def main():
     print(f"Total dialogues: {total_dialogues}")
     print(f"Issues found: {sum(len(issues) for issues in all_issues.values())}")
     print(f"\nOutput: {output_file}")
+    return True
+
+def npc_records(npc_id: str, entry: Dict[str, Any], reason: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """The JSON-lines records for one audited dialogue NPC: an 'npc' record, then one per dialogue"""
+    npc_data = entry['npc']
+    yield {
+        'schema': SCHEMA_VERSION,
+        'type': 'npc',
+        'npc': npc_id,
+        'name': npc_data['name'],
+        'dialogues': len(npc_data['dialogues']),
+        'issues': len(entry['issues']),
+        'reaudited': reason is not None,
+    }
+    for i, dialogue in enumerate(npc_data['dialogues']):
+        yield {
+            'schema': SCHEMA_VERSION,
+            'type': 'dialogue',
+            'npc': npc_id,
+            'index': i + 1,
+            'phase': dialogue['phase'],
+            'when': dialogue['when'],
+            'text_form': dialogue['text_form'],
+            'lines': [{'speaker': speaker, 'text': line}
+                      for line, speaker in zip(dialogue['text'], dialogue['speakers'])],
+            'repeat_text': dialogue['repeat_text'],
+            'choices': dialogue['choices'],
+            'issues': [{key: issue[key] for key in ('severity', 'code', 'line', 'message')}
+                       for issue in entry['issues'] if issue['dialogue'] == i + 1],
+        }
+
+def audit_jsonl(data_js_path: str, output_file: str, cache_path: Optional[str]) -> bool:
+    """
+    Audit once, writing one JSON record per line as each NPC is analyzed
+    (see npc_records), then a 'summary' record. '-' writes to stdout.
+    Nothing is kept between NPCs except what the cache needs.
+    """
+    content, cache, entries = _read_audit(data_js_path, cache_path)
+    out = sys.stdout if output_file == '-' else open(output_file, 'w')
+    npcs = dialogues = issues = 0
+    reaudited, seen = [], set()
+    try:
+        for npc_id, entry, reason in audit_npcs(content, cache):
+            seen.add(npc_id)
+            if cache_path:
+                entries[npc_id] = entry
+            if reason:
+                reaudited.append(npc_id)
+            if not entry['npc']:
+                continue
+            for record in npc_records(npc_id, entry, reason):
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+            npcs += 1
+            dialogues += len(entry['npc']['dialogues'])
+            issues += len(entry['issues'])
+
+        out.write(json.dumps({
+            'schema': SCHEMA_VERSION,
+            'type': 'summary',
+            'npcs': npcs,
+            'dialogues': dialogues,
+            'issues': issues,
+            'reaudited': reaudited,
+            'removed': [npc_id for npc_id in cache if npc_id not in seen],
+        }, ensure_ascii=False) + '\n')
+        out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if cache_path:
+        save_cache(cache_path, entries)
+    return npcs > 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate and audit dialogue trees for every NPC.')
+    parser.add_argument('data_js', nargs='?', default=DATA_JS,
+                        help='game data file (default: %(default)s)')
+    parser.add_argument('--format', choices=['text', 'jsonl'], default='text',
+                        help='text: dialogue_trees.txt plus a report; jsonl: one JSON record per '
+                             'NPC and dialogue, streamed as they are analyzed (default: %(default)s)')
+    parser.add_argument('-o', '--output',
+                        help="output file, '-' for stdout "
+                             "(default: dialogue_trees.txt for text, stdout for jsonl)")
+    parser.add_argument('--cache', default=CACHE_PATH,
+                        help='per-NPC audit cache (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='re-audit every NPC and leave the cache alone')
+    parser.add_argument('--watch', action='store_true',
+                        help='re-audit whenever the data file is saved')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='seconds between checks with --watch (default: %(default)s)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    cache_path = None if args.no_cache else args.cache
+
+    if args.format == 'jsonl':
+        run, output = audit_jsonl, args.output or '-'
+        # Keep stdout machine-readable
+        log = functools.partial(print, file=sys.stderr)
+    else:
+        run, output, log = audit, args.output or 'dialogue_trees.txt', print
+        print("Dialogue Tree Auditor")
+        print("=" * 80)
+
+    try:
+        found = run(args.data_js, output, cache_path)
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    if not args.watch:
+        if not found:
+            sys.exit(1)
+        return
+
+    log(f"\n👀 Watching {args.data_js} (Ctrl+C to stop)")
+    last_mtime = os.stat(args.data_js).st_mtime
+    try:
+        while True:
+            time.sleep(args.interval)
+            try:
+                mtime = os.stat(args.data_js).st_mtime
+            except OSError:
+                # Mid-save by an editor that replaces the file; try again next tick
+                continue
+            if mtime != last_mtime:
+                last_mtime = mtime
+                log("\n" + "=" * 80)
+                try:
+                    run(args.data_js, output, cache_path)
+                except Exception as e:
+                    # Most likely a half-saved file; the next save re-audits
+                    log(f"❌ Could not audit {args.data_js}: {type(e).__name__}: {e}")
+                    log("   Waiting for the next save...")
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Sprite Generator Benchmarks
+Times each generator function and each full sheet build in generate_sprites.py,
+records peak traced memory and output bytes, and fails when a result goes over
+the stored baseline (sprite_benchmark_baseline.json)
+"""
+
+from collections import namedtuple
+from contextlib import redirect_stdout
+import argparse
+import fnmatch
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from PIL import Image
+
+import generate_sprites as gs
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sprite_benchmark_baseline.json')
+
+# Allowed growth over the baseline before a result counts as a regression.
+# Timings are noisy, memory less so, and output bytes are deterministic.
+TOLERANCES = {'seconds': 0.5, 'peak_bytes': 0.1, 'output_bytes': 0.0}
+
+# Growth below these absolute amounts is never a regression: a 16x16 tile takes
+# microseconds and allocates under a KB, where noise exceeds any relative budget
+FLOORS = {'seconds': 0.001, 'peak_bytes': 4096, 'output_bytes': 0}
+
+# setup() -> state (untimed); run(state) -> result (timed);
+# size(state, result) -> output bytes; teardown(state) cleans up
+Case = namedtuple('Case', 'name setup run size teardown')
+
+def _png_size(state, img):
+    return len(gs._png_bytes(img))
+
+def _no_teardown(state):
+    pass
+
+def _sample_tile():
+    """A flat 16x16 tile for the texture passes to work on"""
+    return Image.new('RGBA', (16, 16), gs.COLORS['grass_mid'])
+
+def _sample_sprite():
+    """A transparent 16x16 sprite with an opaque middle, so outlines have an edge"""
+    img = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
+    img.paste(Image.new('RGBA', (8, 8), gs.COLORS['sand_mid']), (4, 4))
+    return img
+
+def function_case(name, fn, *args, sample=None, **kwargs):
+    """Benchmark fn(*args) or, with a sample, fn(sample(), *args)"""
+    def setup():
+        # Characters share body templates; measure drawing them, not the lookup
+        gs.character_template.cache_clear()
+        return sample() if sample else None
+
+    def run(img):
+        return fn(img, *args, **kwargs) if sample else fn(*args, **kwargs)
+
+    return Case(name, setup, run, _png_size, _no_teardown)
+
+def _build_dirs():
+    return {'output': tempfile.mkdtemp(prefix='sprites-'), 'cache': tempfile.mkdtemp(prefix='sprite-cache-')}
+
+def _remove_dirs(dirs):
+    for path in dirs.values():
+        shutil.rmtree(path, ignore_errors=True)
+
+def _output_size(dirs, paths):
+    return sum(os.path.getsize(path) for path in paths)
+
+def sheet_case(name, defaults):
+    """Benchmark a cold single-process build of one sheet (every sprite drawn, packed and encoded)"""
+    def setup():
+        gs.character_template.cache_clear()
+        return _build_dirs()
+
+    def run(dirs):
+        cache = gs.BuildCache(dirs['cache'])
+        plan = gs.plan_sheet(defaults.seed, name, *gs.SHEETS[name][1](),
+                             png=defaults.png, scales=defaults.scales)
+        gs.render_missing(cache, [plan], defaults.seed, jobs=1)
+        gs.build_sheet(cache, dirs['output'], plan)
+        return plan.outputs(dirs['output'])
+
+    return Case(f'sheet:{name}', setup, run, _output_size, _remove_dirs)
+
+def _run_main(dirs):
+    with redirect_stdout(io.StringIO()):
+        gs.main(['-o', dirs['output'], '--cache-dir', dirs['cache'], '-j', '1'])
+    return [os.path.join(dirs['output'], name) for name in os.listdir(dirs['output'])]
+
+def main_cases():
+    """Benchmark main() from an empty cache, and again as a no-op rebuild"""
+    def cold_setup():
+        gs.character_template.cache_clear()
+        return _build_dirs()
+
+    def warm_setup():
+        dirs = _build_dirs()
+        _run_main(dirs)
+        return dirs
+
+    return [Case('main:cold', cold_setup, _run_main, _output_size, _remove_dirs),
+            Case('main:no-op', warm_setup, _run_main, _output_size, _remove_dirs)]
+
+def all_cases():
+    defaults = gs.parse_args([])
+    cases = [
+        function_case('create_grass_tile', gs.create_grass_tile, 0),
+        function_case('create_water_tile', gs.create_water_tile, 0),
+        function_case('create_sand_tile', gs.create_sand_tile, 0),
+        function_case('create_transition_tile', gs.create_transition_tile, 'grass', 'sand', 'NE'),
+        function_case('create_character_sprite', gs.create_character_sprite, 'fisherman', 'left', 1),
+        function_case('create_tree', gs.create_tree),
+        function_case('create_lighthouse', gs.create_lighthouse),
+        function_case('create_creature_sprite', gs.create_creature_sprite, 'lumina', True, 1),
+        function_case('add_noise', gs.add_noise, 0.1, sample=_sample_tile),
+        function_case('apply_dither', gs.apply_dither, 8, sample=_sample_tile),
+        function_case('apply_shading', gs.apply_shading, 0.15, sample=_sample_tile),
+        function_case('add_outline', gs.add_outline, sample=_sample_sprite),
+        function_case('apply_texture', gs.apply_texture, gs.TEXTURE_SEED, 0.15, 0.1, 8,
+                      gs.COLORS['outline'], sample=_sample_sprite),
+    ]
+    cases += [sheet_case(name, defaults) for name in gs.SHEETS]
+    return cases + main_cases()
+
+def measure(case, iterations):
+    """Median/min wall time over iterations, then one traced run for peak memory and output size"""
+    times = []
+    for _ in range(iterations):
+        state = case.setup()
+        try:
+            start = time.perf_counter()
+            case.run(state)
+            times.append(time.perf_counter() - start)
+        finally:
+            case.teardown(state)
+
+    # Tracing slows allocation down, so memory gets its own run
+    state = case.setup()
+    try:
+        tracemalloc.start()
+        result = case.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        output_bytes = case.size(state, result)
+    finally:
+        case.teardown(state)
+
+    return {
+        'seconds': statistics.median(times),
+        'min_seconds': min(times),
+        'iterations': iterations,
+        'peak_bytes': peak,
+        'output_bytes': output_bytes,
+    }
+
+def over_budget(result, baseline, tolerances, floors=FLOORS):
+    """Metrics of result that exceed baseline * (1 + tolerance) by more than their floor"""
+    return [metric for metric, tolerance in tolerances.items()
+            if metric in baseline and result[metric] > baseline[metric] * (1 + tolerance)
+            and result[metric] - baseline[metric] > floors.get(metric, 0)]
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get('results', {})
+
+def save_baseline(path, results):
+    """Merge results into the baseline file, keeping cases that weren't run"""
+    merged = load_baseline(path)
+    merged.update(results)
+    data = {
+        'machine': f'{platform.system()} {platform.machine()}, Python {platform.python_version()}',
+        'results': dict(sorted(merged.items())),
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark tools/generate_sprites.py against a stored baseline.')
+    parser.add_argument('cases', nargs='*', metavar='CASE',
+                        help='case names or glob patterns, e.g. add_noise "sheet:*" (default: all)')
+    parser.add_argument('-n', '--iterations', type=int, default=50,
+                        help='timed runs per generator function (default: %(default)s)')
+    parser.add_argument('--build-iterations', type=int, default=3,
+                        help='timed runs per sheet build and main() (default: %(default)s)')
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help='baseline JSON (default: %(default)s)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='record these results as the new baseline instead of checking them')
+    parser.add_argument('--time-tolerance', type=float, default=TOLERANCES['seconds'],
+                        help='allowed fractional slowdown of the median time (default: %(default)s)')
+    parser.add_argument('--memory-tolerance', type=float, default=TOLERANCES['peak_bytes'],
+                        help='allowed fractional growth of peak memory (default: %(default)s)')
+    parser.add_argument('--list', action='store_true', help='list case names and exit')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmarks; exit status 1 if any result is over budget"""
+    args = parse_args(argv)
+    cases = all_cases()
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if args.cases:
+        cases = [case for case in cases if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in args.cases)]
+        if not cases:
+            print(f"No benchmark matches {' '.join(args.cases)} (see --list)")
+            return 2
+
+    tolerances = dict(TOLERANCES, seconds=args.time_tolerance, peak_bytes=args.memory_tolerance)
+    baseline = load_baseline(args.baseline)
+    results = {}
+    failures = []
+
+    print(f"{'case':<26} {'median':>10} {'min':>10} {'peak mem':>10} {'output':>10}")
+    for case in cases:
+        is_build = ':' in case.name
+        result = measure(case, args.build_iterations if is_build else args.iterations)
+        results[case.name] = result
+
+        if args.update_baseline:
+            status = 'recorded'
+        elif case.name not in baseline:
+            status = 'new (no baseline)'
+        else:
+            over = over_budget(result, baseline[case.name], tolerances)
+            failures += [(case.name, metric) for metric in over]
+            status = f"✗ over budget: {', '.join(over)}" if over else '✓'
+
+        print(f"{case.name:<26} {result['seconds'] * 1000:>8.2f}ms {result['min_seconds'] * 1000:>8.2f}ms"
+              f" {result['peak_bytes'] / 1024:>8.1f}KB {result['output_bytes']:>9,}B  {status}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n✓ Baseline updated: {args.baseline}")
+        return 0
+
+    if failures:
+        print(f"\n✗ {len(failures)} regression(s) against {args.baseline}:")
+        for name, metric in failures:
+            print(f"  {name}: {metric} {results[name][metric]:,.4g} > {baseline[name][metric]:,.4g}"
+                  f" (+{tolerances[metric]:.0%} and {FLOORS[metric]:,.4g} allowed)")
+        return 1
+
+    print('\n✓ All benchmarks within budget')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,8 +6,19 @@ Generates: tilesets, characters, structures with proper shading and detail
 """
 
 from PIL import Image, ImageDraw
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import argparse
+import functools
+import hashlib
+import inspect
+import io
 import json
 import os
+import re
+import types
+import zlib
 
 # Modern GBA-style color palette (muted, cohesive)
 COLORS = {
@@ -51,21 +62,92 @@ COLORS = {
     'transparent': (0, 0, 0, 0)
 }
 
-def add_noise(img, intensity=0.1):
-    """Add subtle noise for texture"""
-    import random
-    pixels = img.load()
-    for y in range(img.height):
-        for x in range(img.width):
-            if pixels[x, y][3] > 0 and random.random() < intensity:
-                r, g, b, a = pixels[x, y]
-                adjust = random.randint(-5, 5)
-                pixels[x, y] = (
-                    max(0, min(255, r + adjust)),
-                    max(0, min(255, g + adjust)),
-                    max(0, min(255, b + adjust)),
-                    a
-                )
+# Seed for all texture noise. Sprite sheets must come out byte-identical between
+# runs so browser caches stay valid, so never reach for the global `random` here.
+TEXTURE_SEED = 1337
+
+# 4x4 Bayer threshold matrix, normalised to [-0.5, 0.5)
+BAYER_4X4 = (np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+]) + 0.5) / 16.0 - 0.5
+
+# Texture passes applied to each tile family (see apply_texture)
+TEXTURES = {
+    'grass': {'noise': 0.1},
+    'sand': {'noise': 0.1},
+}
+
+def stable_seed(*parts):
+    """Derive a reproducible seed from sprite identifiers (hash() is salted per process)"""
+    return zlib.crc32('/'.join(str(p) for p in parts).encode('utf-8'))
+
+def _to_array(img):
+    """RGBA image -> signed int array so channel math can go out of range before clipping"""
+    return np.asarray(img.convert('RGBA'), dtype=np.int16)
+
+def _store(img, arr):
+    """Write an array back into img in place and return img"""
+    img.paste(Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8), 'RGBA'))
+    return img
+
+def add_noise(img, intensity=0.1, seed=TEXTURE_SEED, amount=5):
+    """Add subtle noise for texture (same seed -> same pixels)"""
+    arr = _to_array(img)
+    rng = np.random.default_rng(seed)
+    height, width = arr.shape[:2]
+    hit = (arr[..., 3] > 0) & (rng.random((height, width)) < intensity)
+    adjust = rng.integers(-amount, amount + 1, size=(height, width))
+    arr[..., :3] += np.where(hit, adjust, 0)[..., None]
+    return _store(img, arr)
+
+def apply_dither(img, levels=8):
+    """Ordered (Bayer) dither each colour channel down to `levels` steps"""
+    arr = _to_array(img)
+    step = 255.0 / (levels - 1)
+    height, width = arr.shape[:2]
+    threshold = np.tile(BAYER_4X4, (height // 4 + 1, width // 4 + 1))[:height, :width]
+    rgb = arr[..., :3] / step + threshold[..., None]
+    arr[..., :3] = np.round(np.round(rgb) * step).astype(np.int16)
+    return _store(img, arr)
+
+def apply_shading(img, strength=0.15, light=(-1, -1)):
+    """Directional shading: brighten toward the light, darken away from it"""
+    arr = _to_array(img)
+    height, width = arr.shape[:2]
+    ys = np.linspace(-1.0, 1.0, height)[:, None]
+    xs = np.linspace(-1.0, 1.0, width)[None, :]
+    # Projection onto the light direction, in [-1, 1]
+    facing = -(xs * light[0] + ys * light[1]) / (abs(light[0]) + abs(light[1]))
+    factor = 1.0 + strength * facing
+    opaque = arr[..., 3] > 0
+    arr[..., :3] = np.where(opaque[..., None],
+                            np.round(arr[..., :3] * factor[..., None]),
+                            arr[..., :3]).astype(np.int16)
+    return _store(img, arr)
+
+def add_outline(img, color=COLORS['outline']):
+    """Outline opaque pixels with a 1px border in the transparent pixels around them"""
+    arr = _to_array(img)
+    opaque = np.pad(arr[..., 3] > 0, 1)
+    neighbour = (opaque[:-2, 1:-1] | opaque[2:, 1:-1] |
+                 opaque[1:-1, :-2] | opaque[1:-1, 2:])
+    edge = neighbour & ~opaque[1:-1, 1:-1]
+    arr[edge] = tuple(color[:3]) + (255,)
+    return _store(img, arr)
+
+def apply_texture(img, seed=TEXTURE_SEED, shading=0.0, noise=0.0, dither=None, outline=None):
+    """Run the texture passes in a fixed order: shading -> noise -> dither -> outline"""
+    if shading:
+        apply_shading(img, shading)
+    if noise:
+        add_noise(img, noise, seed)
+    if dither:
+        apply_dither(img, dither)
+    if outline:
+        add_outline(img, outline)
     return img
 
 def create_grass_tile(variant=0):
@@ -185,158 +267,203 @@ def create_transition_tile(from_terrain, to_terrain, direction):
 
     return img
 
-def create_character_sprite(char_type='player', direction='down', frame=0):
-    """24x32 character sprite with distinct personalities"""
-    img = Image.new('RGBA', (24, 32), COLORS['transparent'])
+# Character looks, declared as data. Every variant is a palette applied to a
+# shared body template (see character_template), so adding an NPC look costs
+# one palette lookup per frame rather than a redraw.
+CHARACTER_VARIANTS = {
+    # Young explorer - brown hair, blue shirt, tan pants
+    'player': {
+        'hair': COLORS['brown_dark'],
+        'shirt': COLORS['blue_clothes'],
+        'pants': (139, 119, 101),  # Tan
+        'skin': COLORS['skin_light'],
+        'hat': 'cap',
+    },
+    # Friendly merchant - red hair, green apron, warm personality
+    'shopkeeper': {
+        'hair': (200, 100, 50),  # Auburn
+        'shirt': (140, 180, 140),  # Green
+        'pants': (80, 80, 120),  # Dark blue
+        'skin': COLORS['skin_mid'],
+        'hat': None,
+    },
+    # Wise educator - gray hair, purple robe, glasses
+    'teacher': {
+        'hair': (150, 150, 160),  # Gray
+        'shirt': (120, 80, 160),  # Purple
+        'pants': (100, 70, 140),  # Dark purple
+        'skin': COLORS['skin_light'],
+        'hat': None,
+    },
+    # Researcher - blonde, white lab coat, energetic
+    'scientist': {
+        'hair': (220, 200, 130),  # Blonde
+        'shirt': (240, 240, 250),  # White coat
+        'pants': (60, 60, 60),  # Dark gray
+        'skin': COLORS['skin_mid'],
+        'hat': None,
+    },
+    # Weathered sailor - beard, yellow raincoat, boots
+    'fisherman': {
+        'hair': (90, 70, 50),  # Dark brown beard
+        'shirt': (220, 200, 50),  # Yellow raincoat
+        'pants': (40, 60, 80),  # Blue jeans
+        'skin': (220, 170, 130),  # Tan skin
+        'hat': 'rain_hat',
+    },
+}
+
+# Look for char_types without a variant
+DEFAULT_CHARACTER = {
+    'hair': COLORS['brown_dark'],
+    'shirt': COLORS['blue_clothes'],
+    'pants': COLORS['brown_light'],
+    'skin': COLORS['skin_mid'],
+    'hat': None,
+}
+
+# Palette slots a character template is drawn with
+CHARACTER_SLOTS = ['transparent', 'shadow', 'outline', 'skin', 'hair', 'shirt', 'pants']
+SLOT = {name: i for i, name in enumerate(CHARACTER_SLOTS)}
+
+def character_palette(char_type):
+    """RGBA lookup table mapping each CHARACTER_SLOTS index to a color"""
+    variant = CHARACTER_VARIANTS.get(char_type, DEFAULT_CHARACTER)
+    colors = {
+        'transparent': COLORS['transparent'],
+        'shadow': COLORS['shadow'],
+        'outline': COLORS['outline'],
+    }
+    colors.update((slot, variant[slot]) for slot in ('skin', 'hair', 'shirt', 'pants'))
+    return np.array([tuple(colors[slot]) + (255,) * (4 - len(colors[slot]))
+                     for slot in CHARACTER_SLOTS], dtype=np.uint8)
+
+@functools.lru_cache(maxsize=None)
+def character_template(hat, direction, frame):
+    """
+    24x32 body template as a 2D array of CHARACTER_SLOTS indices.
+
+    Hats only show facing down, so other directions share one template
+    whatever the hat.
+    """
+    img = Image.new('P', (24, 32), SLOT['transparent'])
     draw = ImageDraw.Draw(img)
+    skin, hair, shirt, pants = SLOT['skin'], SLOT['hair'], SLOT['shirt'], SLOT['pants']
+    outline = SLOT['outline']
 
     # Shadow (larger)
-    draw.ellipse([6, 29, 17, 31], fill=COLORS['shadow'])
-
-    # Character-specific colors and features
-    if char_type == 'player':
-        # Young explorer - brown hair, blue shirt, tan pants
-        hair_color = COLORS['brown_dark']
-        shirt_color = COLORS['blue_clothes']
-        pants_color = (139, 119, 101)  # Tan
-        skin_color = COLORS['skin_light']
-        has_hat = True
-    elif char_type == 'shopkeeper':
-        # Friendly merchant - red hair, green apron, warm personality
-        hair_color = (200, 100, 50)  # Auburn
-        shirt_color = (140, 180, 140)  # Green
-        pants_color = (80, 80, 120)  # Dark blue
-        skin_color = COLORS['skin_mid']
-        has_hat = False
-    elif char_type == 'teacher':
-        # Wise educator - gray hair, purple robe, glasses
-        hair_color = (150, 150, 160)  # Gray
-        shirt_color = (120, 80, 160)  # Purple
-        pants_color = (100, 70, 140)  # Dark purple
-        skin_color = COLORS['skin_light']
-        has_hat = False
-    elif char_type == 'scientist':
-        # Researcher - blonde, white lab coat, energetic
-        hair_color = (220, 200, 130)  # Blonde
-        shirt_color = (240, 240, 250)  # White coat
-        pants_color = (60, 60, 60)  # Dark gray
-        skin_color = COLORS['skin_mid']
-        has_hat = False
-    elif char_type == 'fisherman':
-        # Weathered sailor - beard, yellow raincoat, boots
-        hair_color = (90, 70, 50)  # Dark brown beard
-        shirt_color = (220, 200, 50)  # Yellow raincoat
-        pants_color = (40, 60, 80)  # Blue jeans
-        skin_color = (220, 170, 130)  # Tan skin
-        has_hat = True
-    else:
-        # Default
-        hair_color = COLORS['brown_dark']
-        shirt_color = COLORS['blue_clothes']
-        pants_color = COLORS['brown_light']
-        skin_color = COLORS['skin_mid']
-        has_hat = False
+    draw.ellipse([6, 29, 17, 31], fill=SLOT['shadow'])
 
     # Outline for visibility
-    draw.rectangle([7, 6, 16, 27], outline=COLORS['outline'], width=1)
+    draw.rectangle([7, 6, 16, 27], outline=outline, width=1)
 
     # Draw based on direction
     if direction == 'down':
         # Head
-        draw.ellipse([8, 5, 15, 12], fill=skin_color)
+        draw.ellipse([8, 5, 15, 12], fill=skin)
 
         # Hair/Hat
-        if has_hat:
-            if char_type == 'fisherman':
-                # Rain hat
-                draw.rectangle([7, 4, 16, 7], fill=shirt_color)
-            else:
-                # Explorer cap
-                draw.rectangle([7, 3, 16, 6], fill=hair_color)
+        if hat == 'rain_hat':
+            draw.rectangle([7, 4, 16, 7], fill=shirt)
+        elif hat == 'cap':
+            # Explorer cap
+            draw.rectangle([7, 3, 16, 6], fill=hair)
         else:
             # Hair
-            draw.ellipse([7, 4, 16, 10], fill=hair_color)
+            draw.ellipse([7, 4, 16, 10], fill=hair)
 
         # Eyes
-        draw.point([(10, 9), (13, 9)], fill=COLORS['outline'])
+        draw.point([(10, 9), (13, 9)], fill=outline)
 
         # Body (shirt)
-        draw.rectangle([8, 13, 15, 21], fill=shirt_color)
+        draw.rectangle([8, 13, 15, 21], fill=shirt)
 
         # Arms
-        draw.rectangle([7, 14, 8, 20], fill=shirt_color)
-        draw.rectangle([15, 14, 16, 20], fill=shirt_color)
+        draw.rectangle([7, 14, 8, 20], fill=shirt)
+        draw.rectangle([15, 14, 16, 20], fill=shirt)
 
         # Pants/Legs - animated
         if frame == 0:  # Standing
-            draw.rectangle([9, 22, 11, 27], fill=pants_color)
-            draw.rectangle([12, 22, 14, 27], fill=pants_color)
+            draw.rectangle([9, 22, 11, 27], fill=pants)
+            draw.rectangle([12, 22, 14, 27], fill=pants)
         else:  # Walking
-            draw.rectangle([9, 22, 11, 27], fill=pants_color)
-            draw.rectangle([12, 21, 14, 27], fill=pants_color)
+            draw.rectangle([9, 22, 11, 27], fill=pants)
+            draw.rectangle([12, 21, 14, 27], fill=pants)
 
     elif direction == 'up':
         # Back of head
-        draw.ellipse([8, 5, 15, 12], fill=hair_color)
+        draw.ellipse([8, 5, 15, 12], fill=hair)
 
         # Body
-        draw.rectangle([8, 13, 15, 21], fill=shirt_color)
+        draw.rectangle([8, 13, 15, 21], fill=shirt)
 
         # Arms
-        draw.rectangle([7, 14, 8, 20], fill=shirt_color)
-        draw.rectangle([15, 14, 16, 20], fill=shirt_color)
+        draw.rectangle([7, 14, 8, 20], fill=shirt)
+        draw.rectangle([15, 14, 16, 20], fill=shirt)
 
         # Legs - animated
         if frame == 0:
-            draw.rectangle([9, 22, 11, 27], fill=pants_color)
-            draw.rectangle([12, 22, 14, 27], fill=pants_color)
+            draw.rectangle([9, 22, 11, 27], fill=pants)
+            draw.rectangle([12, 22, 14, 27], fill=pants)
         else:
-            draw.rectangle([9, 21, 11, 27], fill=pants_color)
-            draw.rectangle([12, 22, 14, 27], fill=pants_color)
+            draw.rectangle([9, 21, 11, 27], fill=pants)
+            draw.rectangle([12, 22, 14, 27], fill=pants)
 
     elif direction == 'left':
         # Side view - head
-        draw.ellipse([9, 5, 16, 12], fill=skin_color)
-        draw.ellipse([8, 4, 15, 10], fill=hair_color)
+        draw.ellipse([9, 5, 16, 12], fill=skin)
+        draw.ellipse([8, 4, 15, 10], fill=hair)
 
         # Eye
-        draw.point([(12, 9)], fill=COLORS['outline'])
+        draw.point([(12, 9)], fill=outline)
 
         # Body
-        draw.rectangle([9, 13, 15, 21], fill=shirt_color)
+        draw.rectangle([9, 13, 15, 21], fill=shirt)
 
         # Arm (one visible)
-        draw.rectangle([8, 15, 10, 20], fill=shirt_color)
+        draw.rectangle([8, 15, 10, 20], fill=shirt)
 
         # Legs - animated
         if frame == 0:
-            draw.rectangle([10, 22, 13, 27], fill=pants_color)
+            draw.rectangle([10, 22, 13, 27], fill=pants)
         else:
-            draw.rectangle([9, 22, 12, 27], fill=pants_color)
-            draw.rectangle([12, 21, 14, 27], fill=pants_color)
+            draw.rectangle([9, 22, 12, 27], fill=pants)
+            draw.rectangle([12, 21, 14, 27], fill=pants)
 
     elif direction == 'right':
         # Side view - head (mirrored)
-        draw.ellipse([7, 5, 14, 12], fill=skin_color)
-        draw.ellipse([8, 4, 15, 10], fill=hair_color)
+        draw.ellipse([7, 5, 14, 12], fill=skin)
+        draw.ellipse([8, 4, 15, 10], fill=hair)
 
         # Eye
-        draw.point([(11, 9)], fill=COLORS['outline'])
+        draw.point([(11, 9)], fill=outline)
 
         # Body
-        draw.rectangle([8, 13, 14, 21], fill=shirt_color)
+        draw.rectangle([8, 13, 14, 21], fill=shirt)
 
         # Arm
-        draw.rectangle([13, 15, 15, 20], fill=shirt_color)
+        draw.rectangle([13, 15, 15, 20], fill=shirt)
 
         # Legs - animated
         if frame == 0:
-            draw.rectangle([10, 22, 13, 27], fill=pants_color)
+            draw.rectangle([10, 22, 13, 27], fill=pants)
         else:
-            draw.rectangle([9, 21, 11, 27], fill=pants_color)
-            draw.rectangle([11, 22, 14, 27], fill=pants_color)
+            draw.rectangle([9, 21, 11, 27], fill=pants)
+            draw.rectangle([11, 22, 14, 27], fill=pants)
 
-    return img
+    template = np.asarray(img, dtype=np.uint8)
+    template.flags.writeable = False
+    return template
+
+def recolor(template, palette):
+    """Apply a palette lookup table to a template of slot indices"""
+    return Image.fromarray(palette[template], 'RGBA')
+
+def create_character_sprite(char_type='player', direction='down', frame=0):
+    """24x32 character sprite with distinct personalities"""
+    variant = CHARACTER_VARIANTS.get(char_type, DEFAULT_CHARACTER)
+    hat = variant['hat'] if direction == 'down' else None
+    return recolor(character_template(hat, direction, frame), character_palette(char_type))
 
 def create_tree():
     """32x32 tree (2x2 tiles)"""
@@ -396,115 +523,842 @@ def create_lighthouse():
 
     return img
 
-def main():
-    """Generate all sprite sheets and index files"""
-    output_dir = 'static/sprites'
-    os.makedirs(output_dir, exist_ok=True)
+# Creature pixel art, 16x16, as (color, x, y, w, h) rects drawn in order
+# (mirrored by CREATURE_ART in src/spriteLoader.js for when the sheet isn't
+# loaded; keep the two in sync). 'shadow' is only drawn under the normal
+# variant; creatures without hand-made 'enhanced' art get a brightened,
+# glowing copy of 'normal' (see create_creature_sprite).
+CREATURE_ART = {
+    'lumina': {
+        # Wounded glowing moth
+        'shadow': [(3, 10, 11, 1)],
+        'normal': [
+            ((0, 255, 255, 102), 5, 5, 6, 6),   # Glow aura
+            ((93, 78, 55), 7, 6, 2, 4),         # Body
+            ((147, 112, 219), 3, 6, 3, 3),      # Left wing (damaged)
+            ((0, 206, 209), 4, 7, 1, 1),
+            ((147, 112, 219), 10, 5, 4, 4),     # Right wing
+            ((0, 206, 209), 11, 6, 2, 2),
+            ((72, 209, 204), 12, 7, 1, 1),
+            ((0, 255, 255), 5, 7, 1, 1),        # Wing glow
+            ((0, 255, 255), 11, 7, 1, 1),
+            ((62, 39, 35), 7, 5, 2, 1),         # Head
+            ((26, 26, 26), 7, 4, 1, 1),         # Antennae
+            ((26, 26, 26), 8, 4, 1, 1),
+            ((255, 255, 0), 7, 5, 1, 1),        # Eyes
+            ((255, 255, 0), 8, 5, 1, 1),
+        ],
+        # Healed wings, brighter colors, glowing antennae
+        'enhanced': [
+            ((0, 255, 255, 179), 4, 4, 8, 8),   # Glow aura
+            ((139, 111, 71), 7, 6, 2, 4),       # Body
+            ((186, 85, 211), 3, 5, 4, 4),       # Left wing
+            ((0, 255, 255), 4, 6, 2, 2),
+            ((72, 209, 204), 5, 7, 1, 1),
+            ((186, 85, 211), 9, 5, 4, 4),       # Right wing
+            ((0, 255, 255), 10, 6, 2, 2),
+            ((72, 209, 204), 10, 7, 1, 1),
+            ((255, 255, 255), 3, 5, 1, 1),      # Wing edges
+            ((255, 255, 255), 12, 5, 1, 1),
+            ((111, 78, 55), 7, 5, 2, 1),        # Head
+            ((62, 39, 35), 6, 4, 1, 1),         # Antennae
+            ((62, 39, 35), 9, 4, 1, 1),
+            ((255, 215, 0), 6, 3, 1, 1),        # Antenna tips
+            ((255, 215, 0), 9, 3, 1, 1),
+            ((255, 255, 255), 7, 5, 1, 1),      # Eyes
+            ((255, 255, 255), 8, 5, 1, 1),
+        ],
+    },
+    'sprout': {
+        # Seedling with two leaves
+        'shadow': [(4, 13, 8, 1)],
+        'normal': [
+            (COLORS['brown_light'], 5, 9, 6, 4),  # Seed
+            ((170, 120, 80), 6, 9, 2, 1),
+            (COLORS['grass_dark'], 7, 5, 2, 4),   # Stem
+            (COLORS['grass_mid'], 4, 4, 3, 2),    # Leaves
+            (COLORS['grass_light'], 4, 4, 1, 1),
+            (COLORS['grass_mid'], 9, 3, 3, 2),
+            (COLORS['grass_light'], 11, 3, 1, 1),
+            (COLORS['outline'], 6, 10, 1, 1),     # Eyes
+            (COLORS['outline'], 9, 10, 1, 1),
+            ((220, 120, 120), 5, 11, 1, 1),       # Cheeks
+            ((220, 120, 120), 10, 11, 1, 1),
+        ],
+    },
+    'spark': {
+        # Firefly with a glowing abdomen
+        'shadow': [(4, 13, 8, 1)],
+        'normal': [
+            ((255, 235, 120, 90), 4, 5, 8, 8),    # Glow
+            ((200, 220, 240), 4, 4, 3, 2),        # Wings
+            ((200, 220, 240), 9, 4, 3, 2),
+            ((40, 40, 50), 7, 5, 2, 2),           # Head
+            ((60, 50, 40), 7, 7, 2, 2),           # Thorax
+            (COLORS['yellow_mid'], 6, 9, 4, 3),   # Abdomen
+            (COLORS['yellow_light'], 7, 10, 2, 1),
+            ((40, 40, 50), 6, 3, 1, 2),           # Antennae
+            ((40, 40, 50), 9, 3, 1, 2),
+            ((255, 255, 255), 7, 5, 1, 1),        # Eyes
+            ((255, 255, 255), 8, 5, 1, 1),
+        ],
+    },
+    'dusty': {
+        # Sand crab
+        'shadow': [(3, 13, 10, 1)],
+        'normal': [
+            ((180, 60, 40), 2, 11, 2, 1),         # Legs
+            ((180, 60, 40), 12, 11, 2, 1),
+            ((180, 60, 40), 3, 12, 1, 1),
+            ((180, 60, 40), 12, 12, 1, 1),
+            ((220, 90, 60), 4, 8, 8, 4),          # Shell
+            ((240, 130, 90), 5, 8, 3, 1),
+            ((200, 80, 50), 4, 7, 1, 1),          # Arms
+            ((200, 80, 50), 11, 7, 1, 1),
+            ((220, 90, 60), 2, 5, 3, 3),          # Claws
+            ((220, 90, 60), 11, 5, 3, 3),
+            ((180, 60, 40), 2, 5, 1, 1),
+            ((180, 60, 40), 13, 5, 1, 1),
+            ((180, 60, 40), 6, 6, 1, 2),          # Eye stalks
+            ((180, 60, 40), 9, 6, 1, 2),
+            (COLORS['outline'], 6, 5, 1, 1),      # Eyes
+            (COLORS['outline'], 9, 5, 1, 1),
+        ],
+    },
+    'pebble': {
+        # Mossy river stone
+        'shadow': [(3, 13, 10, 1)],
+        'normal': [
+            (COLORS['stone_dark'], 4, 7, 8, 5),   # Stone
+            (COLORS['stone_dark'], 5, 6, 6, 1),
+            (COLORS['stone_dark'], 5, 12, 6, 1),
+            (COLORS['stone_mid'], 5, 7, 6, 4),
+            (COLORS['stone_light'], 5, 7, 2, 1),
+            (COLORS['grass_mid'], 9, 7, 2, 1),    # Moss
+            (COLORS['grass_mid'], 10, 8, 1, 1),
+            (COLORS['outline'], 6, 9, 1, 1),      # Eyes
+            (COLORS['outline'], 9, 9, 1, 1),
+        ],
+    },
+    'marina': {
+        # Dolphin
+        'shadow': [(3, 13, 10, 1)],
+        'normal': [
+            (COLORS['water_mid'], 3, 7, 9, 4),    # Body
+            (COLORS['water_light'], 5, 7, 4, 1),
+            ((200, 225, 240), 4, 10, 7, 1),       # Belly
+            (COLORS['water_mid'], 1, 8, 2, 2),    # Snout
+            (COLORS['water_dark'], 1, 9, 1, 1),
+            (COLORS['water_dark'], 7, 5, 2, 2),   # Dorsal fin
+            (COLORS['water_dark'], 12, 8, 2, 2),  # Tail
+            (COLORS['water_dark'], 14, 6, 1, 2),
+            (COLORS['water_dark'], 14, 10, 1, 2),
+            (COLORS['outline'], 4, 8, 1, 1),      # Eye
+        ],
+    },
+    'frost': {
+        # Ice crystal
+        'shadow': [(4, 13, 8, 1)],
+        'normal': [
+            ((138, 199, 226, 90), 4, 3, 8, 10),   # Glow
+            ((140, 200, 230), 4, 6, 2, 4),        # Side shards
+            ((140, 200, 230), 10, 6, 2, 4),
+            ((180, 225, 245), 6, 4, 4, 8),        # Core
+            ((220, 240, 255), 7, 2, 2, 2),        # Tip
+            ((255, 255, 255), 7, 4, 1, 3),
+            (COLORS['water_deep'], 6, 8, 1, 1),   # Eyes
+            (COLORS['water_deep'], 9, 8, 1, 1),
+        ],
+    },
+    'blaze': {
+        # Salamander
+        'shadow': [(2, 13, 12, 1)],
+        'normal': [
+            ((200, 70, 40), 2, 10, 3, 1),         # Tail
+            ((200, 70, 40), 1, 9, 1, 1),
+            ((230, 100, 50), 4, 9, 7, 3),         # Body
+            ((255, 180, 120), 5, 11, 5, 1),
+            ((230, 100, 50), 10, 7, 4, 3),        # Head
+            ((200, 70, 40), 5, 12, 1, 1),         # Legs
+            ((200, 70, 40), 9, 12, 1, 1),
+            (COLORS['yellow_mid'], 5, 9, 1, 1),   # Spots
+            (COLORS['yellow_mid'], 8, 10, 1, 1),
+            (COLORS['yellow_mid'], 11, 6, 2, 1),  # Crest
+            (COLORS['outline'], 12, 8, 1, 1),     # Eye
+        ],
+    },
+}
 
-    print("Generating sprite sheets...")
+CREATURE_SHADOW = (0, 0, 0, 77)
 
-    # TILESET (256x128 - 16x8 grid of 16x16 tiles)
-    tileset = Image.new('RGBA', (256, 128), COLORS['transparent'])
-    tileset_index = {
-        'tileSize': 16,
-        'tiles': {}
-    }
+# Glow traced around derived 'enhanced' creatures
+CREATURE_GLOW = COLORS['yellow_light']
 
-    tile_x, tile_y = 0, 0
+# Idle animation: frame 1 lifts everything but the shadow by 1px
+CREATURE_FRAMES = 2
 
-    # Grass variants (4 tiles)
-    for i in range(4):
-        grass = create_grass_tile(i)
-        tileset.paste(grass, (tile_x * 16, tile_y * 16))
-        tileset_index['tiles'][f'grass_{i}'] = {'x': tile_x, 'y': tile_y}
-        tile_x += 1
+def _fill_rect(img, color, x, y, w, h):
+    """fillRect with canvas-style (source-over) blending for translucent colors"""
+    box = [x, y, x + w - 1, y + h - 1]
+    if len(color) == 3 or color[3] == 255:
+        ImageDraw.Draw(img).rectangle(box, fill=tuple(color[:3]))
+    else:
+        layer = Image.new('RGBA', img.size, COLORS['transparent'])
+        ImageDraw.Draw(layer).rectangle(box, fill=tuple(color))
+        img.alpha_composite(layer)
 
-    # Water animation frames (3 tiles)
-    for i in range(3):
-        water = create_water_tile(i)
-        tileset.paste(water, (tile_x * 16, tile_y * 16))
-        tileset_index['tiles'][f'water_{i}'] = {'x': tile_x, 'y': tile_y}
-        tile_x += 1
+def create_creature_sprite(creature_id, enhanced=False, frame=0):
+    """16x16 creature sprite (normal or enhanced for naming/bonding moments)"""
+    img = Image.new('RGBA', (16, 16), COLORS['transparent'])
+    art = CREATURE_ART[creature_id]
+    lift = frame % CREATURE_FRAMES
 
-    # Sand variants (3 tiles)
-    for i in range(3):
-        sand = create_sand_tile(i)
-        tileset.paste(sand, (tile_x * 16, tile_y * 16))
-        tileset_index['tiles'][f'sand_{i}'] = {'x': tile_x, 'y': tile_y}
-        tile_x += 1
-
-    # Move to next row
-    tile_x, tile_y = 0, 1
-
-    # Transition tiles: grass→sand
-    for direction in ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']:
-        trans = create_transition_tile('grass', 'sand', direction)
-        tileset.paste(trans, (tile_x * 16, tile_y * 16))
-        tileset_index['tiles'][f'grass_sand_{direction}'] = {'x': tile_x, 'y': tile_y}
-        tile_x += 1
-        if tile_x >= 16:
-            tile_x = 0
-            tile_y += 1
-
-    # Transition tiles: grass→water
-    for direction in ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']:
-        trans = create_transition_tile('grass', 'water', direction)
-        tileset.paste(trans, (tile_x * 16, tile_y * 16))
-        tileset_index['tiles'][f'grass_water_{direction}'] = {'x': tile_x, 'y': tile_y}
-        tile_x += 1
-        if tile_x >= 16:
-            tile_x = 0
-            tile_y += 1
-
-    tileset.save(f'{output_dir}/tileset.png')
-    with open(f'{output_dir}/tileset.json', 'w') as f:
-        json.dump(tileset_index, f, indent=2)
-    print(f"✓ Tileset created: {output_dir}/tileset.png")
-
-    # CHARACTERS - Multiple character types (5 types × 4 directions × 2 frames)
-    # Sprite sheet: 120x128 (5 rows of 4 directions, each 24x32)
-    char_types = ['player', 'shopkeeper', 'teacher', 'scientist', 'fisherman']
-    characters = Image.new('RGBA', (96, 160), COLORS['transparent'])
-    char_index = {
-        'spriteWidth': 24,
-        'spriteHeight': 32,
-        'characters': {}
-    }
+    if not enhanced:
+        for x, y, w, h in art.get('shadow', []):
+            _fill_rect(img, CREATURE_SHADOW, x, y, w, h)
+
+    for color, x, y, w, h in art['enhanced'] if enhanced and 'enhanced' in art else art['normal']:
+        _fill_rect(img, color, x, y - lift, w, h)
 
-    directions = ['down', 'up', 'left', 'right']
+    if enhanced and 'enhanced' not in art:
+        # Brighter and glowing, like Lumina's hand-made enhanced art
+        arr = _to_array(img)
+        arr[..., :3] = np.round(arr[..., :3] * 1.2).astype(np.int16)
+        _store(img, arr)
+        add_outline(img, CREATURE_GLOW)
+
+    return img
 
-    for char_idx, char_type in enumerate(char_types):
-        char_index['characters'][char_type] = {'animations': {}}
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Where the game loads sprites from (see SpriteLoader.load)
+OUTPUT_DIR = os.path.join(REPO_ROOT, 'assets', 'sprites')
+
+# Game data; the creatures sheet covers every entry in its CREATURES
+DATA_JS = os.path.join(REPO_ROOT, 'src', 'data.js')
+
+# Rendered sprites and the key each output file was last built from live here.
+# Everything in it can be deleted at any time; it only saves work.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sprite-cache')
+
+# Texture code is part of a textured sprite's inputs
+TEXTURE_PASSES = (apply_texture, apply_shading, add_noise, apply_dither, add_outline)
+
+TRANSITION_DIRECTIONS = ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']
+
+CHARACTER_TYPES = list(CHARACTER_VARIANTS)
+DIRECTIONS = ['down', 'up', 'left', 'right']
+
+# create_character_sprite's side views face the opposite way to their names:
+# facing direction -> direction argument that draws it
+ART_DIRECTION = {'down': 'down', 'up': 'up', 'left': 'right', 'right': 'left'}
+
+CREATURE_VARIANTS = ['normal', 'enhanced']
+
+# Index fields measured in sheet pixels (see scale_index)
+INDEX_PIXEL_FIELDS = ['tileSize', 'spriteWidth', 'spriteHeight', 'spriteSize', 'width', 'height']
+
+# Transparent gap around every atlas sprite so filtering never bleeds neighbours
+ATLAS_PADDING = 1
+
+class SpriteSpec(namedtuple('SpriteSpec', 'name fn args texture')):
+    """One create_* call, plus the TEXTURES family applied to its output (or None)"""
+    __slots__ = ()
+
+# Module-level values a function's digest covers when it reads them
+CONSTANT_TYPES = (dict, list, tuple, str, int, float, bool)
+
+def _global_names(code):
+    """Global names a code object reads, including inside its comprehensions and lambdas"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(fn):
+    """
+    Hash of a function's source and of everything it reaches in this module:
+    the sources of the functions it calls, recursively, and the constants they
+    read. Helpers behind functools wrappers (the lru_cached character_template)
+    are followed too. Editing a create_* body, a helper such as _fill_rect or
+    a table such as CREATURE_ART or CHARACTER_VARIANTS therefore invalidates
+    the sprites drawn with it.
+    """
+    module = fn.__globals__
+    sources, constants = {}, {}
+    pending = [fn]
+    while pending:
+        current = pending.pop()
+        if current.__name__ in sources:
+            continue
+        sources[current.__name__] = inspect.getsource(current)
+        for name in _global_names(current.__code__):
+            value = module.get(name)
+            if callable(value):
+                value = inspect.unwrap(value)
+            if isinstance(value, types.FunctionType) and value.__globals__ is module:
+                pending.append(value)
+            elif isinstance(value, CONSTANT_TYPES):
+                constants[name] = repr(value)
+    return _digest(sources, constants)
+
+def _digest(*parts):
+    """Content hash of JSON-serialisable parts"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _png_bytes(img, **options):
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', **options)
+    return buf.getvalue()
+
+def encode_png(img, mode='indexed'):
+    """
+    PNG bytes for a finished sheet.
+
+    'indexed' writes a lossless palette (P-mode) PNG with per-entry alpha
+    whenever the sheet has at most 256 colors, at the smallest bit depth
+    that fits, and falls back to an optimized RGBA PNG otherwise.
+    'rgba' is Pillow's default RGBA encoding.
+    """
+    if mode == 'rgba':
+        return _png_bytes(img)
+
+    arr = np.array(img.convert('RGBA'))
+    arr[arr[..., 3] == 0] = 0  # Fully transparent pixels are all the same color
+    colors, inverse = np.unique(arr.reshape(-1, 4), axis=0, return_inverse=True)
+    if len(colors) > 256:
+        return _png_bytes(img, optimize=True)
+
+    # Translucent entries first, so the tRNS chunk only lists those
+    order = np.argsort(colors[:, 3] == 255, kind='stable')
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    palette = colors[order]
+
+    indexed = Image.fromarray(remap[inverse.ravel()].reshape(arr.shape[:2]).astype(np.uint8), 'P')
+    indexed.putpalette(palette[:, :3].tobytes())
+    options = {'optimize': True, 'bits': next(b for b in (1, 2, 4, 8) if len(palette) <= 1 << b)}
+    translucent = int((palette[:, 3] < 255).sum())
+    if translucent:
+        options['transparency'] = palette[:translucent, 3].tobytes()
+    return _png_bytes(indexed, **options)
+
+def sprite_key(spec, seed):
+    """Cache key for a sprite: its create_* call, texture passes, seed and the palette"""
+    texture = TEXTURES.get(spec.texture) if spec.texture else None
+    return _digest(
+        spec.fn.__name__, _source_digest(spec.fn), list(spec.args),
+        texture,
+        [_source_digest(fn) for fn in TEXTURE_PASSES] if texture else None,
+        stable_seed(seed, spec.name) if texture else None,
+        COLORS,
+    )
+
+def render_sprite(spec, seed):
+    """Draw a sprite and run its texture passes"""
+    img = spec.fn(*spec.args)
+    if spec.texture:
+        apply_texture(img, stable_seed(seed, spec.name), **TEXTURES[spec.texture])
+    return img
 
-        for dir_idx, direction in enumerate(directions):
-            frames_data = []
+class BuildCache:
+    """Content-addressed sprite store plus a manifest of what each output was built from"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self.outputs = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.outputs = json.load(f).get('outputs', {})
+
+    def _sprite_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.png')
+
+    def has(self, key):
+        return os.path.exists(self._sprite_path(key))
+
+    def store(self, key, data):
+        """Store a rendered sprite's PNG bytes under its key"""
+        _write_atomic(self._sprite_path(key), data)
+
+    def sprite(self, key):
+        """Load a rendered sprite (see render_missing)"""
+        with Image.open(self._sprite_path(key)) as img:
+            return img.convert('RGBA')
+
+    def is_current(self, path, key):
+        """True if path exists, is untouched, and was built from key"""
+        entry = self.outputs.get(os.path.abspath(path))
+        if not entry or entry['key'] != key or not os.path.exists(path):
+            return False
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest() == entry['sha256']
+
+    def write(self, path, data, key, baseline_bytes=None):
+        """
+        Write an output only if its bytes changed, so unchanged files keep their mtime.
+
+        baseline_bytes is what a default RGBA encoding would have weighed,
+        kept for the size report.
+        """
+        changed = True
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                changed = f.read() != data
+        if changed:
+            _write_atomic(path, data)
+        self.outputs[os.path.abspath(path)] = {
+            'key': key,
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'bytes': len(data),
+            'baseline_bytes': baseline_bytes or len(data),
+        }
+        return changed
+
+    def size_report(self, paths):
+        """(path, baseline bytes, written bytes) for outputs built so far"""
+        report = []
+        for path in paths:
+            entry = self.outputs.get(os.path.abspath(path))
+            if entry and 'bytes' in entry:
+                report.append((path, entry['baseline_bytes'], entry['bytes']))
+        return report
+
+    def save(self):
+        _write_atomic(self.manifest_path,
+                      json.dumps({'outputs': self.outputs}, indent=2, sort_keys=True).encode('utf-8'))
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class SheetPlan(namedtuple('SheetPlan', 'name size cell placed index png scales keys key')):
+    """A sheet's layout plus the cache key of every sprite on it and of the sheet itself"""
+    __slots__ = ()
+
+    def paths(self, output_dir, scale=1):
+        """(png path, json path or None) of the sheet at one scale: name.png, name@2x.png, ..."""
+        stem = os.path.join(output_dir, self.name if scale == 1 else f'{self.name}@{scale}x')
+        return f'{stem}.png', f'{stem}.json' if self.index is not None else None
+
+    def pngs(self, output_dir):
+        return [self.paths(output_dir, scale)[0] for scale in self.scales]
+
+    def outputs(self, output_dir):
+        return [path for scale in self.scales for path in self.paths(output_dir, scale) if path]
+
+def plan_sheet(seed, name, size, cell, placed, index=None, png='indexed', scales=(1,)):
+    """
+    Key a sheet without drawing anything.
+
+    placed is a list of (SpriteSpec, (col, row)) in units of cell, or of
+    (SpriteSpec, None) with no size or cell for a bin-packed sheet.
+    png is the encode_png mode; scales are the integer scales to write
+    (see scale_index).
+    """
+    keys = [sprite_key(spec, seed) for spec, _ in placed]
+    packer = [ATLAS_PADDING] + [_source_digest(fn) for fn in (pack_atlas, pack_rects, _skyline_pack)]
+    key = _digest(name, size, cell, packer if cell is None else None,
+                  [[k, spec.name, pos] for k, (spec, pos) in zip(keys, placed)], index,
+                  png, _source_digest(encode_png), list(scales), _source_digest(scale_index))
+    return SheetPlan(name, size, cell, placed, index, png, tuple(scales), keys, key)
+
+def _render_png(spec, seed):
+    """Process-pool worker: draw one sprite and hand it back as PNG bytes"""
+    return _png_bytes(render_sprite(spec, seed))
+
+def render_missing(cache, plans, seed, jobs):
+    """
+    Draw every sprite the given sheets need that is not cached yet.
+
+    Sprites are independent, so cache misses are fanned out over a process
+    pool; only the finished PNGs come back to this process.
+    """
+    missing = {}
+    for plan in plans:
+        for key, (spec, _) in zip(plan.keys, plan.placed):
+            if key not in missing and not cache.has(key):
+                missing[key] = spec
+    if not missing:
+        return 0
+
+    keys = list(missing)
+    specs = [missing[key] for key in keys]
+    if jobs > 1 and len(specs) > 1:
+        jobs = min(jobs, len(specs))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(specs) // (jobs * 4))
+            rendered = pool.map(_render_png, specs, [seed] * len(specs), chunksize=chunksize)
+            for key, data in zip(keys, rendered):
+                cache.store(key, data)
+    else:
+        for key, spec in zip(keys, specs):
+            cache.store(key, _render_png(spec, seed))
+    return len(keys)
+
+def pack_rects(sizes, max_width=4096):
+    """
+    Skyline bottom-left bin packing.
+
+    sizes maps an id to (w, h). Tries each power-of-two width that can hold
+    the widest rect and keeps the smallest (then squarest) result.
+    Returns ({id: (x, y)}, (width, height)).
+    """
+    # Tallest first packs tightest; ties broken by id so the layout is stable
+    order = sorted(sizes, key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+    widest = max(w for w, _ in sizes.values())
+    area = sum(w * h for w, h in sizes.values())
+
+    best = None
+    width = 1
+    while width < widest:
+        width *= 2
+    while width <= max_width:
+        positions, height = _skyline_pack(order, sizes, width)
+        score = (width * height, max(width, height))
+        if best is None or score < best[0]:
+            best = (score, positions, (width, height))
+        if width * width >= area * 4:
+            break
+        width *= 2
+    return best[1], best[2]
+
+def _skyline_pack(order, sizes, width):
+    skyline = [[0, 0, width]]  # [x, y, w] segments, left to right
+    positions = {}
+    height = 0
+    for rect_id in order:
+        w, h = sizes[rect_id]
+        best = None
+        for i, (x, _, _) in enumerate(skyline):
+            if x + w > width:
+                break
+            # Resting height over the segments this rect would span
+            y, covered, j = 0, 0, i
+            while covered < w:
+                y = max(y, skyline[j][1])
+                covered += skyline[j][2] - (x - skyline[j][0] if j == i else 0)
+                j += 1
+            if best is None or (y + h, x) < (best[0] + h, best[1]):
+                best = (y, x, i)
+        if best is None:
+            raise ValueError(f'{rect_id} ({w}x{h}) does not fit in a {width}px wide atlas')
+
+        y, x, i = best
+        positions[rect_id] = (x, y)
+        height = max(height, y + h)
+
+        # Raise the skyline under the new rect, trimming what it covers
+        skyline.insert(i, [x, y + h, w])
+        j = i + 1
+        while j < len(skyline) and skyline[j][0] < x + w:
+            seg = skyline[j]
+            overlap = x + w - seg[0]
+            if overlap >= seg[2]:
+                del skyline[j]
+            else:
+                seg[0] += overlap
+                seg[2] -= overlap
+                break
+        # Merge neighbours at the same height
+        j = 0
+        while j < len(skyline) - 1:
+            if skyline[j][1] == skyline[j + 1][1]:
+                skyline[j][2] += skyline[j + 1][2]
+                del skyline[j + 1]
+            else:
+                j += 1
+    return positions, height
+
+def pack_atlas(cache, plan, padding=ATLAS_PADDING):
+    """Bin-pack every sprite in plan into one image; returns (atlas, index)"""
+    # Identical sprites share a key, so they are packed once and aliased.
+    # Rects are packed under the first sprite name using them, not the key,
+    # so editing a sprite's art doesn't reshuffle the whole atlas.
+    sprites = {}
+    packed_as = {}
+    for key, (spec, _) in zip(plan.keys, plan.placed):
+        if key not in sprites:
+            sprites[key] = cache.sprite(key)
+            packed_as[key] = spec.name
+    positions, size = pack_rects({packed_as[key]: (img.width + padding, img.height + padding)
+                                  for key, img in sprites.items()})
+
+    atlas = Image.new('RGBA', size, COLORS['transparent'])
+    for key, img in sprites.items():
+        atlas.paste(img, positions[packed_as[key]])
+
+    rects = {}
+    for key, (spec, _) in zip(plan.keys, plan.placed):
+        x, y = positions[packed_as[key]]
+        rects[spec.name] = {'x': x, 'y': y, 'w': sprites[key].width, 'h': sprites[key].height}
+    index = {'width': size[0], 'height': size[1], 'sprites': rects}
+    index.update(plan.index)
+    return atlas, index
+
+def scale_index(index, scale):
+    """
+    Index for a sheet pre-scaled by an integer factor (nearest neighbour).
+
+    Pixel measures scale with the sheet; grid cells and frame names don't.
+    """
+    if scale == 1:
+        return index
+    scaled = dict(index)
+    for field in INDEX_PIXEL_FIELDS:
+        if field in scaled:
+            scaled[field] = index[field] * scale
+    if 'sprites' in index:
+        scaled['sprites'] = {name: {k: v * scale for k, v in rect.items()}
+                             for name, rect in index['sprites'].items()}
+    return scaled
+
+def build_sheet(cache, output_dir, plan):
+    """
+    Pack a planned sheet into {name}.png (+ {name}.json if it has an index),
+    plus {name}@{scale}x.png/.json for every other scale in the plan.
+
+    Grid sheets place sprites at their (col, row) cells; sheets without a
+    cell size are bin-packed (see pack_atlas). The sheet is not repacked at
+    all when every sprite key and the layout match the last build.
+    Returns True if any output file changed.
+    """
+    outputs = plan.outputs(output_dir)
+    if all(cache.is_current(path, plan.key) for path in outputs):
+        return False
+
+    if plan.cell is None:
+        sheet, index = pack_atlas(cache, plan)
+    else:
+        sheet, index = Image.new('RGBA', plan.size, COLORS['transparent']), plan.index
+        for key, (_, (col, row)) in zip(plan.keys, plan.placed):
+            sheet.paste(cache.sprite(key), (col * plan.cell[0], row * plan.cell[1]))
+
+    changed = False
+    for scale in plan.scales:
+        png_path, json_path = plan.paths(output_dir, scale)
+        scaled = sheet if scale == 1 else sheet.resize(
+            (sheet.width * scale, sheet.height * scale), Image.NEAREST)
+        changed = cache.write(png_path, encode_png(scaled, plan.png), plan.key,
+                              baseline_bytes=len(_png_bytes(scaled))) or changed
+        if json_path:
+            data = json.dumps(scale_index(index, scale), indent=2).encode('utf-8')
+            changed = cache.write(json_path, data, plan.key) or changed
+    return changed
+
+def tileset_layout():
+    """TILESET (256x128 - 16x8 grid of 16x16 tiles)"""
+    rows = [
+        [SpriteSpec(f'grass_{i}', create_grass_tile, (i,), 'grass') for i in range(4)]
+        + [SpriteSpec(f'water_{i}', create_water_tile, (i,), None) for i in range(3)]
+        + [SpriteSpec(f'sand_{i}', create_sand_tile, (i,), 'sand') for i in range(3)],
+        # Transition tiles: grass→sand, grass→water
+        [SpriteSpec(f'grass_{to}_{direction}', create_transition_tile, ('grass', to, direction), None)
+         for to in ('sand', 'water') for direction in TRANSITION_DIRECTIONS],
+    ]
+
+    placed = []
+    index = {'tileSize': 16, 'tiles': {}}
+    tile_y = 0
+    for row in rows:
+        tile_x = 0
+        for spec in row:
+            if tile_x >= 16:
+                tile_x = 0
+                tile_y += 1
+            placed.append((spec, (tile_x, tile_y)))
+            index['tiles'][spec.name] = {'x': tile_x, 'y': tile_y}
+            tile_x += 1
+        tile_y += 1
+    return (256, 128), (16, 16), placed, index
+
+def character_spec(char_type, direction, frame):
+    """Character frame facing `direction` (named for the way it faces, not the art)"""
+    return SpriteSpec(f'{char_type}_{direction}_{frame}', create_character_sprite,
+                      (char_type, ART_DIRECTION[direction], frame), None)
+
+def characters_layout():
+    """CHARACTERS - 5 types × 4 directions × 2 frames, each 24x32"""
+    placed = []
+    index = {'spriteWidth': 24, 'spriteHeight': 32, 'characters': {}}
+    for char_idx, char_type in enumerate(CHARACTER_TYPES):
+        # Columns follow the art's own direction order
+        for col, art in enumerate(DIRECTIONS):
             for frame in range(2):
-                char = create_character_sprite(char_type, direction, frame)
-                x = dir_idx * 24
-                y = (char_idx * 2 + frame) * 32
-                characters.paste(char, (x, y))
-                frames_data.append({'x': dir_idx, 'y': char_idx * 2 + frame})
-
-            char_index['characters'][char_type]['animations'][direction] = {
-                'frames': frames_data
+                placed.append((character_spec(char_type, ART_DIRECTION[art], frame),
+                               (col, char_idx * 2 + frame)))
+
+        index['characters'][char_type] = {'animations': {
+            direction: {'frames': [{'x': DIRECTIONS.index(ART_DIRECTION[direction]),
+                                    'y': char_idx * 2 + frame} for frame in range(2)]}
+            for direction in DIRECTIONS
+        }}
+    return (96, 64 * len(CHARACTER_TYPES)), (24, 32), placed, index
+
+def tree_layout():
+    """TREE (32x32)"""
+    return (32, 32), (32, 32), [(SpriteSpec('tree', create_tree, (), None), (0, 0))], None
+
+def lighthouse_layout():
+    """LIGHTHOUSE (48x80)"""
+    return (48, 80), (48, 80), [(SpriteSpec('lighthouse', create_lighthouse, (), None), (0, 0))], None
+
+def creature_ids(data_js=DATA_JS):
+    """Creature ids in the order src/data.js declares them in CREATURES"""
+    with open(data_js, encoding='utf-8') as f:
+        content = f.read()
+    block = re.search(r'^const CREATURES = \{(.*?)^\};', content, re.DOTALL | re.MULTILINE)
+    if not block:
+        raise ValueError(f'CREATURES not found in {data_js}')
+    return re.findall(r'^    (\w+): \{', block.group(1), re.MULTILINE)
+
+def creature_spec(creature_id, variant, frame):
+    suffix = '_enhanced' if variant == 'enhanced' else ''
+    return SpriteSpec(f'creature_{creature_id}{suffix}_{frame}', create_creature_sprite,
+                      (creature_id, variant == 'enhanced', frame), None)
+
+def creatures_layout():
+    """CREATURES - one row per creature: normal frames, then enhanced frames (16x16)"""
+    ids = creature_ids()
+    missing = [creature_id for creature_id in ids if creature_id not in CREATURE_ART]
+    if missing:
+        raise ValueError(f'no CREATURE_ART for: {", ".join(missing)}')
+
+    placed = []
+    index = {'spriteSize': 16, 'creatures': {}}
+    for row, creature_id in enumerate(ids):
+        index['creatures'][creature_id] = {}
+        for v, variant in enumerate(CREATURE_VARIANTS):
+            frames = []
+            for frame in range(CREATURE_FRAMES):
+                col = v * CREATURE_FRAMES + frame
+                placed.append((creature_spec(creature_id, variant, frame), (col, row)))
+                frames.append({'x': col, 'y': row})
+            index['creatures'][creature_id][variant] = {'frames': frames}
+    return (16 * CREATURE_FRAMES * len(CREATURE_VARIANTS), 16 * len(ids)), (16, 16), placed, index
+
+def atlas_layout():
+    """
+    ATLAS - every sprite from ATLAS_SHEETS, bin-packed into one image.
+
+    The index maps sprite names to pixel rects; characters map each
+    animation to the names of its frames.
+    """
+    placed = []
+    for name in ATLAS_SHEETS:
+        placed.extend((spec, None) for spec, _ in SHEETS[name][1]()[2])
+    names = [spec.name for spec, _ in placed]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f'sprite names must be unique in the atlas: {", ".join(duplicates)}')
+
+    index = {
+        'tileSize': 16,
+        'characters': {
+            char_type: {'animations': {
+                direction: {'frames': [character_spec(char_type, direction, frame).name
+                                       for frame in range(2)]}
+                for direction in DIRECTIONS
+            }}
+            for char_type in CHARACTER_TYPES
+        },
+        'creatures': {
+            creature_id: {
+                variant: {'frames': [creature_spec(creature_id, variant, frame).name
+                                     for frame in range(CREATURE_FRAMES)]}
+                for variant in CREATURE_VARIANTS
             }
+            for creature_id in creature_ids()
+        },
+    }
+    return None, None, placed, index
+
+# Every sheet the generator knows how to build: name -> (label, layout function)
+SHEETS = {
+    'tileset': ('Tileset', tileset_layout),
+    'characters': ('Characters', characters_layout),
+    'tree': ('Tree', tree_layout),
+    'lighthouse': ('Lighthouse', lighthouse_layout),
+    'creatures': ('Creatures', creatures_layout),
+    'atlas': ('Atlas', atlas_layout),
+}
 
-    characters.save(f'{output_dir}/characters.png')
-    with open(f'{output_dir}/characters.json', 'w') as f:
-        json.dump(char_index, f, indent=2)
-    print(f"✓ Characters created: {output_dir}/characters.png (5 unique characters)")
-
-    # TREE (32x32)
-    tree = create_tree()
-    tree.save(f'{output_dir}/tree.png')
-    print(f"✓ Tree created: {output_dir}/tree.png")
+# Sheets packed into the atlas
+ATLAS_SHEETS = ['tileset', 'characters', 'tree', 'lighthouse', 'creatures']
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the game\'s sprite sheets and index files.')
+    parser.add_argument('sheets', nargs='*', metavar='SHEET',
+                        help=f'sheets to build (default: all of {", ".join(SHEETS)})')
+    parser.add_argument('-o', '--output-dir', default=OUTPUT_DIR,
+                        help='directory to write sheets to (default: %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes for drawing sprites (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=TEXTURE_SEED,
+                        help='texture noise seed (default: %(default)s)')
+    parser.add_argument('--png', choices=['indexed', 'rgba'], default='indexed',
+                        help='PNG encoding: lossless palette PNGs where possible, '
+                             'or plain RGBA (default: %(default)s)')
+    parser.add_argument('--scales', default='1,2,3',
+                        help='comma-separated pre-scaled copies to write for high-DPI screens; '
+                             '1x is always written (default: %(default)s)')
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help='build cache location (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.sheets if name not in SHEETS]
+    if unknown:
+        parser.error(f'unknown sheet(s): {", ".join(unknown)} (choose from {", ".join(SHEETS)})')
+    args.sheets = args.sheets or list(SHEETS)
+
+    try:
+        scales = {int(scale) for scale in args.scales.split(',') if scale.strip()}
+    except ValueError:
+        parser.error(f'--scales must be comma-separated integers, got {args.scales!r}')
+    if any(scale < 1 for scale in scales):
+        parser.error('--scales must be positive')
+    args.scales = sorted(scales | {1})
+    return args
+
+def main(argv=None):
+    """Generate sprite sheets and index files"""
+    args = parse_args(argv)
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+    cache = BuildCache(args.cache_dir)
 
-    # LIGHTHOUSE (48x80)
-    lighthouse = create_lighthouse()
-    lighthouse.save(f'{output_dir}/lighthouse.png')
-    print(f"✓ Lighthouse created: {output_dir}/lighthouse.png")
+    print("Generating sprite sheets...")
 
-    print("\n✓ All sprites generated successfully!")
+    plans = [plan_sheet(args.seed, name, *SHEETS[name][1](), png=args.png, scales=args.scales)
+             for name in args.sheets]
+    stale = [plan for plan in plans
+             if not all(cache.is_current(path, plan.key) for path in plan.outputs(output_dir))]
+    drawn = render_missing(cache, stale, args.seed, args.jobs)
+
+    for plan in plans:
+        changed = build_sheet(cache, output_dir, plan)
+        label = SHEETS[plan.name][0]
+        path = plan.outputs(output_dir)[0]
+        print(f"{'✓' if changed else '·'} {label} {'created' if changed else 'unchanged'}: {path}")
+
+    cache.save()
+
+    report = cache.size_report(path for plan in plans for path in plan.pngs(output_dir))
+    if report:
+        print(f"\nPNG sizes (default RGBA → {args.png}):")
+        for path, before, after in report:
+            print(f"  {os.path.basename(path):<20} {before:>8,} → {after:>8,} bytes"
+                  f"  ({(after - before) / before:+.0%})")
+        before, after = sum(r[1] for r in report), sum(r[2] for r in report)
+        print(f"  {'total':<20} {before:>8,} → {after:>8,} bytes  ({(after - before) / before:+.0%})")
+
+    print(f"\n✓ Sprites up to date ({drawn} drawn with {args.jobs} job(s))")
     print(f"  Output directory: {output_dir}/")
 
 if __name__ == '__main__':